@@ -0,0 +1,38 @@
+import pygrank as pg
+from pygrank.core import backend
+from timeit import timeit
+
+backends = ["numpy", "threaded", "sparse_dot_mkl", "pytorch", "tensorflow", "torch_sparse", "dask"]
+repeats = 100000
+graph = next(pg.load_datasets_graph(["graph9"]))
+
+for backend_name in backends:
+    try:
+        pg.load_backend(backend_name)
+    except Exception as e:
+        print(backend_name.ljust(15), "unavailable:", e)
+        continue
+    module = backend._imported_mods[backend_name]
+    signal = pg.to_signal(graph, {"A": 1})
+    x = signal.np
+    M = pg.preprocessor()(graph)
+    dispatched = {
+        "sum": timeit(lambda: pg.sum(x), number=repeats),
+        "dot": timeit(lambda: pg.dot(x, x), number=repeats),
+        "conv": timeit(lambda: pg.conv(x, M), number=repeats),
+        "conv(signal)": timeit(lambda: pg.conv(signal, M), number=repeats),
+    }
+    direct = {
+        "sum": timeit(lambda: module.sum(x), number=repeats),
+        "dot": timeit(lambda: module.dot(x, x), number=repeats),
+        "conv": timeit(lambda: module.conv(x, M.array), number=repeats),
+        "conv(signal)": timeit(lambda: module.conv(x, M.array), number=repeats),
+    }
+    print(
+        backend_name.ljust(15),
+        " ".join(
+            f"{name} {(dispatched[name] - direct[name]) / repeats * 1.0e9:.0f}ns"
+            for name in dispatched
+        ),
+    )
+pg.load_backend("numpy")
@@ -0,0 +1,36 @@
+import pygrank as pg
+from timeit import default_timer as time
+
+datasets = ["citeseer", "eucore", "dblp", "youtube"]
+backends = ["numpy", "threaded", "sparse_dot_mkl"]
+repeats = 5
+
+
+def spmv_time(M, signal):
+    tic = time()
+    for _ in range(repeats):
+        pg.conv(signal, M)
+    return (time() - tic) / repeats
+
+
+for dataset in datasets:
+    graph = next(pg.load_datasets_graph([dataset]))
+    personalization = {node: 1.0 for node in list(graph)[:10]}
+    for backend in backends:
+        with pg.Backend(backend):
+            M = pg.preprocessor(normalization="symmetric")(graph)
+            signal = pg.to_signal(graph, personalization).np
+            signals = pg.combine_cols([signal] * 16)
+            ranker = pg.PageRank(0.9, tol=1.0e-9, max_iters=1000)
+            tic = time()
+            ranker.rank(graph, personalization)
+            print(
+                dataset.ljust(10),
+                backend.ljust(15),
+                "SpMV",
+                f"{spmv_time(M, signal):.5f}",
+                "SpMM(16)",
+                f"{spmv_time(M, signals):.5f}",
+                "PageRank",
+                f"{time() - tic:.5f}",
+            )
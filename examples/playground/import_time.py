@@ -0,0 +1,33 @@
+import subprocess
+import sys
+
+repeats = 5
+statements = {
+    "import": "import pygrank as pg",
+    "to_signal": "import pygrank as pg; pg.to_signal",
+    "PageRank": "import pygrank as pg; pg.PageRank()",
+    "rank": "import pygrank as pg; pg.PageRank().rank(pg.Graph(), {})",
+    "AUC": "import pygrank as pg; pg.AUC({})",
+    "everything": "from pygrank import *",
+}
+heavy = ["networkx", "sklearn", "scipy.optimize", "scipy.stats", "wget"]
+
+for name, statement in statements.items():
+    code = (
+        "from timeit import default_timer as time; tic = time(); "
+        + statement
+        + "; toc = time(); import sys; "
+        + f"print(toc - tic, [mod for mod in {heavy} if mod in sys.modules])"
+    )
+    times = list()
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        ).stdout.splitlines()[-1]
+        times.append(float(output.split(" ", 1)[0]))
+    print(
+        name.ljust(12),
+        f"{min(times) * 1000:.1f}ms",
+        "loads",
+        output.split(" ", 1)[1],
+    )
@@ -1,5 +1,114 @@
-from pygrank.core import *
-from pygrank.measures import *
-from pygrank.algorithms import *
-from pygrank.benchmarks import *
-from pygrank.fastgraph import *
+import importlib as _importlib
+import sys as _sys
+import types as _types
+
+# names of the former star-imports (core, measures, algorithms, benchmarks, fastgraph) by the first subpackage
+# that provides the same object as the last of these imports, so that accessing a name imports only that
+# subpackage while later star-imports still take precedence on name clashes; tests/test_core.py checks this
+# table against the star-imports
+_exports = {
+    "core": """
+        abs Add Adjacency assert_binary backend Backend backend_init backend_name BackendGraph BackendPrimitive
+        call cast combine_cols conv copy degrees diag eigdegree ensure_used_args epsilon exp eye fastgraph
+        filter_out get_backend_preference Graph graph_dropout GraphSignal GraphSignalData GraphSignalGraph
+        hashlib importlib indexing inspect is_array islice Iterable json length List load_backend log
+        mappedgraph max mean MethodHasher min MutableMapping Neg no_signal node_index NodeIndex NodeRanking np
+        numpy obj2id ones Optional os preprocessing preprocessor remove_used_args repeat safe_div safe_inv scipy
+        scipy_sparse_to_backend self_normalize separate_cols set_backend_preference signals SparseGraphSignal
+        specification sum sys to_array to_primitive to_signal to_sparse_matrix to_sparse_signal Tuple typing
+        Union utils uuid
+    """.split(),
+    "measures": """
+        accuracy Accuracy AM auc AUC binary_cross_entropy BinaryCrossEntropy classification
+        clustering_coefficient ClusteringCoefficient collections combination conductance Conductance correlation
+        cos Cos cross_entropy CrossEntropy density Density Disparity divergence dot Dot euclidean Euclidean GM
+        isinf kldivergence KLDivergence l1 L1 l2 L2 l2disparity L2Disparity link_assessment LinkAssessment mabs
+        Mabs mannwhitney_parity MannWhitneyParity max_difference MaxDifference measure Measure
+        MeasureCombination mistreatment Mistreatment mkl_divergence MKLDivergence modularity Modularity msq MSQ
+        msqrt MSQRT multigroup MultiSupervised MultiUnsupervised ndcg NDCG Parity pearson PearsonCorrelation ppv
+        PPV prule pRule random ranking remove_intra_edges rmabs RMabs similarity spearman SpearmanCorrelation
+        split Supervised Time tnr TNR tpr TPR unsupervised Unsupervised utility Utility
+    """.split(),
+    "algorithms": """
+        absorbing absorbing_walks AbsorbingWalks abstract adhoc AdHocFairness AlgorithmSelection
+        arnoldi_iteration autotune biased_kernel BiasedKernel BoostedSeedOversampling Callable closed
+        ClosedFormGraphFilter convergence ConvergenceManager default_tuning_optimization diags dijkstra
+        DijkstraRank fairness FairPersonalizer FairWalk filter filters generic GenericGraphFilter GraphFilter
+        heat_kernel HeatKernel hop_basis hop_tuner HopBasis HopTuner impulse ImpulseGraphFilter krylov2original
+        krylov_base krylov_error_bound krylov_utils lbfgsb LFPR LinearSweep locally_fair Lock lowpass
+        LowPassRecursiveGraphFilter MabsMaintain math measures nelder_mead Normalize optimization optimize
+        Ordinals oversampling pagerank PageRank PageRankClosed parameterized ParameterTuner postprocess
+        Postprocessor pygrank RankOrderConvergenceManager recursive RecursiveGraphFilter SeedOversampling
+        selection SelfClearDict SeparateNormalization Sequential signature subgraph Subgraph Supergraph Sweep
+        symmetric SymmetricAbsorbingRandomWalks Tautology ThreadPoolExecutor Threshold time Top Transformer
+        Tuner tuning warnings
+    """.split(),
+    "benchmarks": """
+        Any benchmark benchmark_average benchmark_dict benchmark_print benchmark_print_line benchmark_ranks
+        benchmark_scores comparables create_demo_filters create_many_filters create_many_variation_types
+        create_variations dataset_processors datasets download download_dataset downloadable_datasets
+        downloadable_small_datasets gnn gnn_accuracy gnn_train gzip import_snap_format_dataset io isclass
+        load_datasets_all_communities load_datasets_graph load_datasets_multiple_communities
+        load_datasets_one_community load_feature_dataset load_one loader nx preprocess printers shutil
+        supervised tarfile
+    """.split(),
+    "fastgraph": """
+        AdjacencyWrapper coo_matrix csr_matrix MappedGraph Mapping snap_pairs_to_mapped wrapgraph
+    """.split(),
+}
+_subpackages = ["core", "measures", "algorithms", "benchmarks", "fastgraph"]
+_owners = {
+    name: subpackage for subpackage in _subpackages for name in _exports[subpackage]
+}
+_resolved = set()
+
+
+def _import(subpackage):
+    return _importlib.import_module("pygrank." + subpackage)
+
+
+def _importing():
+    for module_name, module in list(_sys.modules.items()):
+        if module_name.startswith("pygrank.") and getattr(
+            getattr(module, "__spec__", None), "_initializing", False
+        ):
+            return True
+    return False
+
+
+class _Package(_types.ModuleType):
+    def __setattr__(self, name, value):
+        # importing binds subpackages and the backend operations loaded on import as package attributes, which
+        # the star-imports used to override, but later load_backend calls should still replace operations
+        if getattr(value, "__name__", None) == "pygrank." + name:
+            return
+        if (name in _owners or name in _subpackages) and _importing():
+            return
+        super().__setattr__(name, value)
+
+
+def _resolve(name):
+    if name in _owners:
+        return getattr(_import(_owners[name]), name)
+    if name in _subpackages:
+        return _import(name)
+    raise AttributeError("module 'pygrank' has no attribute '" + name + "'")
+
+
+def __getattr__(name):
+    if name == "__all__":
+        globals()["__all__"] = sorted(set(_owners) | set(_subpackages))
+        return globals()["__all__"]
+    if name.startswith("__"):
+        raise AttributeError("module 'pygrank' has no attribute '" + name + "'")
+    value = _resolve(name)
+    globals()[name] = value
+    _resolved.add(name)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__getattr__("__all__")))
+
+
+_sys.modules[__name__].__class__ = _Package
@@ -5,6 +5,7 @@ from pygrank.measures import Supervised, Cos, AUC
 from pygrank.measures.utils import split
 from typing import Callable, Optional
 from pygrank.algorithms.filters.krylov_utils import arnoldi_iteration
+from pygrank.algorithms.filters.hop_basis import HopBasis
 from pygrank.algorithms.autotune.tuning import Tuner
 from pygrank.algorithms.autotune.parameterized import SelfClearDict
 from pygrank.algorithms.autotune.optimization import optimize
@@ -105,11 +106,14 @@ class HopTuner(Tuner):
         ]
 
         if self.basis == "krylov":
+            hop_bases = [
+                HopBasis(M, p, len(measure_values) - 1) for p in [training1, training2]
+            ]
             for i in range(len(measure_values)):
                 measure_values[i] = [
-                    measure(p) for p, measure in zip(propagated, measures)
+                    measure(hop_basis.basis[:, i])
+                    for hop_basis, measure in zip(hop_bases, measures)
                 ]
-                propagated = [backend.conv(p, M) for p in propagated]
         else:
             basis = [
                 arnoldi_iteration(M, p, len(measure_values))[0] for p in propagated
@@ -182,7 +186,11 @@ class HopTuner(Tuner):
             if div != 0:
                 best_parameters /= div
             measure = self.tunable_offset(validation, training)
-            base = basis[0] if self.basis != "krylov" else None
+            base = (
+                basis[0]
+                if self.basis != "krylov"
+                else self._hop_basis(training, len(best_parameters))
+            )
             best_offset = optimize(
                 lambda params: -measure.best_direction()
                 * measure(
@@ -203,6 +211,11 @@ class HopTuner(Tuner):
                 parameter_tol=1,
                 partitions=5,
                 divide_range=1.1,
+                loss_batch=(
+                    self._offset_loss_batch(measure, best_parameters, base)
+                    if isinstance(base, HopBasis)
+                    else None
+                ),
             )
             # best_parameters += best_offset[0]
             best_parameters = [
@@ -240,4 +253,36 @@ class HopTuner(Tuner):
             for i in range(backend.length(params)):
                 ret = ret + params[i] * base[:, i]
             return to_signal(personalization, ret)
+        if base is not None:
+            return base.rank(params)
         return self.ranker_generator(params).rank(personalization, *args, **kwargs)
+
+    def _offset_loss_batch(self, measure: Supervised, parameters, base: HopBasis):
+        # the ranker's convergence manager determines which hops its outcomes actually use
+        convergence = self.ranker_generator(list(parameters)).convergence
+
+        def loss_batch(candidates):
+            candidate_weights = list()
+            for params in candidates:
+                weights = [float(parameter) + params[0] for parameter in parameters]
+                div = sum(abs(weight) for weight in weights)
+                if div != 0:
+                    weights = [weight / div for weight in weights]
+                candidate_weights.append(weights)
+            ranks = base.rank_many(candidate_weights, convergence)
+            return [
+                -measure.best_direction()
+                * measure(to_signal(base.personalization, ranks[:, col]))
+                for col in range(len(candidate_weights))
+            ]
+
+        return loss_batch
+
+    def _hop_basis(self, personalization: GraphSignal, num_params: int):
+        ranker = self.ranker_generator([0] * num_params)
+        if (
+            not callable(getattr(ranker, "hop_basis", None))
+            or not ranker._supports_hop_basis()
+        ):
+            return None
+        return ranker.hop_basis(personalization=personalization, hops=num_params - 1)
@@ -33,8 +33,11 @@ def nelder_mead(
     deviation_tol=1.0e-6,
     parameter_tol: float = float("inf"),
     verbose=True,
+    loss_batch=None,
     **kwargs,
 ):
+    if loss is None:
+        loss = lambda params: float(loss_batch([list(params)])[0])
     if min_vals is None:
         min_vals = [0] * len(max_vals)
     if weights is None:
@@ -65,6 +68,7 @@ def lbfgsb(
     weights=None,
     deviation_tol=1.0e-6,
     verbose=True,
+    loss_batch=None,
     **kwargs,
 ):
     if min_vals is None:
@@ -76,6 +80,26 @@ def lbfgsb(
     import scipy.optimize
     import scipy.sparse
 
+    jac = None
+    if loss_batch is not None:
+        # a single batch holds the parameters and all forward differences of the gradient
+        def loss(params):
+            params = [float(param) for param in params]
+            steps = [
+                1.0e-8 if param + 1.0e-8 <= max_val else -1.0e-8
+                for param, max_val in zip(params, max_vals)
+            ]
+            candidates = [params] + [
+                __add(params, i, step, float("inf"), -float("inf"))
+                for i, step in enumerate(steps)
+            ]
+            losses = [float(value) for value in loss_batch(candidates)]
+            gradient = [
+                (value - losses[0]) / step for value, step in zip(losses[1:], steps)
+            ]
+            return losses[0], gradient
+
+        jac = True
     if verbose:
         utils.log("Optimizing with LBFGSB")
     ret = scipy.optimize.minimize(
@@ -83,6 +107,7 @@ def lbfgsb(
         bounds=[(min_val, max_val) for min_val, max_val in zip(min_vals, max_vals)],
         method="L-BFGS-B",
         x0=weights,
+        jac=jac,
         options={"ftol": deviation_tol},
     )
     if verbose:
@@ -106,6 +131,8 @@ def optimize(
     weights=None,
     verbose: bool = True,
     validation_loss=None,
+    executor=None,
+    loss_batch=None,
 ):
     """
     Implements a coordinate descent algorithm for optimizing the argument vector of the given loss function.
@@ -143,6 +170,14 @@ def optimize(
             solution search around these - hence the usefulness of *depth* as an iterative scheme. If None (default),
             the center of the search range (max_vals+min_vals)/2 is used as a starting estimation.
         verbose: Options. If True, optimization outputs its intermediate steps. Default is False.
+        executor: Optional. A `concurrent.futures.Executor` with which to concurrently compute the losses of all
+            candidate parameters of each coordinate descent step. Thread pools share the graph between their
+            workers and speed up tuning because sparse matrix multiplications release the GIL, whereas process
+            pools require picklable loss functions and hence cannot be used by tuners, whose losses are closures.
+            If None (default), candidates are evaluated sequentially.
+        loss_batch: Optional. A vectorized version of the loss that takes a list of parameter lists and returns
+            the respective list of losses. If provided, it is called once to evaluate all candidate parameters of
+            each coordinate descent step instead of the loss (and the executor). Default is None.
     Example:
         >>> import pygrank as pg
         >>> p = pg.optimize(loss=lambda p: (1.5-p[0]+p[0]*p[1])**2+(2.25-p[0]+p[0]*p[1]**2)**2+(2.625-p[0]+p[0]*p[1]**3)**2, max_vals=[4.5, 4.5], min_vals=[-4.5, -4.5])
@@ -231,7 +266,20 @@ def optimize(
             ]
         else:
             raise Exception("Invalid partition strategy: either split or step expected")
-        loss_pairs = [(w, loss(w)) for w in candidate_weights if w is not None]
+        candidate_weights = [w for w in candidate_weights if w is not None]
+        if loss_batch is not None:
+            loss_pairs = list(
+                zip(
+                    candidate_weights,
+                    [float(value) for value in loss_batch(candidate_weights)],
+                )
+            )
+        elif executor is None:
+            loss_pairs = [(w, loss(w)) for w in candidate_weights]
+        else:
+            loss_pairs = list(
+                zip(candidate_weights, executor.map(loss, candidate_weights))
+            )
         evals += len(loss_pairs)
         weights, weights_loss = min(loss_pairs, key=lambda pair: pair[1])
         prev_best_loss = best_loss
@@ -283,5 +331,7 @@ def optimize(
             weights,
             verbose,
             validation_loss,
+            executor,
+            loss_batch,
         )
     return weights
@@ -1,6 +1,9 @@
 from pygrank.algorithms.autotune.tuning import Tuner
 from pygrank.algorithms.autotune.optimization import nelder_mead, optimize, lbfgsb
 from typing import Callable, Optional, Union, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from inspect import signature
 from pygrank.core import (
     GraphSignal,
     to_signal,
@@ -12,7 +15,6 @@ from pygrank.core import (
 from pygrank.core import preprocessor, backend
 from pygrank.measures import Measure, AUC, split
 
-
 default_tuning_optimization = {
     "max_vals": [1] + [1] * 40,
     "min_vals": [1] + [0] * 40,
@@ -37,9 +39,23 @@ class SelfClearDict(dict):
     different personalization signals, use a simple dictionary instead.
     """
 
+    def __init__(self, max_entries: int = 1):
+        """
+        Args:
+            max_entries: Optional. The number of most recently assigned entries to keep. Default is 1.
+                Set this to the number of personalization signals processed concurrently, for example by
+                tuning cross-validation folds on different threads, so that they do not clear each other's entries.
+        """
+        super().__init__()
+        self.max_entries = max_entries
+        self._lock = Lock()
+
     def __setitem__(self, key, value):
-        self.clear()
-        super().__setitem__(key, value)
+        with self._lock:
+            self.pop(key, None)
+            while len(self) >= self.max_entries:
+                del self[next(iter(self))]
+            super().__setitem__(key, value)
 
 
 class ParameterTuner(Tuner):
@@ -57,6 +73,8 @@ class ParameterTuner(Tuner):
         combined_prediction: bool = True,
         tuning_backend: str = None,
         optimizer=optimize,
+        hop_basis: bool = False,
+        executor=None,
         **kwargs,
     ):
         """
@@ -83,6 +101,15 @@ class ParameterTuner(Tuner):
             optimizer: The optimizer of choice to use. Default is `pygrank.algorithms.autotune.optimization.optimize`,
                 but other methods can be used such as Default is `pygrank.algorithms.autotune.optimization.evolutionary_optimizer`.
                 Parameters to the optimizer need to be passed via kwargs.
+            hop_basis: If True, the default ranker_generator's graph filter is not rerun for each candidate
+                parameter. Instead, the hops of each training personalization are computed once by a
+                `pygrank.HopBasis` and candidates are evaluated with dense products, which costs O(nodes) instead of
+                O(edges) per hop. Outcomes match graph filters up to their convergence tolerance. Optimizers with a
+                `loss_batch` argument then rank all candidates of each step with one dense product. Default is False.
+            executor: Optional. A `concurrent.futures.ThreadPoolExecutor`, whose workers share the preprocessed graph,
+                passed to the optimizer to evaluate candidate parameters concurrently. Other executors, such as process
+                pools, raise an exception because tuning losses cannot be pickled. If an executor is provided,
+                cross-validation folds also run concurrently. If None (default), tuning runs sequentially.
             kwargs: Additional arguments can be passed to pygrank.algorithms.autotune.optimization.optimize. Otherwise,
                 the respective arguments are retrieved from the variable *default_tuning_optimization*, which is crafted
                 for fast convergence of the default ranker_generator. Arguments passable to the ranker_generator are
@@ -112,15 +139,31 @@ class ParameterTuner(Tuner):
             ):
                 kwargs["preprocessor"] = preprocessor(assume_immutability=True)
             if "optimization_dict" not in kwargs:
-                kwargs["optimization_dict"] = SelfClearDict()
+                concurrent_signals = 1
+                if executor is not None:
+                    # concurrent folds keep the convolutions of all their training signals
+                    concurrent_signals = cross_validate * (
+                        len(fraction_of_training)
+                        if isinstance(fraction_of_training, Iterable)
+                        else 1
+                    )
+                kwargs["optimization_dict"] = SelfClearDict(concurrent_signals)
 
             def ranker_generator(params):
                 return Normalize(
                     GenericGraphFilter(params, **remove_used_args(optimize, kwargs))
                 )
 
+        elif hop_basis:
+            raise Exception(
+                "Hop bases can only be used by the default ranker_generator"
+            )
         # else:
         #    ensure_used_args(kwargs, [optimizer]) # TODO: find how to do this
+        if executor is not None and not isinstance(executor, ThreadPoolExecutor):
+            raise Exception(
+                "Tuning losses cannot be pickled, so only ThreadPoolExecutor executors are supported"
+            )
         self.ranker_generator = ranker_generator
         self.measure = measure
         self.fraction_of_training = fraction_of_training
@@ -132,18 +175,50 @@ class ParameterTuner(Tuner):
         self.tuning_backend = tuning_backend
         self.cross_validate = cross_validate
         self.optimizer = optimizer
+        self.hop_basis = hop_basis
+        self.executor = executor
+        if executor is not None:
+            self.optimize_args["executor"] = executor
 
     def _run(self, personalization: GraphSignal, params: list, *args, **kwargs):
         return self.ranker_generator(params).rank(personalization, *args, **kwargs)
 
+    def _preprocess(self, graph):
+        preprocessor = getattr(
+            self.ranker_generator(
+                [
+                    (min_val + max_val) / 2
+                    for min_val, max_val in zip(
+                        self.optimize_args["min_vals"], self.optimize_args["max_vals"]
+                    )
+                ]
+            ),
+            "preprocessor",
+            None,
+        )
+        if callable(preprocessor):
+            preprocessor(graph)
+
+    def _hop_bases(self, personalizations: list) -> list:
+        graph_filter = self.ranker_generator([]).ranker
+        if not callable(getattr(graph_filter, "hop_basis", None)):
+            raise Exception("Hop bases require closed form graph filters")
+        hops = len(self.optimize_args["max_vals"]) - 1
+        return [
+            graph_filter.hop_basis(personalization=personalization, hops=hops)
+            for personalization in personalizations
+        ]
+
     def _tune(self, graph=None, personalization=None, *args, **kwargs):
         previous_backend = backend.backend_name()
         personalization = to_signal(graph, personalization)
         if self.tuning_backend is not None and self.tuning_backend != previous_backend:
             backend.load_backend(self.tuning_backend)
         backend_personalization = to_signal(graph, backend.to_array(personalization.np))
-        total_params = list()
-        for seed0 in range(self.cross_validate):
+        if self.executor is not None:
+            self._preprocess(backend_personalization.graph)
+
+        def tune_fold(seed0):
             fraction_of_training = (
                 self.fraction_of_training
                 if isinstance(self.fraction_of_training, Iterable)
@@ -151,40 +226,85 @@ class ParameterTuner(Tuner):
             )
             # fraction_of_training = [random.choice(fraction_of_training)]
             internal_training_list = list()
-            validation_list = list()
+            measure_list = list()
             for seed, fraction in enumerate(fraction_of_training):
                 training, validation = split(
                     backend_personalization, fraction, seed0 + seed
                 )
                 internal_training = training
                 internal_training_list.append(internal_training)
-                validation_list.append(validation)
+                # one measure per split lets candidate evaluations reuse its cached known scores
+                measure_list.append(
+                    self.measure(
+                        validation,
+                        internal_training if internal_training != validation else None,
+                    )
+                )
+            hop_bases = (
+                self._hop_bases(internal_training_list)
+                if self.hop_basis
+                else [None] * len(internal_training_list)
+            )
 
             def eval(params):
                 val = 0
-                for internal_training, validation in zip(
-                    internal_training_list, validation_list
+                for internal_training, measure, hop_basis in zip(
+                    internal_training_list, measure_list, hop_bases
                 ):
                     """import pygrank as pg
 
                     scores = self._run(backend_personalization, params, *args, **kwargs)
                     internal_training = pg.Undersample(int(backend.sum(internal_training)))(scores*backend_personalization)
                     validation = backend_personalization - internal_training"""
-                    measure = self.measure(
-                        validation,
-                        internal_training if internal_training != validation else None,
-                    )
                     val = val - measure.best_direction() * measure.evaluate(
                         self._run(internal_training, params, *args, **kwargs)
+                        if hop_basis is None
+                        else self.ranker_generator(params).transform(
+                            hop_basis.rank(params)
+                        )
                     )
                 return val / len(internal_training_list)
 
-            best_params = self.optimizer(eval, **self.optimize_args)
+            def eval_batch(candidates):
+                vals = [0.0] * len(candidates)
+                for internal_training, measure, hop_basis in zip(
+                    internal_training_list, measure_list, hop_bases
+                ):
+                    ranks = hop_basis.rank_many(candidates)
+                    evaluations = measure.evaluate_many(
+                        [
+                            self.ranker_generator(params).transform(
+                                to_signal(internal_training, ranks[:, col])
+                            )
+                            for col, params in enumerate(candidates)
+                        ]
+                    )
+                    for col, evaluation in enumerate(evaluations):
+                        vals[col] -= measure.best_direction() * evaluation
+                return [val / len(internal_training_list) for val in vals]
+
+            if self.hop_basis and "loss_batch" in signature(self.optimizer).parameters:
+                best_params = self.optimizer(
+                    eval, loss_batch=eval_batch, **self.optimize_args
+                )
+            else:
+                best_params = self.optimizer(eval, **self.optimize_args)
             """import cma
             es = cma.CMAEvolutionStrategy([0.5 for _ in range(len(self.optimize_args["max_vals"]))], 1./12**0.5)
             es.optimize(eval, verb_disp=False)
             best_params = es.result.xbest"""
-            total_params.append(best_params)
+            return best_params, internal_training
+
+        if self.executor is not None and self.cross_validate > 1:
+            # folds only wait for candidate evaluations, so they run on their own threads
+            with ThreadPoolExecutor(max_workers=self.cross_validate) as fold_executor:
+                fold_results = list(
+                    fold_executor.map(tune_fold, range(self.cross_validate))
+                )
+        else:
+            fold_results = [tune_fold(seed0) for seed0 in range(self.cross_validate)]
+        total_params = [fold_params for fold_params, _ in fold_results]
+        best_params, internal_training = fold_results[-1]
         best_params = [0 for _ in best_params]
         best_squares = [0 for _ in best_params]
         best_means = [0 for _ in best_params]
@@ -4,7 +4,9 @@ from pygrank.measures.utils import split
 from typing import Callable, Iterable, Union
 from pygrank.core import backend
 from pygrank.algorithms.autotune.tuning import Tuner
+from pygrank.algorithms.convergence import ConvergenceManager
 import numpy as np
+import math
 
 
 class AlgorithmSelection(Tuner):
@@ -18,6 +20,8 @@ class AlgorithmSelection(Tuner):
         fraction_of_training: Union[Iterable[float], float] = 0.9,
         combined_prediction: bool = True,
         tuning_backend: str = None,
+        halving_iters: int = None,
+        halving_fraction: float = 0.5,
     ):
         """
         Instantiates the tuning mechanism.
@@ -36,6 +40,15 @@ class AlgorithmSelection(Tuner):
                 training-validation split is used.
             tuning_backend: Specifically switches to a designated backend for the tuning process before restoring
                 the previous one to perform the actual ranking. If None (default), this functionality is ignored.
+            halving_iters: Optional. If provided, selection follows a successive halving scheme, where all rankers are
+                first evaluated while their convergence managers are limited to this number of iterations, and only
+                the best *halving_fraction* of them are promoted to the next round, whose iteration limit is divided
+                by *halving_fraction*. Rounds stop once one ranker remains, and any remaining rankers are
+                then evaluated until convergence. If the limit is large enough for all rankers to converge,
+                the selected ranker is the same as without halving. If None (default), all rankers are
+                evaluated until convergence.
+            halving_fraction: Optional. The fraction of rankers promoted after each round of successive halving.
+                Default is 0.5.
 
         Example:
             >>> import pygrank as pg
@@ -49,7 +62,22 @@ class AlgorithmSelection(Tuner):
             >>> algorithms = pg.create_variations(pg.create_many_filters(tol=1.E-9), pg.create_many_variation_types())
             >>> tuner = pg.AlgorithmSelection(algorithms.values(), measure=pg.AUC, deviation_tol=0.01)
             >>> ranks = tuner.rank(graph, personalization)
+
+        Example (with successive halving that starts from 10 iterations):
+            >>> import pygrank as pg
+            >>> graph, personalization = ...
+            >>> algorithms = pg.create_variations(pg.create_many_filters(tol=1.E-9), pg.create_many_variation_types())
+            >>> tuner = pg.AlgorithmSelection(algorithms.values(), measure=pg.AUC, halving_iters=10)
+            >>> ranks = tuner.rank(graph, personalization)
         """
+        if halving_iters is not None and halving_iters < 1:
+            raise Exception(
+                "Successive halving should start from at least one iteration"
+            )
+        if not 0 < halving_fraction < 1:
+            raise Exception(
+                "The fraction of promoted rankers should lie in the range (0,1)"
+            )
         if rankers is None:
             from pygrank.benchmarks import create_demo_filters
 
@@ -59,6 +87,35 @@ class AlgorithmSelection(Tuner):
         self.fraction_of_training = fraction_of_training
         self.combined_prediction = combined_prediction
         self.tuning_backend = tuning_backend
+        self.halving_iters = halving_iters
+        self.halving_fraction = halving_fraction
+
+    def _evaluate(self, ranker, splits, max_iters=None, *args, **kwargs):
+        convergence = getattr(ranker, "convergence", None)
+        if (
+            max_iters is None
+            or not isinstance(convergence, ConvergenceManager)
+            or convergence.max_iters <= max_iters
+        ):
+            max_iters = None
+        else:
+            prev_max_iters = convergence.max_iters
+            prev_iter_exception = convergence.iter_exception
+            convergence.max_iters = max_iters
+            convergence.iter_exception = None
+        try:
+            values = list()
+            for training, validation in splits:
+                measure = self.measure(validation, training)
+                values.append(
+                    measure.best_direction()
+                    * measure.evaluate(ranker.rank(training, *args, **kwargs))
+                )
+        finally:
+            if max_iters is not None:
+                convergence.max_iters = prev_max_iters
+                convergence.iter_exception = prev_iter_exception
+        return np.min(values)
 
     def _tune(self, graph=None, personalization=None, *args, **kwargs):
         previous_backend = backend.backend_name()
@@ -75,21 +132,33 @@ class AlgorithmSelection(Tuner):
             if isinstance(self.fraction_of_training, Iterable)
             else [self.fraction_of_training]
         )
-        for ranker in self.rankers:
-            values = list()
-            for seed, fraction in enumerate(fraction_of_training):
-                training, validation = split(
-                    backend_personalization, fraction, seed=seed
-                )
-                measure = self.measure(validation, training)
-                values.append(
-                    measure.best_direction()
-                    * measure.evaluate(ranker.rank(training, *args, **kwargs))
-                )
-            value = np.min(values)
-            if value > best_value:
-                best_value = value
-                best_ranker = ranker
+        splits = [
+            split(backend_personalization, fraction, seed=seed)
+            for seed, fraction in enumerate(fraction_of_training)
+        ]
+        training = splits[-1][0]
+        rankers = list(self.rankers)
+        max_iters = self.halving_iters
+        while max_iters is not None and len(rankers) > 1:
+            values = [
+                self._evaluate(ranker, splits, max_iters, *args, **kwargs)
+                for ranker in rankers
+            ]
+            promoted = max(1, int(math.ceil(len(rankers) * self.halving_fraction)))
+            if promoted == len(rankers):
+                break
+            # stable sorting keeps the first of equally good rankers, as in full evaluation
+            order = sorted(range(len(rankers)), key=lambda i: -values[i])[:promoted]
+            rankers = [rankers[i] for i in sorted(order)]
+            max_iters = int(math.ceil(max_iters / self.halving_fraction))
+        if self.halving_iters is not None and len(rankers) == 1:
+            best_ranker = rankers[0]
+        else:
+            for ranker in rankers:
+                value = self._evaluate(ranker, splits, None, *args, **kwargs)
+                if value > best_value:
+                    best_value = value
+                    best_ranker = ranker
         if self.tuning_backend is not None and self.tuning_backend != previous_backend:
             backend.load_backend(previous_backend)
             # TODO: make training back-propagate through tensorflow for combined_prediction==False
@@ -1,5 +1,5 @@
+import math
 import numpy as np
-from scipy.stats import norm
 from timeit import default_timer as time
 from pygrank.measures import Supervised, Mabs
 from pygrank.core import backend, BackendPrimitive
@@ -56,12 +56,19 @@ class ConvergenceManager:
         self.max_iters = max_iters
         self.iteration = 0
         self.last_ranks = None
+        self.active_columns = None
+        self.accelerations = 0
+        self.saved_iterations = 0
+        self.saved_spmv_calls = 0
+        self._acceleration_start = None
+        self._contraction = None
+        self._spmv_per_iteration = 1
         self._start_time = None
         self.elapsed_time = None
         self.iter_exception = iter_exception
         self.end_modulo = end_modulo
 
-    def start(self, restart_timer: bool = True):
+    def start(self, restart_timer: bool = True, active_columns: list = None):
         """
         Starts the convergence manager
 
@@ -69,20 +76,69 @@ class ConvergenceManager:
             restart_timer: Optional. If True (default) timing information, such as the number of iterations and wall
                 clock time measurement, is reset. Otherwise, this only ensures that the convergence manager
                 performs one iteration before starting comparing values with previous ones.
+            active_columns: Optional. The columns tracked by `has_converged_columns`. If None (default),
+                all columns of the first matrix checked for convergence are tracked.
         """
         if restart_timer or self._start_time is None:
             self._start_time = time()
             self.elapsed_time = None
             self.iteration = 0
         self.last_ranks = None
+        self.active_columns = None if active_columns is None else list(active_columns)
+        self.accelerations = 0
+        self.saved_iterations = 0
+        self.saved_spmv_calls = 0
+        self._acceleration_start = None
+        self._contraction = None
 
-    def has_converged(self, new_ranks: BackendPrimitive) -> bool:
+    def record_acceleration(
+        self, contraction: float, step_error: float, spmv_per_iteration: int = 1
+    ):
+        """
+        Records that the managed iterations have been accelerated, for example through extrapolation.
+        The step error of the first call and the latest contraction estimate are used to estimate how many
+        iterations the unaccelerated scheme would need to converge. This is compared to the actual number of
+        iterations to calculate the `saved_iterations` and `saved_spmv_calls` attributes once convergence
+        is reached.
+
+        Args:
+            contraction: The estimated factor by which the unaccelerated scheme shrinks its error at each iteration.
+            step_error: The error between the two latest unaccelerated iterations.
+            spmv_per_iteration: Optional. The number of sparse matrix-vector multiplications of each iteration.
+                Default is 1.
+        """
+        self.accelerations += 1
+        self._spmv_per_iteration = spmv_per_iteration
+        if self._acceleration_start is None and step_error > 0:
+            self._acceleration_start = (self.iteration, step_error)
+        if 0 < contraction < 1:
+            self._contraction = contraction
+
+    def _record_savings(self):
+        if self._acceleration_start is None or self._contraction is None:
+            return
+        iteration, step_error = self._acceleration_start
+        tol = (
+            backend.epsilon() if self.tol is None else max(self.tol, backend.epsilon())
+        )
+        predicted_iterations = iteration + max(
+            0.0, math.log(tol / step_error) / math.log(self._contraction)
+        )
+        self.saved_iterations = max(
+            0, int(min(predicted_iterations, self.max_iters) - self.iteration)
+        )
+        self.saved_spmv_calls = self.saved_iterations * self._spmv_per_iteration
+
+    def has_converged(self, new_ranks: BackendPrimitive, error: float = None) -> bool:
         """
         Checks whether convergence has been achieved by comparing this iteration's backend array with the
         previous iteration's.
 
         Args:
             new_ranks: The iteration's backend array.
+            error: Optional. The error between the iteration's and the previous iteration's backend arrays if it
+                has already been computed for the manager's *error_type*, for example by fused iteration kernels.
+                Default is None, which computes the error.
         """
         self.iteration += 1
         if self.iteration >= self.max_iters:
@@ -95,24 +151,68 @@ class ConvergenceManager:
         converged = (
             False
             if self.last_ranks is None
-            else self._has_converged(self.last_ranks, new_ranks)
+            else self._has_converged(self.last_ranks, new_ranks, error)
         )
         self.last_ranks = new_ranks
         self.elapsed_time = time() - self._start_time
+        if converged:
+            self._record_savings()
         return converged
 
+    def has_converged_columns(self, new_ranks: BackendPrimitive) -> bool:
+        """
+        Checks whether convergence has been achieved for each column of a backend matrix whose columns
+        are ranked simultaneously. Columns that converge are removed from the `active_columns` list,
+        which graph filters use to stop updating them.
+
+        Args:
+            new_ranks: The iteration's backend matrix, with one graph signal per column.
+        Returns:
+            True if all columns have converged.
+        """
+        if self.active_columns is None:
+            self.active_columns = list(range(new_ranks.shape[1]))
+        self.iteration += 1
+        if self.iteration >= self.max_iters:
+            if self.error_type == "iters" or self.iter_exception is None:
+                self.elapsed_time = time() - self._start_time
+                return True
+            raise self.iter_exception(
+                "Could not converge within " + str(self.max_iters) + " iterations"
+            )
+        if self.last_ranks is not None:
+            self.active_columns = [
+                col
+                for col in self.active_columns
+                if not self._has_converged(self.last_ranks[:, col], new_ranks[:, col])
+            ]
+        self.last_ranks = backend.copy(new_ranks)
+        self.elapsed_time = time() - self._start_time
+        return len(self.active_columns) == 0
+
     def _has_converged(
-        self, prev_ranks: BackendPrimitive, ranks: BackendPrimitive
+        self, prev_ranks: BackendPrimitive, ranks: BackendPrimitive, error=None
     ) -> bool:
         if self.error_type == "iters":
             return False
         if self.iteration % self.end_modulo != 0:
             return False
-        return self.error_type(prev_ranks)(ranks) <= (
-            0 if self.tol is None else max(self.tol, backend.epsilon())
-        )
+        if error is None:
+            error = self.error_type(prev_ranks)(ranks)
+        return error <= (0 if self.tol is None else max(self.tol, backend.epsilon()))
 
     def __str__(self):
+        if self.accelerations:
+            return (
+                str(self.iteration)
+                + " iterations ("
+                + str(self.elapsed_time)
+                + " sec, "
+                + str(self.saved_iterations)
+                + " iterations and "
+                + str(self.saved_spmv_calls)
+                + " SpMV calls saved by acceleration)"
+            )
         return str(self.iteration) + " iterations (" + str(self.elapsed_time) + " sec)"
 
 
@@ -155,6 +255,8 @@ class RankOrderConvergenceManager:
 
     def needed_fraction_of_random_walks(self, ranks: BackendPrimitive) -> float:
         if self.criterion == "rank_gap":
+            from scipy.stats import norm
+
             a = [rank for rank in ranks]
             order = np.argsort(a, kind="quicksort")
             gaps = [
@@ -1,3 +1,4 @@
 from pygrank.algorithms.filters.krylov_utils import *
+from pygrank.algorithms.filters.hop_basis import *
 from pygrank.algorithms.filters.abstract import *
 from pygrank.algorithms.filters.adhoc import *
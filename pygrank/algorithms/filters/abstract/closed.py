@@ -1,6 +1,9 @@
 from pygrank.algorithms.filters.abstract.filter import GraphFilter
 from pygrank.core import (
     GraphSignal,
+    GraphSignalGraph,
+    GraphSignalData,
+    to_signal,
 )
 from pygrank.core.utils import obj2id
 from pygrank.core import backend
@@ -9,6 +12,8 @@ from pygrank.algorithms.filters.krylov_utils import (
     krylov2original,
     krylov_error_bound,
 )
+from pygrank.algorithms.filters.hop_basis import HopBasis
+from pygrank.algorithms.postprocess import Tautology
 
 
 class ClosedFormGraphFilter(GraphFilter):
@@ -104,9 +109,12 @@ class ClosedFormGraphFilter(GraphFilter):
     def _prepare(self, personalization: GraphSignal):
         if self.optimization_dict is not None:
             personalization_id = obj2id(personalization)
-            if personalization_id not in self.optimization_dict:
-                self.optimization_dict[personalization_id] = dict()
-            self.__active_dict = self.optimization_dict[personalization_id]
+            active_dict = self.optimization_dict.get(personalization_id, None)
+            if active_dict is None:
+                # not looked up again, as concurrent tuning threads may clear SelfClearDict entries
+                active_dict = dict()
+                self.optimization_dict[personalization_id] = active_dict
+            self.__active_dict = active_dict
         else:
             self.__active_dict = None
 
@@ -152,6 +160,81 @@ class ClosedFormGraphFilter(GraphFilter):
         del self.coefficient
         del self.__active_dict
 
+    def _batchable(self):
+        return self.krylov_dims is None
+
+    def _supports_hop_basis(self):
+        return (
+            self.coefficient_type == "taylor"
+            and self.krylov_dims is None
+            and self.preserve_norm
+            and isinstance(self.personalization_transform, Tautology)
+            and self.personalization_transform.ranker is None
+        )
+
+    def hop_basis(
+        self,
+        graph: GraphSignalGraph = None,
+        personalization: GraphSignalData = None,
+        hops: int = 10,
+        dtype=None,
+    ) -> HopBasis:
+        """
+        Computes the hops of a personalization on this filter's preprocessed graph once, so that
+        the outcomes of Taylor coefficients can be evaluated without new graph convolutions.
+
+        Args:
+            graph: The graph on which to propagate. Can be omitted if the personalization is a graph signal.
+            personalization: The graph signal data to propagate.
+            hops: Optional. The maximum number of hops. Default is 10.
+            dtype: Optional. The numpy data type in which to store hops. Default is None.
+        Returns:
+            A `pygrank.HopBasis` instance.
+
+        Example:
+            >>> import pygrank as pg
+            >>> graph, personalization = ...
+            >>> basis = pg.GenericGraphFilter().hop_basis(graph, personalization, hops=10)
+            >>> ranks = basis.rank([0.9] * 10)
+        """
+        if not self._supports_hop_basis():
+            raise Exception(
+                "Hop bases require Taylor coefficients in the node space without personalization transforms"
+            )
+        personalization = to_signal(graph, personalization)
+        M = self.preprocessor(
+            self._prepare_graph(personalization.graph, personalization)
+        )
+        return HopBasis(M, personalization, hops, dtype)
+
+    def _start_many(self, M, personalizations, ranks, *args, **kwargs):
+        self.coefficient = None
+        if self.coefficient_type == "chebyshev":
+            self.prev_term = personalizations * 0
+        self.ranks_power = backend.copy(personalizations)
+        return personalizations * 0
+
+    def _step_many(self, M, personalizations, ranks, columns, *args, **kwargs):
+        self.coefficient = self._coefficient(self.coefficient)
+        if self.coefficient_type == "chebyshev":
+            prev_terms = self.prev_term
+            self.prev_term = prev_terms[:, columns]
+        active_ranks, active_power = self._recursion(
+            ranks[:, columns], self.ranks_power[:, columns], self.coefficient
+        )
+        if self.coefficient_type == "chebyshev":
+            prev_terms[:, columns] = self.prev_term
+            self.prev_term = prev_terms
+        ranks[:, columns] = active_ranks
+        self.ranks_power[:, columns] = backend.conv(active_power, M)
+        return ranks
+
+    def _end_many(self, M, personalizations, ranks, *args, **kwargs):
+        del self.ranks_power
+        if self.coefficient_type == "chebyshev":
+            del self.prev_term
+        del self.coefficient
+
     def _coefficient(self, previous_coefficient: float) -> float:
         raise Exception(
             "Use a derived class of ClosedFormGraphFilter that implements the _coefficient method"
@@ -4,6 +4,7 @@ from pygrank.core import (
     GraphSignalGraph,
     GraphSignalData,
     GraphSignal,
+    BackendPrimitive,
 )
 from pygrank.core.utils import call, ensure_used_args
 from pygrank.core.utils import preprocessor as default_preprocessor
@@ -88,7 +89,13 @@ class GraphFilter(NodeRanking):
             *args,
             **kwargs
         )
-        while not self.convergence.has_converged(ranks.np):
+        self._iteration_error = None  # set by fused steps to skip recomputing errors
+        while not (
+            self.convergence.has_converged(ranks.np)
+            if self._iteration_error is None
+            else self.convergence.has_converged(ranks.np, self._iteration_error)
+        ):
+            self._iteration_error = None
             self._step(
                 backend.graph_dropout(M, graph_dropout),
                 personalization,
@@ -107,6 +114,124 @@ class GraphFilter(NodeRanking):
             ranks.np = ranks.np * personalization_norm
         return ranks
 
+    def rank_many(
+        self,
+        graph: GraphSignalGraph = None,
+        personalizations=None,
+        warm_start: BackendPrimitive = None,
+        graph_dropout: float = 0,
+        *args,
+        **kwargs
+    ) -> BackendPrimitive:
+        """
+        Ranks many personalizations on the same graph at once. Filters that support batching perform each
+        iteration as one sparse matrix by dense matrix multiplication and stop updating columns as soon as they
+        converge, whereas other filters fall back to calling `rank` for each personalization.
+
+        Args:
+            graph: The graph on which to rank. Can be omitted if personalizations are graph signals.
+            personalizations: Either a backend matrix with one personalization per column or an iterable of
+                graph signal data (e.g. graph signals or dicts).
+            warm_start: Optional. A backend matrix of initial ranks with one column per personalization.
+                If None (default), personalizations are used.
+            graph_dropout: Optional. The graph dropout rate, as in `rank`. Default is 0.
+        Returns:
+            A backend matrix whose columns hold the ranks of respective personalizations.
+
+        Example:
+            >>> import pygrank as pg
+            >>> graph, seed_sets = ...
+            >>> ranks = pg.PageRank(alpha=0.9).rank_many(graph, [{v: 1 for v in seeds} for seeds in seed_sets])
+        """
+        if not hasattr(personalizations, "shape") or len(personalizations.shape) < 2:
+            personalizations = [
+                to_signal(graph, personalization)
+                for personalization in personalizations
+            ]
+            graph = personalizations[0].graph
+            personalizations = backend.combine_cols(
+                [personalization.np for personalization in personalizations]
+            )
+        if (
+            not self._batchable()
+            or not isinstance(self.convergence, ConvergenceManager)
+            or backend.backend_name() in ["tensorflow", "matvec"]
+        ):
+            warm_starts = (
+                [None] * personalizations.shape[1]
+                if warm_start is None
+                else backend.separate_cols(warm_start)
+            )
+            return backend.combine_cols(
+                [
+                    self.rank(
+                        graph,
+                        to_signal(graph, personalization),
+                        col_warm_start,
+                        graph_dropout,
+                        *args,
+                        **kwargs
+                    ).np
+                    for personalization, col_warm_start in zip(
+                        backend.separate_cols(personalizations), warm_starts
+                    )
+                ]
+            )
+        if (
+            not isinstance(self.personalization_transform, Tautology)
+            or self.personalization_transform.ranker is not None
+        ):
+            personalizations = backend.combine_cols(
+                [
+                    self.personalization_transform(to_signal(graph, personalization)).np
+                    for personalization in backend.separate_cols(personalizations)
+                ]
+            )
+        personalization_norms = backend.sum(backend.abs(personalizations), axis=0)
+        personalizations = personalizations / (
+            personalization_norms + (personalization_norms == 0)
+        )
+        ranks = backend.copy(personalizations if warm_start is None else warm_start)
+        M = self.preprocessor(
+            self._prepare_graph(graph, personalizations, *args, **kwargs)
+        )
+        self.convergence.start(
+            active_columns=[
+                col
+                for col in range(personalizations.shape[1])
+                if float(personalization_norms[col]) != 0
+            ]
+        )
+        ranks = self._start_many(
+            backend.graph_dropout(M, graph_dropout),
+            personalizations,
+            ranks,
+            *args,
+            **kwargs
+        )
+        while not self.convergence.has_converged_columns(ranks):
+            ranks = self._step_many(
+                backend.graph_dropout(M, graph_dropout),
+                personalizations,
+                ranks,
+                self.convergence.active_columns,
+                *args,
+                **kwargs
+            )
+        self._end_many(
+            backend.graph_dropout(M, graph_dropout),
+            personalizations,
+            ranks,
+            *args,
+            **kwargs
+        )
+        if self.preserve_norm:
+            ranks = ranks * personalization_norms
+        return ranks
+
+    def _batchable(self) -> bool:
+        return False
+
     def _prepare_graph(self, graph, *args, **kwargs):
         return graph
 
@@ -121,6 +246,17 @@ class GraphFilter(NodeRanking):
             "Use a derived class of GraphFilter that implements the _step method"
         )
 
+    def _start_many(self, M, personalizations, ranks, *args, **kwargs):
+        return ranks
+
+    def _end_many(self, M, personalizations, ranks, *args, **kwargs):
+        pass
+
+    def _step_many(self, M, personalizations, ranks, columns, *args, **kwargs):
+        raise Exception(
+            "Use a derived class of GraphFilter that implements the _step_many method"
+        )
+
     def references(self):
         return ["graph filter \\cite{ortega2018graph}"]
 
@@ -150,4 +286,4 @@ class GraphFilter(NodeRanking):
         if not isinstance(ranker, NodeRanking):
             raise Exception("pygrank can only shift rankers into filters")
         self.personalization_transform = ranker
-        return ranker
\ No newline at end of file
+        return ranker
@@ -5,8 +5,57 @@ from pygrank.core import (
     BackendPrimitive,
 )
 from pygrank.core import backend
+from pygrank.algorithms.convergence import ConvergenceManager
 from pygrank.algorithms.postprocess import Postprocessor
+from pygrank.measures import Mabs
 from typing import Union
+import numpy as np
+import scipy.sparse
+
+
+def _import_sparsetools():
+    """Imports scipy's private sparse kernels if their in-place product matches the public product of a signal
+    with a small matrix. Otherwise, convolutions fall back to `backend.conv` across scipy versions.
+    """
+    try:
+        from scipy.sparse import _sparsetools
+
+        M = scipy.sparse.csr_matrix(np.array([[0.0, 1.0], [2.0, 3.0]]))
+        signal = np.array([1.0, 2.0])
+        out = np.zeros(2)
+        _sparsetools.csc_matvec(
+            M.shape[1], M.shape[0], M.indptr, M.indices, M.data, signal, out
+        )
+        if np.array_equal(out, signal @ M):
+            return _sparsetools
+    except Exception:  # pragma: no cover
+        pass
+    return None  # pragma: no cover
+
+
+_sparsetools = _import_sparsetools()
+
+
+def _conv_into(signal: np.ndarray, M, out: np.ndarray) -> np.ndarray:
+    """Writes the convolution of a numpy signal with a graph into a preallocated numpy array. Scipy CSR
+    matrices of the numpy backend are multiplied in-place by scipy's sparse kernels, whereas other backends
+    fall back to `backend.conv`."""
+    if (
+        _sparsetools is not None
+        and backend.backend_name() == "numpy"
+        and scipy.sparse.issparse(M)
+        and M.format == "csr"
+        and M.dtype == signal.dtype == out.dtype == np.float64
+        and M.indptr.dtype == M.indices.dtype
+        and signal.flags.c_contiguous
+    ):
+        out.fill(0)
+        _sparsetools.csc_matvec(  # the CSR arrays of M are the CSC arrays of its transpose
+            M.shape[1], M.shape[0], M.indptr, M.indices, M.data, signal, out
+        )
+    else:
+        out[:] = backend.conv(signal, M)
+    return out
 
 
 class RecursiveGraphFilter(GraphFilter):
@@ -17,6 +66,8 @@ class RecursiveGraphFilter(GraphFilter):
         use_quotient: Union[bool, Postprocessor] = True,
         converge_to_eigenvectors: bool = False,
         *args,
+        acceleration: str = None,
+        acceleration_depth: int = 5,
         **kwargs
     ):
         """
@@ -27,23 +78,188 @@ class RecursiveGraphFilter(GraphFilter):
                 callable instances to adjust node scores after each iteration.
                 Can pass False or None to ignore this functionality and make recursive filter outcome equal to
                 its expansion.
+            acceleration: Optional. Accelerates the recursion's convergence without additional matrix
+                multiplications. If "aitken", every third iteration extrapolates the geometric decay of differences
+                between the last three iterations. If "anderson", each iteration is replaced by the
+                Anderson mixing of the latest *acceleration_depth* ones. Extrapolated ranks are passed through
+                *use_quotient* too. Estimated savings are reported by the convergence manager. Default is None,
+                which performs plain fixed-point iterations.
+            acceleration_depth: Optional. The number of past iterations that Anderson mixing uses. Default is 5.
+
+        Example:
+            >>> import pygrank as pg
+            >>> algorithm = pg.PageRank(alpha=0.99, acceleration="anderson", tol=1.E-9)
+            >>> graph, seed_nodes = ...
+            >>> ranks = algorithm(graph, {v: 1 for v in seed_nodes})
+            >>> print(algorithm.convergence) # prints iterations and estimated savings
         """
         super().__init__(*args, **kwargs)
         self.use_quotient = use_quotient
         self.converge_to_eigenvectors = converge_to_eigenvectors
+        if acceleration is not None and acceleration not in ["aitken", "anderson"]:
+            raise Exception("Supported accelerations: aitken, anderson")
+        self.acceleration = acceleration
+        self.acceleration_depth = acceleration_depth
+        self._fused_buffers = None
 
-    def _step(self, M, personalization, ranks, *args, **kwargs):
-        ranks.np = self._formula(M, personalization, ranks, *args, **kwargs)
-        if isinstance(ranks.np, GraphSignal):
-            ranks.np = ranks.np.np
-
+    def _quotient(self, ranks):
         if isinstance(self.use_quotient, Postprocessor):
             ranks.np = self.use_quotient(ranks)
         elif self.use_quotient:
             ranks.np = backend.safe_div(ranks, backend.sum(ranks))
+
+    def _fusable(self) -> bool:
+        # subclasses that redefine _formula without _formula_into use unfused steps
+        for cls in type(self).__mro__:
+            if "_formula_into" in cls.__dict__:
+                return True
+            if "_formula" in cls.__dict__:
+                return False
+        return False
+
+    def _step(self, M, personalization, ranks, *args, **kwargs):
+        if (
+            self.acceleration is None
+            and not self.converge_to_eigenvectors
+            and not isinstance(self.use_quotient, Postprocessor)
+            and isinstance(ranks.np, np.ndarray)
+            and isinstance(personalization.np, np.ndarray)
+            and len(ranks.np.shape) == 1
+            and self._fusable()
+        ):
+            self._fused_step(M, personalization, ranks, *args, **kwargs)
+            return
+        prev_ranks = ranks.np
+        ranks.np = self._formula(M, personalization, ranks, *args, **kwargs)
+        if isinstance(ranks.np, GraphSignal):
+            ranks.np = ranks.np.np
+        self._quotient(ranks)
+        if self.acceleration is not None:
+            accelerated = self._accelerate(prev_ranks, ranks.np)
+            if accelerated is not None:
+                ranks.np = accelerated
+                self._quotient(ranks)
         if self.converge_to_eigenvectors:
             personalization.np = ranks.np
 
+    def _fused_step(self, M, personalization, ranks, *args, **kwargs):
+        # iterations alternate between two preallocated output buffers, since the convergence manager
+        # keeps the previous one, and use a third buffer for temporaries
+        prev_ranks = ranks.np
+        if self.convergence.iteration <= 1 or self._fused_buffers is None:
+            self._fused_buffers = [np.empty(prev_ranks.shape) for _ in range(3)]
+        out, other, scratch = self._fused_buffers
+        if out is prev_ranks:
+            out = other
+        self._formula_into(
+            M, personalization.np, prev_ranks, out, scratch, *args, **kwargs
+        )
+        if self.use_quotient:
+            total = out.sum()
+            if total == 0:
+                out.fill(0)
+            else:
+                out /= total
+        ranks.np = out
+        if (
+            isinstance(self.convergence, ConvergenceManager)
+            and self.convergence.error_type is Mabs
+            and (self.convergence.iteration + 1) % self.convergence.end_modulo == 0
+        ):
+            np.subtract(out, prev_ranks, out=scratch)
+            np.abs(scratch, out=scratch)
+            self._iteration_error = scratch.sum() / len(scratch)
+
+    def _end(self, M, personalization, ranks, *args, **kwargs):
+        self._fused_buffers = None
+        super()._end(M, personalization, ranks, *args, **kwargs)
+
+    def _record_acceleration(self, contraction, step_error):
+        if hasattr(self.convergence, "record_acceleration"):
+            self.convergence.record_acceleration(contraction, step_error)
+
+    def _step_error(self, prev_ranks, ranks):
+        if isinstance(self.convergence.error_type, str):
+            return float(backend.sum(backend.abs(ranks - prev_ranks)))
+        return float(self.convergence.error_type(prev_ranks)(ranks))
+
+    def _accelerate(self, prev_ranks, ranks):
+        if self.convergence.iteration <= 1:
+            self._acceleration_history = list()
+        history = self._acceleration_history
+        if self.acceleration == "aitken":
+            if len(history) == 0:
+                history.append(prev_ranks)
+            history.append(ranks)
+            if len(history) < 3:
+                return None
+            first_diff = history[1] - history[0]
+            second_diff = history[2] - history[1]
+            first_norm = float(backend.dot(first_diff, first_diff))
+            contraction = (
+                0
+                if first_norm == 0
+                else float(backend.dot(second_diff, first_diff)) / first_norm
+            )
+            if not 0 < contraction < 1:
+                history.pop(0)
+                return None
+            self._acceleration_history = list()  # restart from the extrapolated ranks
+            # only the first extrapolation follows unaccelerated iterations that indicate their contraction
+            self._record_acceleration(
+                (
+                    float(backend.sum(backend.abs(second_diff)))
+                    / float(backend.sum(backend.abs(first_diff)))
+                    if getattr(self.convergence, "accelerations", 0) == 0
+                    else 0
+                ),
+                self._step_error(history[1], history[2]),
+            )
+            return ranks + second_diff * (contraction / (1 - contraction))
+        # anderson mixing, where history holds residuals and iterations
+        residual = ranks - prev_ranks
+        history.append((residual, ranks))
+        if len(history) > self.acceleration_depth + 1:
+            history.pop(0)
+        if len(history) < 2:
+            return None
+        residual_diffs = [
+            history[i + 1][0] - history[i][0] for i in range(len(history) - 1)
+        ]
+        ranks_diffs = [
+            history[i + 1][1] - history[i][1] for i in range(len(history) - 1)
+        ]
+        # the contraction of the unaccelerated recursion is estimated from its effect on the last step
+        step = float(backend.sum(backend.abs(ranks_diffs[-1] - residual_diffs[-1])))
+        self._record_acceleration(
+            0 if step == 0 else float(backend.sum(backend.abs(ranks_diffs[-1]))) / step,
+            self._step_error(prev_ranks, ranks),
+        )
+        gram = np.array(
+            [[float(backend.dot(u, v)) for v in residual_diffs] for u in residual_diffs]
+        )
+        gram += np.eye(len(residual_diffs)) * (np.trace(gram) * 1.0e-10 + 1.0e-30)
+        target = np.array([float(backend.dot(u, residual)) for u in residual_diffs])
+        try:
+            gamma = np.linalg.solve(gram, target)
+        except np.linalg.LinAlgError:  # pragma: no cover
+            return None
+        for weight, diff in zip(gamma, ranks_diffs):
+            ranks = ranks - diff * float(weight)
+        return ranks
+
+    def _step_many(self, M, personalizations, ranks, columns, *args, **kwargs):
+        active_ranks = self._formula(
+            M, personalizations[:, columns], ranks[:, columns], *args, **kwargs
+        )
+        if self.use_quotient:
+            sums = backend.sum(active_ranks, axis=0)
+            active_ranks = active_ranks / (sums + (sums == 0)) * (sums != 0)
+        ranks[:, columns] = active_ranks
+        if self.converge_to_eigenvectors:
+            personalizations[:, columns] = active_ranks
+        return ranks
+
     def _formula(
         self,
         M: BackendGraph,
@@ -56,8 +272,29 @@ class RecursiveGraphFilter(GraphFilter):
             "Use a derived class of RecursiveGraphFilter that implements the _formula method"
         )
 
+    def _formula_into(
+        self,
+        M: BackendGraph,
+        personalization: np.ndarray,
+        ranks: np.ndarray,
+        out: np.ndarray,
+        scratch: np.ndarray,
+        *args,
+        **kwargs
+    ):
+        """Fused alternative of _formula for numpy arrays that writes its outcome into *out* without allocating
+        intermediate arrays. The *scratch* array can hold temporary values. Subclasses that implement
+        this method are iterated without per-iteration allocations."""
+        raise Exception(
+            "Use a derived class of RecursiveGraphFilter that implements the _formula_into method"
+        )
+
     def references(self):
         refs = super().references()
         if self.converge_to_eigenvectors:
             refs += ["unbiased eigenvector convergence \\cite{krasanakis2018venuerank}"]
-        return refs
\ No newline at end of file
+        if self.acceleration == "anderson":
+            refs += ["Anderson acceleration \\cite{walker2011anderson}"]
+        elif self.acceleration == "aitken":
+            refs += ["Aitken extrapolation"]
+        return refs
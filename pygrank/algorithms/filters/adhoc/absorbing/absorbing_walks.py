@@ -1,5 +1,7 @@
+import numpy as np
 from pygrank.core import backend
 from pygrank.algorithms.filters.abstract import RecursiveGraphFilter
+from pygrank.algorithms.filters.abstract.recursive import _conv_into
 from pygrank.core import to_signal
 
 
@@ -51,6 +53,14 @@ class AbsorbingWalks(RecursiveGraphFilter):
         ) / (self.absorption + self.degrees)
         return ret
 
+    def _formula_into(self, M, personalization, ranks, out, scratch, *args, **kwargs):
+        _conv_into(ranks, M, out)
+        out *= self.degrees
+        np.multiply(personalization, self.absorption.np, out=scratch)
+        out += scratch
+        np.add(self.absorption.np, self.degrees, out=scratch)
+        out /= scratch
+
     def references(self):
         refs = super().references()
         refs[0] = "partially absorbing random walks \\cite{wu2012learning}"
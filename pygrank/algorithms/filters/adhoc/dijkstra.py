@@ -1,5 +1,7 @@
+import numpy as np
 from pygrank.core import backend
 from pygrank.algorithms.filters.abstract import RecursiveGraphFilter
+from pygrank.algorithms.filters.abstract.recursive import _conv_into
 
 
 class DijkstraRank(RecursiveGraphFilter):
@@ -15,3 +17,8 @@ class DijkstraRank(RecursiveGraphFilter):
         choice = backend.cast(ranks.np > prev_ranks.np)
         ranks.np = choice * ranks.np + (1 - choice) * prev_ranks.np
         return ranks
+
+    def _formula_into(self, M, personalization, ranks, out, scratch, *args, **kwargs):
+        _conv_into(ranks, M, out)
+        out *= self.degradation
+        np.maximum(out, ranks, out=out)
@@ -1,25 +1,218 @@
-from pygrank.core import backend
+import numpy as np
+import scipy
+import warnings
+from pygrank.core import (
+    backend,
+    to_signal,
+    to_sparse_signal,
+    GraphSignal,
+    GraphSignalGraph,
+    GraphSignalData,
+)
 from pygrank.algorithms.filters.abstract import RecursiveGraphFilter
+from pygrank.algorithms.filters.abstract.recursive import _conv_into
+from pygrank.algorithms.postprocess import Postprocessor, Tautology
+
+
+def _distinct(values, marks):
+    """Finds the distinct non-negative integers of an array without sorting, by marking positions of a
+    scratch array that has at least as many entries as the largest integer."""
+    order = np.arange(len(values))
+    marks[values] = order
+    return values[marks[values] == order]
+
+
+def _local_push(M, ids, values, alpha, tol, slots=None):
+    """
+    Pushes personalization residuals along the rows of a scipy sparse CSR matrix until all residuals are at most
+    *tol*. All nodes with large enough residuals are pushed together in each round, so that only the rows
+    of these nodes are visited. Ranks and residuals are stored only for touched nodes, starting from the
+    personalization's node *ids* and *values*. Returns the ids of touched nodes, their estimated ranks,
+    and the L1 norm of the remaining residuals.
+
+    Touched nodes are mapped to their storage positions through *slots*, an integer array with one -1 entry
+    per graph node that is restored before returning, so that it can be reused by subsequent calls.
+    """
+    if slots is None:
+        slots = np.full(M.shape[0], -1, dtype=np.int64)
+    touched = np.array(ids, dtype=np.int64)
+    num_touched = len(touched)
+    slots[touched] = np.arange(num_touched)
+    ranks = np.zeros(num_touched)
+    residuals = np.array(values, dtype=float)
+    marks = np.zeros(num_touched, dtype=np.int64)
+    active = np.nonzero(np.abs(residuals) > tol)[0]
+    while len(active) != 0:
+        pushed = residuals[active]
+        ranks[active] += (1 - alpha) * pushed
+        residuals[active] = 0
+        rows = M[touched[active]]
+        targets = rows.indices
+        new_targets = targets[slots[targets] < 0]
+        if (
+            len(new_targets) != 0
+        ):  # distinct new targets are marked in their slots, as in _distinct
+            slots[new_targets] = -2 - np.arange(len(new_targets))
+            new_targets = new_targets[
+                slots[new_targets] == -2 - np.arange(len(new_targets))
+            ]
+            required = num_touched + len(new_targets)
+            if required > len(touched):
+                capacity = max(required, 2 * len(touched))
+                touched = np.resize(touched, capacity)
+                ranks = np.resize(ranks, capacity)
+                residuals = np.resize(residuals, capacity)
+                marks = np.resize(marks, capacity)
+            touched[num_touched:required] = new_targets
+            ranks[num_touched:required] = 0
+            residuals[num_touched:required] = 0
+            slots[new_targets] = np.arange(num_touched, required)
+            num_touched = required
+        target_slots = slots[targets]
+        np.add.at(
+            residuals,
+            target_slots,
+            alpha * rows.data * np.repeat(pushed, np.diff(rows.indptr)),
+        )
+        target_slots = _distinct(target_slots, marks)
+        active = target_slots[np.abs(residuals[target_slots]) > tol]
+    touched = touched[:num_touched]
+    slots[touched] = -1
+    return (
+        touched,
+        ranks[:num_touched],
+        float(np.sum(np.abs(residuals[:num_touched]))),
+    )
 
 
 class PageRank(RecursiveGraphFilter):
     """A Personalized PageRank power method algorithm."""
 
-    def __init__(self, alpha: float = 0.85, *args, **kwargs):
+    def __init__(self, alpha: float = 0.85, *args, solver: str = "power", **kwargs):
         """Initializes the PageRank scheme parameters.
         Args:
             alpha: Optional. 1-alpha is the bias towards the personalization. Default alpha value is 0.85
                 for historyical reasons. However, in large graphs it is often preferred to set this
                 argument to 0.9.
+            solver: Optional. If "power" (default), ranks are computed with power iterations over the whole graph.
+                If "push", the local push scheme of Andersen, Chung and Lang is used instead, whose cost
+                depends on the number of nodes reached by personalization residuals larger than the convergence
+                manager's *tol* instead of the number of graph edges. This is much faster for personalizations
+                of few seeds. The push scheme solves the PageRank equation without intermediate
+                quotients; use it with "col" normalization (the default for directed graphs) to get the
+                same outcome as power iterations, as a warning is raised otherwise. Unless a preprocessor is
+                provided, graphs are assumed immutable so that their normalization is computed only once.
+                Ranks and residuals are kept only for touched nodes and outcomes are sparse graph signals.
+                After running, the `push_error` attribute holds an upper bound of the L1 norm of the error
+                (before rescaling with the personalization norm) under column normalization.
         Example:
             >>> import pygrank as pg
             >>> algorithm = pg.PageRank(alpha=0.99, tol=1.E-9) # tol passed to the ConvergenceManager
             >>> graph, seed_nodes = ...
             >>> ranks = algorithm(graph, {v: 1 for v in seed_nodes})
+        Example (local push):
+            >>> import pygrank as pg
+            >>> algorithm = pg.PageRank(alpha=0.9, solver="push", normalization="col", tol=1.E-6)
+            >>> graph, seed_nodes = ...
+            >>> ranks = algorithm(graph, {v: 1 for v in seed_nodes})
         """
         self.alpha = alpha
+        if solver not in ["power", "push"]:
+            raise Exception("Supported PageRank solvers: power, push")
+        self.solver = solver
+        self.push_error = None
+        self._push_normalization = None  # unknown for custom preprocessors
+        self._push_slots = None
+        # positional preprocessors follow use_quotient and converge_to_eigenvectors
+        if (
+            solver == "push"
+            and kwargs.get("preprocessor", None) is None
+            and len(args) < 3
+        ):
+            self._push_normalization = kwargs.get("normalization", "auto")
+            # queries do not normalize the whole graph again
+            kwargs["assume_immutability"] = kwargs.get("assume_immutability", True)
         super().__init__(*args, **kwargs)
 
+    def rank(
+        self,
+        graph: GraphSignalGraph = None,
+        personalization: GraphSignalData = None,
+        warm_start: GraphSignalData = None,
+        graph_dropout: float = 0,
+        *args,
+        **kwargs,
+    ) -> GraphSignal:
+        if self.solver == "power":
+            return super().rank(
+                graph, personalization, warm_start, graph_dropout, *args, **kwargs
+            )
+        if graph_dropout != 0:
+            raise Exception("The push solver does not support graph dropout")
+        if (
+            isinstance(self.use_quotient, Postprocessor)
+            or self.converge_to_eigenvectors
+        ):
+            raise Exception(
+                "The push solver does not support postprocessor quotients or eigenvector convergence"
+            )
+        transform = self.personalization_transform
+        if isinstance(transform, Tautology) and transform.ranker is None:
+            personalization = to_sparse_signal(graph, personalization)
+        else:
+            personalization = to_sparse_signal(
+                None, transform(to_signal(graph, personalization))
+            )
+        normalization = self._push_normalization
+        if normalization == "auto":
+            normalization = (
+                "col" if personalization.graph.is_directed() else "symmetric"
+            )
+        if normalization is not None and normalization != "col":
+            warnings.warn(
+                "The push solver matches power iterations only under col normalization",
+                stacklevel=2,
+            )
+        personalization_norm = float(np.sum(np.abs(personalization.nonzero_values)))
+        if personalization_norm == 0:
+            return personalization
+        tol = (
+            backend.epsilon()
+            if self.convergence.tol is None
+            else max(self.convergence.tol, backend.epsilon())
+        )
+        with backend.Backend("numpy"):
+            M = self.preprocessor(
+                self._prepare_graph(
+                    personalization.graph, personalization, *args, **kwargs
+                )
+            )
+            M = M.array if hasattr(M, "array") else M
+            if not scipy.sparse.issparse(M) or M.format != "csr":
+                M = scipy.sparse.csr_matrix(M)
+            if self._push_slots is None or len(self._push_slots) != M.shape[0]:
+                self._push_slots = np.full(M.shape[0], -1, dtype=np.int64)
+            ids, ranks, self.push_error = _local_push(
+                M,
+                personalization.nonzero_ids,
+                personalization.nonzero_values / personalization_norm,
+                self.alpha,
+                tol,
+                self._push_slots,
+            )
+        if self.use_quotient:
+            ranks = backend.safe_inv(np.sum(ranks, keepdims=True)) * ranks
+        if self.preserve_norm:
+            ranks = ranks * personalization_norm
+        return personalization._from_ids(ids, ranks)
+
+    def _batchable(self):
+        return (
+            self.solver == "power"
+            and not isinstance(self.use_quotient, Postprocessor)
+            and self.acceleration is None
+        )
+
     def _start(self, M, personalization, ranks, *args, **kwargs):
         # self.dangling_weights = backend.degrees(M)
         # self.is_dangling = self.dangling_weights/backend.sum(self.dangling_weights)
@@ -29,6 +222,12 @@ class PageRank(RecursiveGraphFilter):
         # TODO: return self.alpha * (ranks * M + backend.sum(ranks[self.is_dangling]) * personalization) + (1 - self.alpha) * personalization
         return backend.conv(ranks, M) * self.alpha + personalization * (1 - self.alpha)
 
+    def _formula_into(self, M, personalization, ranks, out, scratch, *args, **kwargs):
+        _conv_into(ranks, M, out)
+        out *= self.alpha
+        np.multiply(personalization, 1 - self.alpha, out=scratch)
+        out += scratch
+
     def _end(self, M, personalization, ranks, *args, **kwargs):
         # del self.is_dangling
         super()._end(M, personalization, ranks, *args, **kwargs)
@@ -37,4 +236,6 @@ class PageRank(RecursiveGraphFilter):
         refs = super().references()
         refs[0] = "personalized PageRank \\cite{page1999pagerank}"
         refs.insert(1, f"diffusion rate {self.alpha:.3f}")
+        if self.solver == "push":
+            refs.insert(2, "local push \\cite{andersen2006local}")
         return refs
@@ -0,0 +1,120 @@
+from pygrank.core import backend, to_signal, GraphSignal, BackendPrimitive
+
+
+class HopBasis:
+    """Materializes the hops [p, Mp, M^2p, ..., M^Kp] of a personalization p once, so that graph filters
+    defined by Taylor coefficients (e.g. those of `GenericGraphFilter`) can be evaluated for any weights
+    with a dense product instead of new graph convolutions."""
+
+    def __init__(
+        self,
+        M,
+        personalization: GraphSignal,
+        hops: int = 10,
+        dtype=None,
+    ):
+        """
+        Computes the hop basis.
+
+        Args:
+            M: The preprocessed graph adjacency matrix, for example obtained with `ranker.preprocessor(graph)`.
+            personalization: The graph signal to propagate.
+            hops: Optional. The maximum number of hops K to compute. Weight vectors of up to K+1 elements can be
+                evaluated afterwards. Default is 10.
+            dtype: Optional. If not None, the basis is stored in this numpy data type (e.g. numpy.float32)
+                to halve memory and speed up dense products. This is supported only by numpy-based backends.
+                Default is None.
+
+        Example:
+            >>> import pygrank as pg
+            >>> graph, personalization = ...
+            >>> algorithm = pg.GenericGraphFilter([0.5, 0.25, 0.125])
+            >>> basis = pg.HopBasis(algorithm.preprocessor(graph), pg.to_signal(graph, personalization), hops=2)
+            >>> ranks = basis.rank([0.5, 0.25, 0.125])  # same outcome as algorithm.rank(graph, personalization)
+        """
+        self.personalization = personalization
+        self.hops = int(hops)
+        propagated = personalization.np
+        columns = [propagated]
+        for _ in range(self.hops):
+            propagated = backend.conv(propagated, M)
+            columns.append(propagated)
+        self.basis = backend.combine_cols(columns)
+        if dtype is not None:
+            if not hasattr(self.basis, "astype"):
+                raise Exception(
+                    "Hop basis data types are supported only by numpy-based backends"
+                )
+            self.basis = self.basis.astype(dtype)
+
+    def _coefficients(self, weights) -> list:
+        weights = [float(weight) for weight in weights]
+        if len(weights) > self.hops + 1:
+            raise Exception(
+                "Hop basis of "
+                + str(self.hops)
+                + " hops cannot evaluate "
+                + str(len(weights))
+                + " weights"
+            )
+        return weights + [0.0] * (self.hops + 1 - len(weights))
+
+    def _converged_weights(self, weights: list, convergence) -> list:
+        # replays the iterations of graph filters on the normalized personalization to find where they stop
+        personalization_norm = backend.sum(backend.abs(self.personalization.np))
+        ranks = backend.repeat(0.0, backend.length(self.personalization.np))
+        hops = 0
+        convergence.start()
+        while not convergence.has_converged(ranks):
+            if hops < len(weights) and weights[hops] != 0:
+                ranks = ranks + self.basis[:, hops] * (
+                    weights[hops] / personalization_norm
+                )
+            hops += 1
+        return weights[:hops] + [0.0] * (len(weights) - min(hops, len(weights)))
+
+    def rank_many(self, candidate_weights, convergence=None) -> BackendPrimitive:
+        """
+        Evaluates many weight vectors with one dense product between the (nodes x hops) basis and the
+        (hops x candidates) matrix of weights.
+
+        Args:
+            candidate_weights: An iterable of weight vectors, each one holding the weights of propagating
+                the personalization 0, 1, 2, ... hops away.
+            convergence: Optional. The convergence manager of the graph filter whose outcomes are evaluated.
+                If provided, each weight vector is truncated at the hop where that filter would stop iterating,
+                so that outcomes match the filter's even when it converges before using all weights. If None
+                (default), all weights are used.
+        Returns:
+            A backend matrix whose columns hold the outcomes of respective weight vectors.
+
+        Example:
+            >>> import pygrank as pg
+            >>> basis = ...
+            >>> ranks = basis.rank_many([[0.9**n for n in range(11)], [0.5**n for n in range(11)]])
+        """
+        candidate_weights = [
+            self._coefficients(weights) for weights in candidate_weights
+        ]
+        if convergence is not None:
+            candidate_weights = [
+                self._converged_weights(weights, convergence)
+                for weights in candidate_weights
+            ]
+        coefficients = backend.combine_cols(
+            [backend.to_array(weights) for weights in candidate_weights]
+        )
+        if hasattr(self.basis, "dtype") and hasattr(coefficients, "astype"):
+            coefficients = coefficients.astype(self.basis.dtype)
+        return self.basis @ coefficients
+
+    def rank(self, weights) -> GraphSignal:
+        """
+        Evaluates the graph filter with the given hop weights.
+
+        Args:
+            weights: The weights of propagating the personalization 0, 1, 2, ... hops away.
+        Returns:
+            A graph signal holding the filter's outcome.
+        """
+        return to_signal(self.personalization, self.rank_many([weights])[:, 0])
@@ -1,5 +1,5 @@
 from pygrank.core import backend, BackendPrimitive, BackendGraph
-from pygrank import measures
+import pygrank.measures as measures
 import warnings
 
 
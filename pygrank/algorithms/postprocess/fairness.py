@@ -192,11 +192,7 @@ class FairPersonalizer(Postprocessor):
             error_type="iters", max_iters=prev_convergence.iteration
         )
 
-        def loss(params):
-            fair_pers = self.__culep(training.np, sensitive, original_ranks, params)
-            fair_ranks = self.ranker.rank(
-                graph, personalization=fair_pers, *args, **kwargs
-            )
+        def evaluate(fair_ranks):
             fairness_loss = fairness_measure(fair_ranks)
             # ranks = ranks.np / backend.max(ranks.np)
             # original_ranks = original_ranks.np / backend.max(original_ranks.np)
@@ -212,6 +208,27 @@ class FairPersonalizer(Postprocessor):
                 - self.pRule_weight * min(self.target_pRule, fairness_loss)
             )  # - 0.1 * fairness_loss
 
+        def loss(params):
+            fair_pers = self.__culep(training.np, sensitive, original_ranks, params)
+            return evaluate(
+                self.ranker.rank(graph, personalization=fair_pers, *args, **kwargs)
+            )
+
+        def loss_batch(candidates):
+            fair_pers = backend.combine_cols(
+                [
+                    self.__culep(training.np, sensitive, original_ranks, params)
+                    for params in candidates
+                ]
+            )
+            fair_ranks = self.ranker.rank_many(
+                graph, fair_pers, None, 0, *args, **kwargs
+            )
+            return [
+                evaluate(to_signal(original_ranks, fair_ranks[:, col]))
+                for col in range(len(candidates))
+            ]
+
         optimal_params = optimize(
             loss,
             max_vals=[1, 1, 5, 5] * self.parameter_buckets + [self.max_residual],
@@ -219,6 +236,11 @@ class FairPersonalizer(Postprocessor):
             deviation_tol=1.0e-6,
             divide_range=2,
             partitions=10,
+            loss_batch=(
+                loss_batch
+                if callable(getattr(self.ranker, "rank_many", None))
+                else None
+            ),
         )
         optimal_personalization = self.__culep(
             personalization, sensitive, original_ranks, optimal_params
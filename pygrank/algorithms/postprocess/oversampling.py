@@ -1,5 +1,6 @@
 import numpy as np
 from pygrank.core import (
+    backend,
     to_signal,
     NodeRanking,
     GraphSignalGraph,
@@ -61,12 +62,15 @@ class SeedOversampling(Postprocessor):
                 * graph.number_of_nodes()
                 / graph.number_of_edges()
             )
-            threshold = np.sort(list(ranks.values()))[len(ranks) - top]  # get top ranks
-            personalization = {
-                v: 1.0
-                for v in graph.nodes()
-                if ranks[v] >= threshold or personalization.get(v, 0) == 1
-            }
+            threshold = (
+                float(ranks.top(top)[1][-1]) if 0 < top <= len(ranks) else float("inf")
+            )  # get top ranks
+            oversampled = (np.asarray(ranks.np, dtype=float) >= threshold) | (
+                np.asarray(personalization.np, dtype=float) == 1
+            )
+            personalization = to_signal(
+                personalization, backend.to_array(oversampled.astype(float))
+            )
             return self.ranker.rank(graph, personalization, **kwargs)
         elif self.method == "neighbors":
             personalization = dict(personalization.items())
@@ -1,3 +1,4 @@
+import numpy as np
 from pygrank.core.utils import MethodHasher, call, ensure_used_args, remove_used_args
 from pygrank.core.signals import GraphSignal, to_signal, NodeRanking
 from pygrank.core import backend, GraphSignalGraph, GraphSignalData
@@ -115,6 +116,7 @@ class Normalize(Postprocessor):
         self,
         ranker: Optional[Union[NodeRanking, str]] = None,
         method: Optional[Union[NodeRanking, str]] = "max",
+        inplace: bool = False,
     ):
         """Initializes the class with a base ranker instance. Args are automatically filled in and
         re-ordered if at least one is provided.
@@ -123,6 +125,8 @@ class Normalize(Postprocessor):
             ranker: Optional. The base ranker instance. A Tautology() ranker is created if None (default) was specified.
             method: Optional. Divide ranks either by their "max" (default) or by their "sum" or make the lie in the
              "range" [0,1] by subtracting their mean before diving by their max.
+            inplace: Optional. If True, normalized values overwrite those of the transformed signal, which is
+             returned instead of a new one. Default is False.
 
         Example:
             >>> import pygrank as pg
@@ -141,6 +145,7 @@ class Normalize(Postprocessor):
                 ranker = None
         super().__init__(Tautology() if ranker is None else ranker)
         self.method = method
+        self.inplace = inplace
 
     def _transform(self, ranks: GraphSignal, **kwargs):
         ensure_used_args(kwargs)
@@ -158,8 +163,20 @@ class Normalize(Postprocessor):
             raise Exception("Can only normalize towards max, sum, range, or L2")
         if min_rank == max_rank:
             return ranks
-        ret = (ranks.np - min_rank) / (max_rank - min_rank)
-        return ret
+        if not self.inplace:
+            return (ranks.np - min_rank) / (max_rank - min_rank)
+        values = ranks.np
+        if (
+            isinstance(values, np.ndarray)
+            and values.dtype.kind == "f"
+            and values.flags.writeable
+        ):
+            values -= min_rank  # numpy arrays are normalized without new allocations
+            values /= max_rank - min_rank
+        else:
+            values = (values - min_rank) / (max_rank - min_rank)
+        ranks.np = values
+        return ranks
 
     def _reference(self):
         if self.method == "range":
@@ -194,10 +211,10 @@ class Ordinals(Postprocessor):
 
     def _transform(self, ranks: GraphSignal, **kwargs):
         ensure_used_args(kwargs)
-        return {
-            v: order + 1
-            for order, v in enumerate(sorted(ranks, key=ranks.get, reverse=True))
-        }
+        positions, _ = ranks.top(len(ranks))
+        ordinals = np.zeros(len(positions))
+        ordinals[positions] = np.arange(1, len(positions) + 1)
+        return backend.to_array(ordinals)
 
     def _reference(self):
         return "ordinal conversion"
@@ -210,16 +227,20 @@ class Transformer(Postprocessor):
         self,
         ranker: Union[Optional[NodeRanking], Callable] = None,
         expr: Union[Optional[NodeRanking], Callable] = backend.exp,
+        inplace: bool = False,
     ):
         """Initializes the class with a base ranker instance. Args are automatically filled in and
         re-ordered if at least one is provided.
 
         Args:
             ranker: Optional. The base ranker instance. A Tautology() ranker is created if None (default) was specified.
-            expr: Optional. A lambda expression to apply on each element. The transformer will automatically try to
-                apply it on the backend array representation of the graph signal first, so prefer pygrank's backend
-                functions for faster computations. For example, backend.exp (default) should be preferred instead of
-                math.exp, because the former can directly parse numpy arrays, tensors, etc.
+            expr: Optional. A lambda expression to apply on each element. The expression is applied on the backend
+                array representation of graph signals, so it should comprise pygrank's backend functions or
+                operators. For example, backend.exp (default) should be used instead of math.exp, because the former
+                can directly parse numpy arrays, tensors, etc. An exception is raised for expressions that cannot
+                parse backend arrays.
+            inplace: Optional. If True, transformed values overwrite those of the transformed signal, which is
+                returned instead of a new one. Default is False.
 
         Example:
             >>> import pygrank as pg
@@ -234,13 +255,20 @@ class Transformer(Postprocessor):
                 ranker = None
         super().__init__(Tautology() if ranker is None else ranker)
         self.expr = expr
+        self.inplace = inplace
 
     def _transform(self, ranks: GraphSignal, **kwargs):
         ensure_used_args(kwargs)
         try:
-            return self.expr(ranks.np)
-        except:
-            return {v: self.expr(ranks[v]) for v in ranks}
+            values = self.expr(ranks.np)
+        except Exception as e:
+            raise Exception(
+                "Transformer expressions should be applicable on backend arrays, e.g., use pg.exp instead of math.exp"
+            ) from e
+        if self.inplace:
+            ranks.np = values
+            return ranks
+        return values
 
     def _reference(self):
         return "element-by-element " + self.expr.__name__
@@ -288,12 +316,11 @@ class Top(Postprocessor):
             else self.fraction_of_training
         )
         fraction_of_training = int(fraction_of_training)
-        for v in sorted(ranks, key=ranks.get, reverse=True):
-            fraction_of_training -= 1
-            if fraction_of_training == 0:
-                threshold = ranks[v]
-                break
-        return {v: 1.0 if ranks[v] >= threshold else 0.0 for v in ranks.keys()}
+        if 0 < fraction_of_training <= len(ranks):
+            threshold = float(ranks.top(fraction_of_training)[1][-1])
+        return backend.to_array(
+            (np.asarray(ranks.np, dtype=float) >= threshold).astype(float)
+        )
 
     def _reference(self):
         if self.fraction_of_training > 1:
@@ -313,6 +340,7 @@ class Threshold(Postprocessor):
         ranker: Union[str, float, NodeRanking] = None,
         threshold: Union[str, float, NodeRanking] = 0,
         inclusive: bool = False,
+        inplace: bool = False,
     ):
         """Initializes the Threshold postprocessing scheme. Args are automatically filled in and
         re-ordered if at least one is provided.
@@ -322,6 +350,9 @@ class Threshold(Postprocessor):
             threshold: Optional. The maximum numeric value required to output rank 0 instead of 1. If "gap"
                 then its value is automatically determined based on the maximal percentage increase between consecutive
                 ranks. Default is 0.
+            inclusive: Optional. If True, ranks equal to the threshold are also set to 1. Default is False.
+            inplace: Optional. If True, binary values overwrite those of the transformed signal, which is
+                returned instead of a new one. Default is False.
 
         Example:
             >>> import pygrank as pg
@@ -346,25 +377,31 @@ class Threshold(Postprocessor):
         super().__init__(Tautology() if ranker is None else ranker)
         self.threshold = threshold
         self.inclusive = inclusive
+        self.inplace = inplace
 
     def _transform(self, ranks: GraphSignal, **kwargs):
         ensure_used_args(kwargs)
         threshold = self.threshold
+        values = np.asarray(ranks.np, dtype=float)
         if threshold == "gap":
             # TODO maybe enable ranks = {v: ranks[v] / ranks.graph.degree(v) for v in ranks} with a postprocessor
-            max_diff = 0
+            # the threshold is the rank after the maximal relative decrease between consecutive sorted ranks
             threshold = 0
-            prev_rank = 0
-            for v in sorted(ranks, key=ranks.get, reverse=True):
-                if prev_rank > 0:
-                    diff = (prev_rank - ranks[v]) / prev_rank
-                    if diff > max_diff:
-                        max_diff = diff
-                        threshold = ranks[v]
-                prev_rank = ranks[v]
-        if self.inclusive:
-            return {v: 1.0 for v in ranks.keys() if ranks[v] >= threshold}
-        return {v: 1.0 for v in ranks.keys() if ranks[v] > threshold}
+            ordered = -np.sort(-values)
+            prev_ranks = ordered[:-1]
+            positive = prev_ranks > 0
+            diffs = np.zeros(len(prev_ranks))
+            diffs[positive] = (
+                prev_ranks[positive] - ordered[1:][positive]
+            ) / prev_ranks[positive]
+            if len(diffs) and diffs.max() > 0:
+                threshold = ordered[1 + int(np.argmax(diffs))]
+        mask = values >= threshold if self.inclusive else values > threshold
+        binary = backend.to_array(mask.astype(float))
+        if self.inplace:
+            ranks.np = binary
+            return ranks
+        return binary
 
     def _reference(self):
         return str(self.threshold) + " threshold"
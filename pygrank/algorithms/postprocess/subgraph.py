@@ -1,3 +1,4 @@
+import numpy as np
 from pygrank.core import (
     to_signal,
     NodeRanking,
@@ -33,10 +34,12 @@ class Subgraph(Postprocessor):
         super().__init__(Tautology() if ranker is None else ranker)
 
     def transform(self, ranks: GraphSignal, *args, **kwargs):
-        nodes = [u for u in ranks if ranks[u] != 0]
+        values = np.asarray(ranks.np)
+        ids = np.nonzero(values)[0]
+        nodes = ranks.node2id.nodes_of(ids).tolist()
         graph = ranks.graph.subgraph(nodes)
         graph._pygrank_original_graph = ranks.graph
-        return to_signal(graph, {u: ranks[u] for u in nodes})
+        return to_signal(graph, (nodes, values[ids]))
 
     def rank(self, *args, **kwargs):
         ranks = self.ranker.rank(*args, **kwargs)
@@ -66,7 +69,7 @@ class Supergraph(Postprocessor):
 
     def transform(self, ranks: GraphSignal, *args, **kwargs):
         return to_signal(
-            ranks.graph._pygrank_original_graph, {u: ranks[u] for u in ranks}
+            ranks.graph._pygrank_original_graph, (list(ranks), np.asarray(ranks.np))
         )
 
     def rank(self, *args, **kwargs):
@@ -1,6 +1,5 @@
 import gzip
 import tarfile
-import wget
 import shutil
 import sys
 import os
@@ -165,6 +164,8 @@ def download_dataset(
     if not os.path.exists(download_path + "/pairs.txt") or not os.path.exists(
         download_path + "/groups.txt"
     ):
+        import wget
+
         if not os.path.isdir(download_path):
             os.mkdir(download_path)
         if "all" in source:
@@ -73,12 +73,18 @@ def import_snap_format_dataset(
     groups = {}
     if prepend_all_nodes:
         groups[0] = list(G)
+    src, dst = list(), list()
     with open(path + "/" + dataset + "/" + pair_file, "r", encoding="utf-8") as file:
         for line in file:
             if len(line) != 0 and line[0] != "#":
                 splt = line[:-1].split()
                 if len(splt) > 1:
-                    G.add_edge(splt[0], splt[1])
+                    src.append(splt[0])
+                    dst.append(splt[1])
+    if isinstance(G, nx.Graph):
+        G.add_edges_from(src, dst)
+    else:
+        G.add_edges_from(zip(src, dst))
     if min_group_size < 1:
         min_group_size *= len(G)
     if verbose:
@@ -2,7 +2,6 @@ import io
 import math
 import sys
 from typing import Optional
-from scipy import stats
 import numpy as np
 
 
@@ -118,6 +117,8 @@ def benchmark_scores(benchmark):
 
 
 def benchmark_ranks(benchmark):
+    from scipy import stats
+
     for line in benchmark:
         numbers = [-value for value in line if not isinstance(value, str)]
         # orders = {i: order+1 for order, i in enumerate(sorted(list(range(len(numbers))), key=lambda i: numbers[i], reverse=True))}
@@ -1,12 +1,10 @@
 from typing import Callable, Mapping, Any
 
-from pygrank import Utility
 from pygrank.core import to_signal, GraphSignal, NodeRanking
 from pygrank.measures.utils import split
-from pygrank.measures import AUC, Measure, Time, Unsupervised
+from pygrank.measures import AUC, Measure, Time, Unsupervised, Utility
 from timeit import default_timer as time
 from typing import Union, List, Iterable, Optional
-import networkx as nx
 import collections
 from inspect import isclass
 
@@ -16,11 +14,12 @@ def benchmark(
     datasets: Any,
     metrics: Union[
         Union[
-            Callable[[nx.Graph], Measure], Callable[[GraphSignal, GraphSignal], Measure]
+            Callable[["networkx.Graph"], Measure],
+            Callable[[GraphSignal, GraphSignal], Measure],
         ],
         List[
             Union[
-                Callable[[nx.Graph], Measure],
+                Callable[["networkx.Graph"], Measure],
                 Callable[[GraphSignal, GraphSignal], Measure],
             ]
         ],
@@ -28,7 +27,8 @@ def benchmark(
     fraction_of_training: Union[float, Iterable[float]] = 0.5,
     sensitive: Optional[
         Union[
-            Callable[[nx.Graph], Measure], Callable[[GraphSignal, GraphSignal], Measure]
+            Callable[["networkx.Graph"], Measure],
+            Callable[[GraphSignal, GraphSignal], Measure],
         ]
     ] = None,
     seed: Union[int, Iterable[int]] = 0,
@@ -99,11 +99,11 @@ def benchmark(
                 )
                 if sensitive is None and multigroup:
                     training = {
-                        group_id: to_signal(graph, {v: 1 for v in group})
+                        group_id: to_signal(graph, (group, 1))
                         for group_id, group in training.items()
                     }
                     evaluation = {
-                        group_id: to_signal(graph, {v: 1 for v in group})
+                        group_id: to_signal(graph, (group, 1))
                         for group_id, group in evaluation.items()
                     }
                     rank = lambda algorithm: {
@@ -115,15 +115,15 @@ def benchmark(
                         training = training[0]
                         evaluation = evaluation[0]
                         sensitive_signal = to_signal(
-                            graph, {v: 1 for v in group[max(group.keys())]}
+                            graph, (group[max(group.keys())], 1)
                         )
                         training, evaluation = to_signal(
-                            graph, {v: 1 for v in training}
-                        ), to_signal(graph, {v: 1 for v in evaluation})
+                            graph, (training, 1)
+                        ), to_signal(graph, (evaluation, 1))
                     else:
                         training, evaluation = to_signal(
-                            graph, {v: 1 for v in training}
-                        ), to_signal(graph, {v: 1 for v in evaluation})
+                            graph, (training, 1)
+                        ), to_signal(graph, (evaluation, 1))
                     if sensitive is not None:
                         if not multigroup:
                             sensitive_signal = to_signal(training, 1 - evaluation.np)
@@ -1,4 +1,5 @@
 from pygrank.core.typing import *
+from pygrank.core.indexing import *
 from pygrank.core.signals import *
 from pygrank.core.backend import *
 from pygrank.core.utils import *
@@ -9,6 +9,23 @@ from pygrank.core.backend.specification import *
 
 
 _imported_mods = dict()
+_converted_mods = dict()
+_plain_types = {
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    type(None),
+    list,
+    tuple,
+    np.ndarray,
+    np.bool_,
+    np.int32,
+    np.int64,
+    np.float32,
+    np.float64,
+}
 
 
 def safe_div(nom, denom, default=0):
@@ -37,12 +54,58 @@ class Backend:
         return False
 
 
+def _is_plain(arg):
+    # built-in types whose instances are passed to backends as they are, whereas instances of
+    # other types are checked one by one, as they may gain graph signal or matrix attributes
+    if arg.__class__ in _plain_types:
+        return True
+    return not hasattr(arg, "node2id") and not hasattr(arg, "array")
+
+
+def _compatible(arg):
+    if hasattr(arg, "node2id"):  # graph signals
+        return arg.np
+    if hasattr(arg, "array"):
+        return arg.array
+    return arg
+
+
+def _converter(method):
+    if method.__name__ == "conv":
+
+        def conv(x, M):
+            if hasattr(M, "array"):
+                M = M.array
+            if not _is_plain(x):
+                # same as to_signal(x, ...) without importing it in each call
+                signals = sys.modules["pygrank.core.signals"]
+                return signals.GraphSignal(x.graph, method(x.np, M), x.node2id)
+            return method(x, M)
+
+        return conv
+
+    def converted(*args, **kwargs):
+        for arg in args:
+            if not _is_plain(arg):
+                break
+        else:
+            if not kwargs:
+                return method(*args)
+        args = [_compatible(arg) for arg in args]
+        kwargs = {key: _compatible(arg) for key, arg in kwargs.items()}
+        return method(*args, **kwargs)
+
+    converted.__name__ = method.__name__
+    return converted
+
+
 def load_backend(mod_name):
     if mod_name not in [
         "pytorch",
         "numpy",
         "tensorflow",
         "dask",
+        "threaded",
         "torch_sparse",
         "matvec",
         "sparse_dot_mkl",
@@ -53,6 +116,22 @@ def load_backend(mod_name):
     else:
         mod = importlib.import_module(".%s" % mod_name, __name__)
         _imported_mods[mod_name] = mod
+    if mod_name not in _converted_mods:
+        converted_mod = dict()
+        for api in specification.__dict__.keys():
+            if api.startswith("__") or api in [
+                "Iterable",
+                "Optional",
+                "Tuple",
+                "BackendGraph",
+                "BackendPrimitive",
+            ]:
+                continue
+            if api not in mod.__dict__:  # pragma: no cover
+                raise Exception("Missing implementation for " + str(api))
+            converted_mod[api] = _converter(mod.__dict__[api])
+        _converted_mods[mod_name] = converted_mod
+    converted_mod = _converted_mods[mod_name]
     mod_name = ""
     for mod_name_part in __name__.split("."):
         if mod_name:
@@ -60,51 +139,8 @@ def load_backend(mod_name):
         mod_name += mod_name_part
         if mod_name in sys.modules:
             thismod = sys.modules[mod_name]
-            for api in specification.__dict__.keys():
-                if api.startswith("__") or api in [
-                    "Iterable",
-                    "Optional",
-                    "Tuple",
-                    "BackendGraph",
-                    "BackendPrimitive",
-                ]:
-                    continue
-                if api in mod.__dict__:
-
-                    def converter(method):
-                        if method.__name__ == "conv":
-
-                            def conv(x, M):
-                                if hasattr(M, "array"):
-                                    M = M.array
-                                from pygrank import to_signal
-
-                                if x.__class__.__name__ == "GraphSignal":
-                                    return to_signal(x, method(x.np, M))
-                                return method(x, M)
-
-                            return conv
-
-                        def compatible(arg):
-                            if arg.__class__.__name__ == "GraphSignal":
-                                return arg.np
-                            if hasattr(arg, "array"):
-                                return arg.array
-                            return arg
-
-                        def converted(*args, **kwargs):
-                            args = [compatible(arg) for arg in args]
-                            kwargs = {
-                                key: compatible(arg) for key, arg in kwargs.items()
-                            }
-                            return method(*args, **kwargs)
-
-                        converted.__name__ = method.__name__
-                        return converted
-
-                    setattr(thismod, api, converter(mod.__dict__[api]))
-                else:  # pragma: no cover
-                    raise Exception("Missing implementation for " + str(api))
+            for api, method in converted_mod.items():
+                setattr(thismod, api, method)
     mod.backend_init()
 
 
@@ -123,6 +159,7 @@ def get_backend_preference():  # pragma: no cover
     if mod_name not in [
         "tensorflow",
         "dask",
+        "threaded",
         "numpy",
         "pytorch",
         "torch_sparse",
@@ -170,7 +207,7 @@ def _notify_load(mod_name):
         f'The default pygrank backend has been set to "{mod_name}" '
         + "by the file "
         + os.path.join(os.path.expanduser("~"), ".pygrank", "config.json")
-        + '\nSet your preferred backend as one of ["numpy", "pytorch", "tensorflow", "dask", "torch_sparse", "matvec", "sparse_dot_mkl"] '
+        + '\nSet your preferred backend as one of ["numpy", "pytorch", "tensorflow", "dask", "threaded", "torch_sparse", "matvec", "sparse_dot_mkl"] '
         'and "reminder": false in that file to remove this message from future runs.',
         file=sys.stderr,
     )
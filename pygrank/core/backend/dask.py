@@ -0,0 +1,163 @@
+import uuid
+
+import dask
+import dask.array as da
+import numpy as np
+from dask.array import abs, sum, exp, log, min, max, mean, dot, diag, eye, ones
+from scipy.sparse import csr_matrix
+from pygrank.fastgraph.mappedgraph import _row_blocks
+
+_block_entries = 1 << 22
+
+
+class RowBlockedMatrix:
+    """Splits a sparse adjacency matrix into consecutive blocks of rows that hold approximately the same number of
+    non-zero entries. Blocks are sliced lazily from the CSR arrays of the matrix when dask tasks run, so that
+    memory-mapped matrices (e.g. of `pygrank.MappedGraph`) are read one block at a time instead of being loaded
+    in memory. Graph convolutions multiply the transpose of each block with the respective chunk of signals and
+    sum these partial products in a tree.
+    """
+
+    def __init__(self, M, block_entries=_block_entries):
+        # converting csr matrices keeps their (potentially memory-mapped) arrays
+        M = csr_matrix(M) if not hasattr(M, "tocsr") else M.tocsr()
+        self.shape = M.shape
+        self.dtype = M.dtype
+        # an explicit name prevents dask from hashing the whole matrix
+        matrix = dask.delayed(M, name="adjacency-" + str(uuid.uuid4()), traverse=False)
+        bounds = list(_row_blocks(M.indptr, block_entries))
+        self.chunks = tuple(end - start for start, end in bounds)
+        self.blocks = [
+            dask.delayed(_slice_rows)(matrix, start, end) for start, end in bounds
+        ]
+        self.degrees = da.concatenate(
+            [
+                da.from_delayed(
+                    dask.delayed(_block_degrees)(block), shape=(size,), dtype=float
+                )
+                for block, size in zip(self.blocks, self.chunks)
+            ]
+        )
+
+    def __len__(self):
+        return self.shape[0]
+
+
+def _slice_rows(M, start, end):
+    return M[start:end]
+
+
+def _block_degrees(block):
+    return np.asarray(block.sum(axis=1), dtype=float).ravel()
+
+
+def _block_conv(block, signal):
+    return block.T @ signal
+
+
+def cast(x):
+    return x
+
+
+def copy(x):
+    return x.copy()
+
+
+def backend_init():
+    pass
+
+
+def graph_dropout(M, _):
+    return M
+
+
+def separate_cols(x):
+    return [x[:, col_num] for col_num in range(x.shape[1])]
+
+
+def combine_cols(cols):
+    return da.stack([to_array(col) for col in cols], axis=1)
+
+
+def backend_name():
+    return "dask"
+
+
+def scipy_sparse_to_backend(M):
+    return RowBlockedMatrix(M)
+
+
+def to_array(obj, copy_array=False):
+    if isinstance(obj, da.Array):
+        if len(obj.shape) > 1:
+            return obj.squeeze()
+        return obj.copy() if copy_array else obj
+    if obj.__class__.__module__ == "tensorflow.python.framework.ops":
+        obj = obj.numpy()
+    elif obj.__class__.__module__ == "torch":
+        obj = obj.detach().numpy()
+    obj = np.array(obj) if copy_array else np.asarray(obj)
+    if len(obj.shape) > 1:
+        obj = obj.squeeze()
+    return da.from_array(obj, chunks="auto")
+
+
+def to_primitive(obj):
+    if isinstance(obj, da.Array):
+        return obj
+    return da.from_array(np.asarray(obj), chunks="auto")
+
+
+def is_array(obj):
+    return (
+        isinstance(obj, list)
+        or isinstance(obj, np.ndarray)
+        or isinstance(obj, da.Array)
+        or obj.__class__.__module__ == "tensorflow.python.framework.ops"
+        or obj.__class__.__module__ == "torch"
+    )
+
+
+def repeat(value, times):
+    return da.full((times,), value, dtype=float, chunks="auto")
+
+
+def self_normalize(obj):
+    np_sum = da.absolute(obj).sum()
+    return obj / da.where(np_sum != 0, np_sum, 1)
+
+
+def conv(signal, M):
+    signal = to_array(signal) if len(signal.shape) == 1 else da.asarray(signal)
+    # each block of rows multiplies the chunk of signals at the same rows
+    signal = signal.rechunk((M.chunks,) + tuple((dim,) for dim in signal.shape[1:]))
+    products = [
+        da.from_delayed(
+            dask.delayed(_block_conv)(block, chunk),
+            shape=M.shape[1:] + signal.shape[1:],
+            dtype=float,
+        ).rechunk((M.chunks,) + signal.chunks[1:])
+        for block, chunk in zip(M.blocks, signal.to_delayed().ravel())
+    ]
+    # persisting cuts the task graphs of iterative filters at each convolution
+    return da.stack(products).sum(axis=0).persist()
+
+
+def length(x):
+    if not hasattr(x, "shape"):
+        return len(x)
+    if len(x.shape) > 1:
+        return x.shape[0] * x.shape[1]
+    return x.shape[0]
+
+
+def degrees(M):
+    return M.degrees
+
+
+def filter_out(x, exclude):
+    return x[to_array(exclude) == 0].compute_chunk_sizes()
+
+
+def epsilon():
+    return np.finfo(float).eps
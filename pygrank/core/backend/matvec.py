@@ -119,6 +119,8 @@ def self_normalize(obj):
 
 
 def conv(signal, M):
+    if isinstance(signal, np.ndarray) and len(signal.shape) > 1:
+        raise Exception("matvec does not support convolutions of multiple signals")
     return signal * M
 
 
@@ -47,7 +47,7 @@ def to_array(obj, copy_array=False):
 
 
 def to_primitive(obj):
-    return np.array(obj, copy=False)
+    return np.asarray(obj)
 
 
 def is_array(obj):
@@ -67,6 +67,8 @@ def self_normalize(obj):
 
 
 def conv(signal, M):
+    if len(signal.shape) > 1:
+        return M.T @ signal
     return signal @ M
 
 
@@ -98,6 +98,8 @@ def self_normalize(obj):
 
 
 def conv(signal, M):
+    if len(signal.shape) > 1:
+        return torch.sparse.mm(M, signal)
     return torch.mv(M, signal)
 
 
@@ -65,7 +65,7 @@ def to_array(obj, copy_array=False):
 
 
 def to_primitive(obj):
-    return np.array(obj, copy=False)
+    return np.asarray(obj)
 
 
 def is_array(obj):
@@ -87,8 +87,12 @@ def self_normalize(obj):
 def conv(signal, M):
     global __pygrank_sparse_dot_mkl_warning
     if __pygrank_sparse_dot_mkl_warning:
+        if len(signal.shape) > 1:
+            return M.T @ signal
         return signal @ M
     try:
+        if len(signal.shape) > 1:
+            return sparse_dot_mkl.dot_product_mkl(M.T, signal)
         return sparse_dot_mkl.dot_product_mkl(signal, M)
     except Exception as e:
         if not __pygrank_sparse_dot_mkl_warning:
@@ -99,6 +103,8 @@ def conv(signal, M):
                 "Falling back to numpy implementation for this backend."
             )
             warnings.warn(str(e))
+        if len(signal.shape) > 1:
+            return M.T @ signal
         return signal @ M
 
 
@@ -95,6 +95,8 @@ def self_normalize(obj):
 
 
 def conv(signal, M):
+    if len(signal.shape) > 1:
+        return tf.sparse.sparse_dense_matmul(M, signal)
     return tf.reshape(
         tf.sparse.sparse_dense_matmul(M, tf.reshape(signal, (-1, 1))), (-1,)
     )
@@ -0,0 +1,155 @@
+import numpy as np
+from numpy import abs, sum, exp, log, copy, repeat, min, max, dot, mean, diag, ones
+from scipy.sparse import eye, csr_matrix
+from concurrent.futures import ThreadPoolExecutor
+import os
+
+_num_threads = int(os.environ.get("PYGRANK_NUM_THREADS", os.cpu_count() or 1))
+_pool = None
+_min_parallel_entries = 1 << 16  # smaller matrices are multiplied faster by one thread
+
+
+class ThreadedMatrix:
+    """Holds a scipy sparse matrix alongside the blocks of rows of its transpose in CSR format. Blocks
+    hold approximately the same number of non-zero entries and share the arrays of one transposed copy,
+    so that convolutions compute the rows of their outcome in parallel."""
+
+    def __init__(self, M, num_blocks=None):
+        self.matrix = M.tocsr()
+        self.shape = M.shape
+        self.dtype = M.dtype
+        self.blocks = list()
+        num_blocks = _num_threads if num_blocks is None else num_blocks
+        if num_blocks < 2 or M.nnz < _min_parallel_entries:
+            return
+        transposed = M.T.tocsr()
+        indptr = transposed.indptr
+        bounds = np.searchsorted(
+            indptr, np.linspace(0, indptr[-1], num_blocks + 1), side="left"
+        )
+        bounds[0] = 0
+        bounds[-1] = transposed.shape[0]
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            if end <= start:
+                continue
+            first, last = indptr[start], indptr[end]
+            block = csr_matrix(
+                (
+                    transposed.data[first:last],
+                    transposed.indices[first:last],
+                    indptr[start : end + 1] - first,
+                ),
+                shape=(end - start, transposed.shape[1]),
+                copy=False,
+            )
+            self.blocks.append((start, end, block))
+
+    def __len__(self):
+        return self.shape[0]
+
+
+def cast(x):
+    return x
+
+
+def backend_init():
+    global _pool
+    if _pool is None and _num_threads > 1:
+        _pool = ThreadPoolExecutor(max_workers=_num_threads)
+
+
+def graph_dropout(M, _):
+    return M
+
+
+def separate_cols(x):
+    return [x[:, col_num] for col_num in range(x.shape[1])]
+
+
+def combine_cols(cols):
+    return np.column_stack(cols)
+
+
+def backend_name():
+    return "threaded"
+
+
+def scipy_sparse_to_backend(M):
+    return ThreadedMatrix(M)
+
+
+def to_array(obj, copy_array=False):
+    if isinstance(obj, np.ndarray):
+        obj = np.asarray(obj)
+        if copy_array:
+            return np.copy(obj).squeeze()
+        if len(obj.shape) > 1:
+            return obj.squeeze()
+        return obj
+    if obj.__class__.__module__ == "tensorflow.python.framework.ops":
+        return obj.numpy()
+    if obj.__class__.__module__ == "torch":
+        return obj.detach().numpy()
+    return np.array(obj)
+
+
+def to_primitive(obj):
+    return np.asarray(obj)
+
+
+def is_array(obj):
+    return (
+        isinstance(obj, list)
+        or isinstance(obj, np.ndarray)
+        or obj.__class__.__module__ == "tensorflow.python.framework.ops"
+        or obj.__class__.__module__ == "torch"
+    )
+
+
+def self_normalize(obj):
+    np_sum = obj.__abs__().sum()
+    if np_sum != 0:
+        obj = obj / np_sum
+    return obj
+
+
+def conv(signal, M):
+    if not isinstance(M, ThreadedMatrix):
+        if len(signal.shape) > 1:
+            return M.T @ signal
+        return signal @ M
+    if _pool is None or len(M.blocks) < 2:
+        return M.matrix.T @ signal
+    result = np.empty(
+        (M.shape[1],) + signal.shape[1:], dtype=np.result_type(M.dtype, signal.dtype)
+    )
+
+    def multiply(block):
+        start, end, matrix = block
+        result[start:end] = matrix @ signal  # scipy releases the GIL in sparse products
+
+    for _ in _pool.map(multiply, M.blocks):
+        pass
+    return result
+
+
+def length(x):
+    if isinstance(x, np.ndarray):
+        if len(x.shape) > 1:
+            return x.shape[0] * x.shape[1]
+        return x.shape[0]
+    return len(x)
+
+
+def degrees(M):
+    if isinstance(M, ThreadedMatrix):
+        M = M.matrix
+    return np.asarray(sum(M, axis=1)).ravel()
+
+
+def filter_out(x, exclude):
+    return x[exclude == 0]
+
+
+def epsilon():
+    return np.finfo(float).eps
@@ -109,6 +109,8 @@ def self_normalize(obj):
 
 
 def conv(signal, M):
+    if len(signal.shape) > 1:
+        return torch_sparse.spmm(M.index, M.values, M.shape[0], M.shape[1], signal)
     signal = torch.reshape(signal, (-1, 1))
     return torch.ravel(
         torch_sparse.spmm(M.index, M.values, M.shape[0], M.shape[1], signal)
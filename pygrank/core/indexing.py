@@ -0,0 +1,220 @@
+from collections.abc import Mapping
+from itertools import islice
+from typing import Iterable, Optional
+import numpy as np
+
+
+class NodeIndex(Mapping):
+    """
+    An immutable map from graph nodes to their positions inside graph signal arrays. One index is shared by all
+    signals of the same graph, and its representation depends on node labels: nodes 0,1,...,n-1 are stored only
+    through their number, other integer labels are stored as sorted numpy arrays, and remaining labels are
+    stored in a dictionary. Dictionaries already held by graphs (e.g. the node maps of `pygrank.Graph`) are
+    reused without copies. Obtain indexes with `pygrank.node_index(graph)` instead of constructing them.
+
+    Example:
+        >>> import pygrank as pg
+        >>> graph = pg.Graph()
+        >>> graph.add_edges_from(["A", "B"], ["B", "C"])
+        >>> index = pg.node_index(graph)
+        >>> print(index["B"], index.ids_of(["C", "A"]), index.nodes_of([1, 2]))
+        1 [2 0] ['B' 'C']
+    """
+
+    def __init__(
+        self, nodes: Optional[Iterable] = None, node2id: Optional[Mapping] = None
+    ):
+        """
+        Args:
+            nodes: An iterable of graph nodes in the order of their positions. Ignored if *node2id* is provided.
+            node2id: Optional. An existing map from nodes to positions 0,1,...,n-1 in insertion order. Maps that
+                only grow by appending nodes can be used, as nodes added after index construction are ignored.
+        """
+        self._node2id = None
+        self._nodes = None
+        self._sorted = None
+        self._order = None
+        if node2id is not None:
+            self._node2id = node2id
+            self._length = len(node2id)
+            return
+        if isinstance(nodes, range) and nodes.start == 0 and nodes.step == 1:
+            self._length = len(nodes)
+            return
+        nodes = list(nodes)
+        self._length = len(nodes)
+        labels = None
+        if all(
+            isinstance(node, (int, np.integer)) and not isinstance(node, bool)
+            for node in nodes
+        ):
+            try:
+                labels = np.asarray(nodes, dtype=np.int64)
+            except OverflowError:
+                pass
+        if labels is not None:
+            if not np.array_equal(labels, np.arange(len(labels))):
+                self._nodes = labels
+                self._order = np.argsort(labels, kind="stable")
+                self._sorted = labels[self._order]
+        else:
+            self._node2id = {node: i for i, node in enumerate(nodes)}
+            self._nodes = np.fromiter(nodes, dtype=object, count=len(nodes))
+
+    @property
+    def nodes(self) -> np.ndarray:
+        """A numpy array of all indexed nodes in the order of their positions."""
+        if self._nodes is None:
+            if self._node2id is None:
+                return np.arange(self._length)
+            self._nodes = np.fromiter(self, dtype=object, count=self._length)
+        return self._nodes
+
+    def __getitem__(self, node) -> int:
+        if self._node2id is not None:
+            position = self._node2id[node]
+            if position >= self._length:
+                raise KeyError(node)
+            return position
+        if not isinstance(node, (int, np.integer)) or isinstance(node, bool):
+            raise KeyError(node)
+        if self._sorted is None:
+            if node < 0 or node >= self._length:
+                raise KeyError(node)
+            return int(node)
+        position = int(np.searchsorted(self._sorted, node))
+        if position == self._length or self._sorted[position] != node:
+            raise KeyError(node)
+        return int(self._order[position])
+
+    def __contains__(self, node) -> bool:
+        try:
+            self[node]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        if self._node2id is not None:
+            return islice(iter(self._node2id), self._length)
+        if self._sorted is None:
+            return iter(range(self._length))
+        return iter(self._nodes.tolist())
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __eq__(self, other):
+        return self is other or super().__eq__(other)
+
+    __hash__ = object.__hash__
+
+    def ids_of(self, nodes: Iterable) -> np.ndarray:
+        """
+        Finds the positions of many nodes at once.
+
+        Args:
+            nodes: An iterable of indexed nodes.
+        Returns:
+            A numpy array of the nodes' positions.
+
+        Example:
+            >>> import pygrank as pg
+            >>> graph = ...
+            >>> positions = pg.node_index(graph).ids_of(["A", "C"])
+        """
+        if not isinstance(nodes, (list, np.ndarray)):
+            nodes = list(nodes)
+        if self._node2id is not None:
+            positions = np.fromiter(
+                (self._node2id[node] for node in nodes),
+                dtype=np.int64,
+                count=len(nodes),
+            )
+            if len(positions) and positions.max() >= self._length:
+                raise KeyError(nodes[int(np.argmax(positions >= self._length))])
+            return positions
+        labels = np.asarray(nodes)
+        if labels.size == 0:
+            return np.zeros(0, dtype=np.int64)
+        if labels.dtype.kind not in "iu":
+            raise KeyError(labels.flat[0])
+        labels = labels.astype(np.int64, copy=False)
+        if self._sorted is None:
+            missing = (labels < 0) | (labels >= self._length)
+            if missing.any():
+                raise KeyError(int(labels[missing][0]))
+            return labels
+        positions = np.minimum(np.searchsorted(self._sorted, labels), self._length - 1)
+        missing = self._sorted[positions] != labels
+        if missing.any():
+            raise KeyError(int(labels[missing][0]))
+        return self._order[positions]
+
+    def nodes_of(self, ids: Iterable[int]) -> np.ndarray:
+        """
+        Finds the nodes residing at many positions at once.
+
+        Args:
+            ids: An iterable of node positions.
+        Returns:
+            A numpy array of respective nodes.
+
+        Example:
+            >>> import numpy as np
+            >>> signal = ...
+            >>> nonzero_nodes = signal.node2id.nodes_of(np.nonzero(signal.np)[0])
+        """
+        if not isinstance(ids, (list, np.ndarray)):
+            ids = list(ids)
+        ids = np.asarray(ids, dtype=np.int64)
+        if self._node2id is None and self._sorted is None:
+            if ids.size and (ids.min() < 0 or ids.max() >= self._length):
+                raise IndexError("Node positions out of range")
+            return ids
+        return self.nodes[ids]
+
+    def _describes(self, graph) -> bool:
+        if len(graph) != self._length:
+            return False
+        # networkx graphs append re-added nodes to the end of their node dictionaries
+        graph_nodes = getattr(graph, "_node", None)
+        if isinstance(graph_nodes, dict) and graph_nodes:
+            return self.get(next(reversed(graph_nodes)), -1) == self._length - 1
+        return True
+
+
+def node_index(graph) -> NodeIndex:
+    """
+    Retrieves the node index shared by all signals of a graph. Indexes are created on first use and kept by
+    graphs, so that new signals do not create new maps from nodes to positions. Indexes are recreated
+    when graph nodes change.
+
+    Args:
+        graph: A graph, the outcome of a `pygrank.preprocessor`, or a matrix whose rows correspond to nodes.
+    Returns:
+        A `pygrank.NodeIndex` instance.
+
+    Example:
+        >>> import pygrank as pg
+        >>> graph = ...
+        >>> print(pg.node_index(graph) is pg.to_signal(graph, None).node2id)
+        True
+    """
+    index = getattr(graph, "_pygrank_node2id", None)  # obtained from preprocessing
+    if index is not None:
+        return index if isinstance(index, NodeIndex) else NodeIndex(node2id=index)
+    if hasattr(graph, "shape"):  # externally defined type
+        return NodeIndex(range(graph.shape[0]))
+    index = getattr(graph, "_pygrank_node_index", None)
+    if index is not None and index._describes(graph):
+        return index
+    node_map = getattr(graph, "node_map", None)
+    index = (
+        NodeIndex(node2id=node_map) if isinstance(node_map, dict) else NodeIndex(graph)
+    )
+    try:
+        graph._pygrank_node_index = index
+    except AttributeError:  # pragma: no cover
+        pass
+    return index
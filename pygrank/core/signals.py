@@ -1,9 +1,11 @@
 from collections.abc import MutableMapping
 
-import networkx as nx
+import numpy as np
 
 from pygrank.core import backend
 from pygrank.core.typing import GraphSignalGraph, GraphSignalData
+from pygrank.core.indexing import NodeIndex, node_index
+from pygrank.fastgraph.fastgraph import Graph
 from typing import Optional, Mapping
 
 
@@ -17,7 +19,8 @@ class GraphSignal(MutableMapping):
     Attributes:
         graph: Explicit reference to the graph object the signal is tied to.
         np: A numpy array holding a vector representation of the signal. Editing this also edits node values.
-        node2id: A map from graph nodes to their position inside the above-described numpy array.
+        node2id: A `pygrank.NodeIndex` from graph nodes to their position inside the above-described numpy array.
+            All signals of the same graph share the same index.
 
     Example:
         >>> import pygrank as pg
@@ -44,17 +47,14 @@ class GraphSignal(MutableMapping):
         """Should **ALWAYS** instantiate graph signals with the method to_signal,
         which handles non-instantiation semantics."""
 
-        if node2id is not None:
+        if node2id is None:
+            self.node2id = node_index(graph)
+        elif isinstance(node2id, NodeIndex):
             self.node2id = node2id
-        elif hasattr(graph, "_pygrank_node2id"):  # obtained from preprocessing
-            self.node2id = graph._pygrank_node2id
-        elif hasattr(graph, "shape"):  # externally defined type
-            self.node2id = {i: i for i in range(graph.shape[0])}
-        else:  # this is the case where it is an actual graph
-            self.node2id = {v: i for i, v in enumerate(graph)}
+        else:
+            self.node2id = NodeIndex(node2id=node2id)
         self.graph = graph
-        # self.node2id = ({i: i for i in range(graph.shape[0])} if hasattr(graph, "shape")
-        #                else {v: i for i, v in enumerate(graph)}) if node2id is None else node2id
+        self._version = 0  # counts edits through assignments, so that computations derived from signals can be cached
         graph_len = graph.shape[0] if hasattr(graph, "shape") else len(graph)
         if backend.is_array(obj):
             if graph_len != backend.length(obj):
@@ -70,11 +70,20 @@ class GraphSignal(MutableMapping):
         else:
             import numpy as np
 
+            if isinstance(obj, tuple):
+                nodes, values = obj
+                values = np.asarray(values, dtype=float)
+                if len(values.shape) != 0 and len(values) != len(nodes):
+                    raise Exception(
+                        "Graph signal node and value arrays should have the same length"
+                    )
+            else:
+                nodes = list(obj.keys())
+                values = np.fromiter(obj.values(), dtype=float, count=len(nodes))
             self._np = np.repeat(
                 0.0, graph_len
             )  # tensorflow does not initialize editing of eager tensors
-            for key, value in obj.items():
-                self[key] = value
+            self._np[self.node2id.ids_of(nodes)] = values
             self._np = backend.to_array(
                 self._np
             )  # make all operations with numpy and then potentially switch to tensorflow
@@ -99,15 +108,18 @@ class GraphSignal(MutableMapping):
     @np.setter
     def np(self, value):
         self._np = backend.to_array(self.__compliant_value(value))
+        self._version += 1
 
     def __getitem__(self, key):
         return float(self._np[self.node2id[key]])
 
     def __setitem__(self, key, value):
         self._np[self.node2id[key]] = float(value)
+        self._version += 1
 
     def __delitem__(self, key):
         self._np[self.node2id[key]] = 0
+        self._version += 1
 
     def __iter__(self):
         return iter(self.node2id)
@@ -124,6 +136,12 @@ class GraphSignal(MutableMapping):
             return other.np
         return other
 
+    def __eq__(self, other):
+        if isinstance(other, GraphSignal) and other.node2id is self.node2id:
+            # signals sharing node indexes are compared without per-node lookups
+            return bool(np.array_equal(np.asarray(self.np), np.asarray(other.np)))
+        return super().__eq__(other)
+
     def __str__(self):
         return "{" + (", ".join(repr(k) + ": " + str(v) for k, v in self.items())) + "}"
 
@@ -230,6 +248,244 @@ class GraphSignal(MutableMapping):
             self._np = backend.self_normalize(self._np)
         return self
 
+    def top(self, k: int):
+        """
+        Finds the nodes with the highest values in linear time with respect to the number of graph nodes. Ties
+        are broken in favor of nodes residing earlier in the signal, as happens when stably sorting all values.
+
+        Args:
+            k: The number of nodes to find. If greater than the number of graph nodes, all nodes are returned.
+        Returns:
+            A numpy array of the positions of the top nodes and a backend array of their values, both in descending
+            order of values. Obtain the respective nodes with `signal.node2id.nodes_of(positions)`.
+
+        Example:
+            >>> import pygrank as pg
+            >>> graph, personalization = ...
+            >>> ranks = pg.PageRank()(graph, personalization)
+            >>> positions, scores = ranks.top(10)
+            >>> top_nodes = ranks.node2id.nodes_of(positions)
+        """
+        values = np.asarray(self.np, dtype=float)
+        positions = _top_positions(values, k)
+        return positions, backend.to_array(values[positions])
+
+
+def _top_positions(values, k):
+    k = max(0, min(int(k), len(values)))
+    if k == 0:
+        return np.zeros(0, dtype=np.int64)
+    if k < len(values):
+        candidates = np.argpartition(-values, k - 1)[:k]
+        threshold = values[candidates].min()
+        # argpartition picks arbitrary ties of the k-th value, so these are replaced by the earliest ones
+        above = np.nonzero(values > threshold)[0]
+        ties = np.nonzero(values == threshold)[0][: k - len(above)]
+        positions = np.concatenate((above, ties))
+    else:
+        positions = np.arange(len(values))
+    return positions[np.lexsort((positions, -values[positions]))]
+
+
+class SparseGraphSignal(GraphSignal):
+    """
+    A graph signal that stores only the positions and values of its non-zero nodes, so that its memory
+    depends on the number of non-zeros instead of the number of graph nodes. Sparse signals can be used
+    wherever graph signals are expected, for example as personalization of graph filters or as known scores
+    of measures. Their *np* attribute creates a dense backend copy on each access, which is read-only if it
+    is a numpy array, and assigning to it switches them to dense storage. Hence, edit values through nodes (e.g. `signal["A"] = 1`) or by assigning
+    to *np* (e.g. `signal.np = signal.np / 2`) instead of editing *np* in-place.
+
+    Attributes:
+        nonzero_ids: A sorted numpy array of the positions of non-zero nodes, or None after switching to dense storage.
+        nonzero_values: A numpy array of the respective values, or None after switching to dense storage.
+
+    Example:
+        >>> import pygrank as pg
+        >>> graph = ...
+        >>> seeds = pg.to_sparse_signal(graph, {"A": 1, "B": 2})
+        >>> print(seeds.nonzero_ids, seeds.nonzero_values, seeds["B"])
+        [0 1] [1. 2.] 2.0
+        >>> ranks = pg.PageRank()(seeds)
+    """
+
+    def __init__(
+        self,
+        graph: GraphSignalGraph,
+        obj: GraphSignalData,
+        node2id: Optional[Mapping[object, int]] = None,
+    ):
+        """Should **ALWAYS** instantiate sparse graph signals with the method to_sparse_signal."""
+        if node2id is None:
+            self.node2id = node_index(graph)
+        elif isinstance(node2id, NodeIndex):
+            self.node2id = node2id
+        else:
+            self.node2id = NodeIndex(node2id=node2id)
+        self.graph = graph
+        self._version = 0
+        self._dense = None
+        if isinstance(obj, GraphSignal):
+            obj = obj.np
+        if backend.is_array(obj):
+            values = np.asarray(obj, dtype=float).ravel()
+            if len(values) != len(self.node2id):
+                raise Exception(
+                    "Graph signal array dimensions "
+                    + str(len(values))
+                    + " should be equal to graph nodes "
+                    + str(len(self.node2id))
+                )
+            ids = np.nonzero(values)[0]
+            values = values[ids]
+        else:
+            if isinstance(obj, tuple):
+                nodes, values = obj
+            elif isinstance(obj, Mapping):
+                nodes, values = list(obj.keys()), list(obj.values())
+            else:
+                nodes, values = list(obj), 1.0
+            ids = self.node2id.ids_of(nodes)
+            values = np.asarray(values, dtype=float)
+            if len(values.shape) == 0:
+                values = np.repeat(float(values), len(ids))
+            elif len(values) != len(ids):
+                raise Exception(
+                    "Graph signal node and value arrays should have the same length"
+                )
+            # keep the last value of repeated nodes, as dense assignment does
+            order = np.argsort(ids, kind="stable")
+            ids, values = ids[order], values[order]
+            last = np.append(ids[1:] != ids[:-1], True) if len(ids) else ids
+            ids, values = ids[last], values[last]
+            # zero values are not stored, so that stored entries are always the signal's support
+            nonzero = values != 0
+            ids, values = ids[nonzero], values[nonzero]
+        self.nonzero_ids = ids.astype(np.int64)
+        self.nonzero_values = values
+
+    @property
+    def _np(self):
+        if self._dense is not None:
+            return self._dense
+        dense = np.zeros(len(self.node2id))
+        dense[self.nonzero_ids] = self.nonzero_values
+        dense = backend.to_array(dense)
+        if isinstance(dense, np.ndarray):
+            # in-place edits of the copy would be lost, so make them raise errors
+            dense.setflags(write=False)
+        # arrays of other backends cannot be made read-only, so their in-place edits are silently lost
+        return dense
+
+    @_np.setter
+    def _np(self, value):
+        self._dense = value
+        self.nonzero_ids = None
+        self.nonzero_values = None
+
+    def _position(self, key):
+        position = self.node2id[key]
+        return position, int(np.searchsorted(self.nonzero_ids, position))
+
+    def __getitem__(self, key):
+        if self._dense is not None:
+            return super().__getitem__(key)
+        position, i = self._position(key)
+        if i < len(self.nonzero_ids) and self.nonzero_ids[i] == position:
+            return float(self.nonzero_values[i])
+        return 0.0
+
+    def __setitem__(self, key, value):
+        if self._dense is not None:
+            return super().__setitem__(key, value)
+        self._version += 1
+        position, i = self._position(key)
+        if i < len(self.nonzero_ids) and self.nonzero_ids[i] == position:
+            if float(value) == 0:
+                self.nonzero_ids = np.delete(self.nonzero_ids, i)
+                self.nonzero_values = np.delete(self.nonzero_values, i)
+            else:
+                self.nonzero_values[i] = float(value)
+        elif float(value) != 0:
+            self.nonzero_ids = np.insert(self.nonzero_ids, i, position)
+            self.nonzero_values = np.insert(self.nonzero_values, i, float(value))
+
+    def __delitem__(self, key):
+        if self._dense is not None:
+            return super().__delitem__(key)
+        self._version += 1
+        position, i = self._position(key)
+        if i < len(self.nonzero_ids) and self.nonzero_ids[i] == position:
+            self.nonzero_ids = np.delete(self.nonzero_ids, i)
+            self.nonzero_values = np.delete(self.nonzero_values, i)
+
+    def __eq__(self, other):
+        if (
+            isinstance(other, SparseGraphSignal)
+            and other.node2id is self.node2id
+            and self._dense is None
+            and other._dense is None
+        ):
+            return bool(
+                np.array_equal(self.nonzero_ids, other.nonzero_ids)
+                and np.array_equal(self.nonzero_values, other.nonzero_values)
+            )
+        return super().__eq__(other)
+
+    def _from_ids(self, ids, values):
+        """Creates a sparse signal of the same graph from node positions and their values, without looking up
+        nodes in the node index."""
+        order = np.argsort(ids, kind="stable")
+        ids, values = np.asarray(ids, dtype=np.int64)[order], values[order]
+        nonzero = values != 0
+        signal = SparseGraphSignal.__new__(SparseGraphSignal)
+        signal.node2id = self.node2id
+        signal.graph = self.graph
+        signal._dense = None
+        signal.nonzero_ids = ids[nonzero]
+        signal.nonzero_values = values[nonzero]
+        return signal
+
+    def _scaled(self, factor):
+        return self._from_ids(self.nonzero_ids, self.nonzero_values * factor)
+
+    def __mul__(self, other):
+        if self._dense is None and isinstance(other, (int, float, np.number)):
+            return self._scaled(float(other))
+        return super().__mul__(other)
+
+    def __rmul__(self, other):
+        if self._dense is None and isinstance(other, (int, float, np.number)):
+            return self._scaled(float(other))
+        return super().__rmul__(other)
+
+    def __truediv__(self, other):
+        if self._dense is None and isinstance(other, (int, float, np.number)):
+            return self._scaled(1.0 / float(other))
+        return super().__truediv__(other)
+
+    def __neg__(self):
+        if self._dense is None:
+            return self._scaled(-1.0)
+        return super().__neg__()
+
+    def normalized(self, normalize=True, copy=True):
+        if self._dense is not None:
+            return super().normalized(normalize, copy)
+        ret = self._scaled(1.0) if copy else self
+        if normalize:
+            norm = np.abs(ret.nonzero_values).sum()
+            if norm != 0:
+                ret.nonzero_values = ret.nonzero_values / norm
+        return ret
+
+    def top(self, k: int):
+        if self._dense is None and np.count_nonzero(self.nonzero_values > 0) >= int(k):
+            # positive non-zeros are larger than all implicit zeros
+            positions = _top_positions(self.nonzero_values, k)
+            return self.nonzero_ids[positions], backend.to_array(self.nonzero_values[positions])
+        return super().top(k)
+
 
 class NodeRanking(object):
     """
@@ -352,7 +608,16 @@ def to_signal(graph: GraphSignalGraph, obj: GraphSignalData) -> GraphSignal:
         obj: Either a numpy array or a hashmap between graph nodes and their values, in which cases the appropriate
             GraphSignal constructor is called, or a GraphSignal in which case it is also returned and a check is
             performed that these are signals on the same graph. If None, this argument induces a graph signal
-            of ones.
+            of ones. This can also be a tuple (nodes, values) of an iterable of graph nodes and either a respective
+            array of values or one value for all of them; nodes are located with one lookup of
+            `pygrank.NodeIndex.ids_of`, which is the fastest way to create signals for many nodes. Lists and sets
+            of nodes that are not graph-sized are converted to signals assigning ones to their nodes.
+
+    Example:
+        >>> import pygrank as pg
+        >>> graph = ...
+        >>> seeds = pg.to_signal(graph, (["A", "B", "C"], [1, 2, 1]))
+        >>> uniform = pg.to_signal(graph, (["A", "B", "C"], 1))
     """
     if obj is None and graph is None:
         raise Exception("Cannot create signal from two None arguments")
@@ -370,7 +635,7 @@ def to_signal(graph: GraphSignalGraph, obj: GraphSignalData) -> GraphSignal:
     elif backend.is_array(graph):
         raise Exception("Graph cannot be an array")
     if (isinstance(obj, list) or isinstance(obj, set)) and len(obj) != len(graph):
-        obj = {v: 1 for v in obj}
+        obj = (list(obj), 1.0)
     if isinstance(obj, GraphSignal):
         if id(graph) != id(obj.graph):
             raise Exception("Graph signal tied to a different graph")
@@ -378,4 +643,51 @@ def to_signal(graph: GraphSignalGraph, obj: GraphSignalData) -> GraphSignal:
     return GraphSignal(graph, obj, known_node2id)
 
 
-no_signal = GraphSignal(nx.Graph(), list())
+def to_sparse_signal(graph: GraphSignalGraph, obj: GraphSignalData) -> GraphSignal:
+    """
+    Converts an object to a `pygrank.SparseGraphSignal` that stores only non-zero node values. This accepts
+    the same arguments as `pygrank.to_signal`, but also converts dense graph signals to sparse ones and
+    does not accept None objects. Prefer sparse signals for personalizations and splits with few non-zero
+    nodes on large graphs, for example when keeping many of them in memory.
+
+    Args:
+        graph: Either a graph, a GraphSignal, or the outcome of a `pygrank.preprocessor`. If a GraphSignal is
+            provided, its underlying graph and node index are used. If None, the second argument needs to be
+            a GraphSignal.
+        obj: Either an array of values for all graph nodes, a hashmap between graph nodes and their values,
+            a tuple (nodes, values) similarly to `pygrank.to_signal`, an iterable of nodes to assign ones to,
+            or a GraphSignal whose non-zero values are kept.
+
+    Example:
+        >>> import pygrank as pg
+        >>> graph = ...
+        >>> seeds = pg.to_sparse_signal(graph, ["A", "B"])
+    """
+    if obj is None:
+        raise Exception("Sparse graph signals cannot be created from None objects")
+    if (
+        isinstance(obj, SparseGraphSignal)
+        and obj.nonzero_ids is not None
+        and (graph is None or id(graph) == id(obj.graph))
+    ):
+        return obj
+    known_node2id = None
+    if graph is None:
+        if not isinstance(obj, GraphSignal):
+            raise Exception("None graph allowed only for explicit graph signal input")
+        graph = obj.graph
+    if isinstance(graph, GraphSignal):
+        known_node2id = graph.node2id
+        graph = graph.graph
+    elif backend.is_array(graph):
+        raise Exception("Graph cannot be an array")
+    if (isinstance(obj, list) or isinstance(obj, set)) and len(obj) != len(graph):
+        obj = (list(obj), 1.0)
+    if isinstance(obj, GraphSignal):
+        if id(graph) != id(obj.graph):
+            raise Exception("Graph signal tied to a different graph")
+        known_node2id = obj.node2id
+    return SparseGraphSignal(graph, obj, known_node2id)
+
+
+no_signal = GraphSignal(Graph(), list())
@@ -1,9 +1,12 @@
-import networkx as nx
 import numpy as np
 import scipy
 from pygrank.core import backend
-from pygrank.fastgraph import fastgraph
+from pygrank.core.indexing import node_index
+from pygrank.fastgraph import fastgraph, mappedgraph
+import hashlib
+from itertools import islice
 import uuid
+import os
 
 
 class Adjacency:
@@ -58,20 +61,117 @@ def eigdegree(M):
     return eig / (v * v)
 
 
+def _callable_name(method):
+    name = getattr(method, "__name__", None)
+    if name is None or name == "<lambda>":
+        raise Exception(
+            "Preprocessing can only be cached for named normalization and reduction methods"
+        )
+    return method.__module__ + "." + name
+
+
+def _preprocessing_hash(
+    G, normalization, weight, renormalize, reduction, cache_key=None
+):
+    """
+    Creates a hash of a graph's contents (its node order and its edges) and of preprocessing settings.
+    Edges are hashed from the arrays that fastgraph graphs already store, or are streamed from networkx graphs
+    in chunks. If a *cache_key* is provided, it is hashed in place of graph contents.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(
+        repr(
+            [
+                (
+                    normalization
+                    if isinstance(normalization, str)
+                    else _callable_name(normalization)
+                ),
+                _callable_name(reduction),
+                weight,
+                float(renormalize),
+                G.is_directed(),
+            ]
+        ).encode()
+    )
+    if cache_key is not None:
+        hasher.update(repr(cache_key).encode())
+        return hasher.hexdigest()
+    hasher.update(repr([len(G), G.number_of_edges()]).encode())
+    for node in G:
+        hasher.update(repr(node).encode())
+        hasher.update(b"\0")
+    if isinstance(G, fastgraph.Graph):
+        if isinstance(G, mappedgraph.MappedGraph):
+            arrays = [G.indptr, G.indices, G.data]
+        else:
+            arrays = [G.edge_row, G.edge_col]
+            if G._masked_out:
+                arrays.append(G._masked_edges())
+        for array in arrays:
+            hasher.update(np.ascontiguousarray(array).tobytes())
+            hasher.update(b"\0")
+    else:
+        edges = iter(G.edges(data=weight, default=1))
+        chunk = list(islice(edges, 1 << 16))
+        while chunk:
+            hasher.update(repr(chunk).encode())
+            chunk = list(islice(edges, 1 << 16))
+    return hasher.hexdigest()
+
+
+def _load_cached_matrix(path):
+    if not os.path.isdir(path):
+        return None
+    shape = tuple(np.load(os.path.join(path, "shape.npy")))
+    sparse_array = os.path.exists(os.path.join(path, "array.npy"))
+    return (scipy.sparse.csr_array if sparse_array else scipy.sparse.csr_matrix)(
+        (
+            np.load(os.path.join(path, "data.npy"), mmap_mode="r"),
+            np.load(os.path.join(path, "indices.npy"), mmap_mode="r"),
+            np.load(os.path.join(path, "indptr.npy"), mmap_mode="r"),
+        ),
+        shape=shape,
+    )
+
+
+def _save_cached_matrix(path, M):
+    original, M = M, scipy.sparse.csr_matrix(M)
+    temp_path = path + "." + str(uuid.uuid4()) + ".tmp"
+    os.makedirs(temp_path)
+    np.save(os.path.join(temp_path, "data.npy"), M.data)
+    np.save(os.path.join(temp_path, "indices.npy"), M.indices)
+    np.save(os.path.join(temp_path, "indptr.npy"), M.indptr)
+    np.save(os.path.join(temp_path, "shape.npy"), np.array(M.shape))
+    if isinstance(original, scipy.sparse.sparray):
+        # marks that the matrix is loaded as an array
+        np.save(os.path.join(temp_path, "array.npy"), np.array(True))
+    try:
+        os.replace(temp_path, path)
+    except OSError:  # another process has already cached the same matrix
+        for file in os.listdir(temp_path):
+            os.remove(os.path.join(temp_path, file))
+        os.rmdir(temp_path)
+
+
 def to_sparse_matrix(
     G,
     normalization="auto",
     weight="weight",
     renormalize=False,
-    reduction=backend.degrees,
+    reduction=None,
     transform_adjacency=lambda x: x,
     cors=False,
+    cache_dir=None,
+    cache_key=None,
 ):
     """Used to normalize a graph and produce a sparse matrix representation.
 
     Args:
         G: A networkx or fastgraph graph. If an object with a "shape" attribute is provided (which means that it
-            is backend matrix) then it is directly returned.
+            is backend matrix) then it is directly returned. Memory-mapped graphs (`pygrank.MappedGraph`) are
+            normalized out-of-core into memory-mapped arrays for the "none", "col", "symmetric" and "both"
+            normalizations when no renormalization and the default degree reduction are used.
         normalization: Optional. The type of normalization can be "none", "col", "symmetric", "laplacian", "both",
             or "auto" (default). The last one selects the type of normalization between "col" and "symmetric",
             depending on whether the graph is directed or not respectively. Alternatively, this could be a callable,
@@ -82,7 +182,7 @@ def to_sparse_matrix(
             ensure iteration stability by shrinking the graph's spectrum. Default is False. Can provide anything that
             can be cast to a float to regularize the renormalization.
         reduction: Optional. Controls how degrees are calculated from a callable (e.g. `pygrank.eigdegree`
-            for entropy-preserving transition matrices [li2011link]). Default is `pygrank.degrees`.
+            for entropy-preserving transition matrices [li2011link]). Default is None, which uses `pygrank.degrees`.
         cors: Optional.<details><summary>Cross-origin resource (shared between backends). Default is false.</summary>
             If True, it enriches backend primitives
             holding the outcome of graph preprocessing with additional private metadata that enable their
@@ -97,6 +197,14 @@ def to_sparse_matrix(
             among backends that use them. Enabling *cors* and then visiting up to two backends out of which one is
             "numpy", does not affect the maximum memory consumption by code processing one graph.
             </details>
+        cache_dir: Optional. A directory in which normalized adjacency matrices are persistently stored as
+            memory-mappable numpy arrays. These are keyed by a hash of graph contents (node order and edges) and
+            of the *normalization*, *weight*, *renormalize*, and *reduction* arguments, so that new processes
+            can skip preprocessing of the same graphs. The *transform_adjacency* argument is not part of the key,
+            as it is applied after loading. Default is None, which performs no caching.
+        cache_key: Optional. A hashable identifier of the graph's contents (e.g., a dataset name and version)
+            that keys *cache_dir* entries in place of a hash of graph contents. This skips reading graph edges
+            when cached matrices exist, but the key should change whenever the graph changes. Default is None.
     """
     if hasattr(G, "__pygrank_preprocessed"):
         if backend.backend_name() in G.__pygrank_preprocessed:
@@ -112,57 +220,87 @@ def to_sparse_matrix(
         ret._pygrank_node2id = G._pygrank_node2id
         return ret
     with backend.Backend("numpy"):
+        # the default is resolved here, as defaults bound on import belong to the backend loaded then
+        default_reduction = reduction is None or reduction is backend.degrees
+        if reduction is None:
+            reduction = backend.degrees
         normalization = (
             normalization.lower() if isinstance(normalization, str) else normalization
         )
         if normalization == "auto":
             normalization = "col" if G.is_directed() else "symmetric"
-        M = (
-            G.to_scipy_sparse_array()
-            if isinstance(G, fastgraph.Graph)
-            else nx.to_scipy_sparse_array(G, weight=weight, dtype=float)
+        cache_path = (
+            None
+            if cache_dir is None
+            else os.path.join(
+                cache_dir,
+                _preprocessing_hash(
+                    G, normalization, weight, renormalize, reduction, cache_key
+                ),
+            )
         )
-        renormalize = float(renormalize)
-        left_reduction = reduction  # (lambda x: backend.degrees(x)) if reduction == "sum" else reduction
-        right_reduction = lambda x: left_reduction(x.T)
-        if renormalize != 0:
-            M = M + scipy.sparse.eye(M.shape[0]).tocsr() * renormalize
-        if normalization == "col":
-            S = np.array(left_reduction(M)).flatten()
-            S[S != 0] = 1.0 / S[S != 0]
-            Q = scipy.sparse.spdiags(S.T, 0, *M.shape, format="csr").tocsr()
-            M = Q @ M
-        elif normalization == "laplacian":
-            S = np.array(np.sqrt(left_reduction(M))).flatten()
-            S[S != 0] = 1.0 / S[S != 0]
-            Qleft = scipy.sparse.spdiags(S.T, 0, *M.shape, format="csr").tocsr()
-            S = np.array(np.sqrt(right_reduction(M))).flatten()
-            S[S != 0] = 1.0 / S[S != 0]
-            Qright = scipy.sparse.spdiags(S.T, 0, *M.shape, format="csr").tocsr()
-            M = Qleft @ M @ Qright
-            M = -M + scipy.sparse.eye(M.shape[0]).tocsr()
-        elif normalization == "both":
-            S = np.array(left_reduction(M)).flatten()
-            S[S != 0] = 1.0 / S[S != 0]
-            Qleft = scipy.sparse.spdiags(S.T, 0, *M.shape, format="csr").tocsr()
-            S = np.array(right_reduction(M)).flatten()
-            S[S != 0] = 1.0 / S[S != 0]
-            Qright = scipy.sparse.spdiags(S.T, 0, *M.shape, format="csr").tocsr()
-            M = Qleft @ M @ Qright
-        elif normalization == "symmetric":
-            S = np.array(np.sqrt(left_reduction(M))).flatten()
-            S[S != 0] = 1.0 / S[S != 0]
-            Qleft = scipy.sparse.spdiags(S.T, 0, *M.shape, format="csr").tocsr()
-            S = np.array(np.sqrt(right_reduction(M))).flatten()
-            S[S != 0] = 1.0 / S[S != 0]
-            Qright = scipy.sparse.spdiags(S.T, 0, *M.shape, format="csr").tocsr()
-            M = Qleft @ M @ Qright
-        elif callable(normalization):
-            M = normalization(M)
-        elif normalization != "none":
-            raise Exception(
-                "Supported normalizations: none, col, symmetric, both, laplacian, auto"
+        M = None if cache_path is None else _load_cached_matrix(cache_path)
+        if (
+            M is None
+            and isinstance(G, mappedgraph.MappedGraph)
+            and float(renormalize) == 0
+            and default_reduction
+            and normalization in ["none", "col", "symmetric", "both"]
+        ):
+            M = G.to_normalized_scipy_sparse_array(normalization)
+        if M is None:
+            if not isinstance(G, fastgraph.Graph):
+                import networkx as nx
+            M = (
+                G.to_scipy_sparse_array()
+                if isinstance(G, fastgraph.Graph)
+                else nx.to_scipy_sparse_array(G, weight=weight, dtype=float)
             )
+            renormalize = float(renormalize)
+            left_reduction = reduction  # (lambda x: backend.degrees(x)) if reduction == "sum" else reduction
+            right_reduction = lambda x: left_reduction(x.T)
+            if renormalize != 0:
+                M = M + scipy.sparse.eye(M.shape[0]).tocsr() * renormalize
+            if normalization == "col":
+                S = np.array(left_reduction(M)).flatten()
+                S[S != 0] = 1.0 / S[S != 0]
+                Q = scipy.sparse.spdiags(S.T, 0, *M.shape, format="csr").tocsr()
+                M = Q @ M
+            elif normalization == "laplacian":
+                S = np.array(np.sqrt(left_reduction(M))).flatten()
+                S[S != 0] = 1.0 / S[S != 0]
+                Qleft = scipy.sparse.spdiags(S.T, 0, *M.shape, format="csr").tocsr()
+                S = np.array(np.sqrt(right_reduction(M))).flatten()
+                S[S != 0] = 1.0 / S[S != 0]
+                Qright = scipy.sparse.spdiags(S.T, 0, *M.shape, format="csr").tocsr()
+                M = Qleft @ M @ Qright
+                M = -M + scipy.sparse.eye(M.shape[0]).tocsr()
+            elif normalization == "both":
+                S = np.array(left_reduction(M)).flatten()
+                S[S != 0] = 1.0 / S[S != 0]
+                Qleft = scipy.sparse.spdiags(S.T, 0, *M.shape, format="csr").tocsr()
+                S = np.array(right_reduction(M)).flatten()
+                S[S != 0] = 1.0 / S[S != 0]
+                Qright = scipy.sparse.spdiags(S.T, 0, *M.shape, format="csr").tocsr()
+                M = Qleft @ M @ Qright
+            elif normalization == "symmetric":
+                S = np.array(np.sqrt(left_reduction(M))).flatten()
+                S[S != 0] = 1.0 / S[S != 0]
+                Qleft = scipy.sparse.spdiags(S.T, 0, *M.shape, format="csr").tocsr()
+                S = np.array(np.sqrt(right_reduction(M))).flatten()
+                S[S != 0] = 1.0 / S[S != 0]
+                Qright = scipy.sparse.spdiags(S.T, 0, *M.shape, format="csr").tocsr()
+                M = Qleft @ M @ Qright
+            elif callable(normalization):
+                M = normalization(M)
+            elif normalization != "none":
+                raise Exception(
+                    "Supported normalizations: none, col, symmetric, both, laplacian, auto"
+                )
+            if cache_path is not None:
+                _save_cached_matrix(cache_path, M)
+                # cache misses return the same memory-mapped matrices as hits
+                M = _load_cached_matrix(cache_path)
     M = transform_adjacency(M)
     ret = (
         M
@@ -181,7 +319,7 @@ def to_sparse_matrix(
         )
     else:
         ret.__pygrank_preprocessed = {backend.backend_name(): ret}
-    ret._pygrank_node2id = {v: i for i, v in enumerate(G)}
+    ret._pygrank_node2id = node_index(G)
     return ret
 
 
@@ -276,9 +414,11 @@ def preprocessor(
     assume_immutability: bool = False,
     weight: str = "weight",
     renormalize: bool = False,
-    reduction=backend.degrees,
+    reduction=None,
     transform_adjacency=lambda x: x,
     cors: bool = False,
+    cache_dir: str = None,
+    cache_key=None,
 ):
     """Wrapper function that generates lambda expressions for the method to_sparse_matrix.
 
@@ -297,7 +437,7 @@ def preprocessor(
             ensure iteration stability by shrinking the graph's spectrum. Default is False. Can provide anything that
             can be cast to a float to regularize the renormalization.
         reduction: Optional. Controls how degrees are calculated from a callable (e.g. `pygrank.eigdegree`
-            for entropy-preserving transition matrices [li2011link]). Default is `pygrank.degrees`.
+            for entropy-preserving transition matrices [li2011link]). Default is None, which uses `pygrank.degrees`.
         cors: Optional.Cross-origin resource (shared between backends). Default is False.
             <details>
             If True, it enriches backend primitives
@@ -315,6 +455,17 @@ def preprocessor(
             *cors* and then visiting up to two backends out of which one is "numpy", does not affect the maximum
             memory consumption by code processing one graph.
             </details>
+        cache_dir: Optional. A directory in which to persistently store normalized adjacency matrices, keyed
+            by a hash of graph contents and preprocessing arguments. Default is None, which performs no
+            on-disk caching.
+        cache_key: Optional. An identifier of graph contents that replaces their hash when keying *cache_dir*
+            entries. Default is None.
+
+    Example:
+        >>> import pygrank as pg
+        >>> graph = ...
+        >>> pre = pg.preprocessor(normalization="symmetric", cache_dir="preprocessed")
+        >>> ranks = pg.PageRank(preprocessor=pre).rank(graph, {"A": 1}) # reruns in new processes load from disk
     """
     if assume_immutability:
         ret = MethodHasher(
@@ -326,6 +477,8 @@ def preprocessor(
                 reduction=reduction,
                 cors=cors,
                 transform_adjacency=transform_adjacency,
+                cache_dir=cache_dir,
+                cache_key=cache_key,
             )
         )
         ret.__name__ = "preprocess"
@@ -340,6 +493,8 @@ def preprocessor(
             reduction=reduction,
             cors=cors,
             transform_adjacency=transform_adjacency,
+            cache_dir=cache_dir,
+            cache_key=cache_key,
         )
 
     return preprocess
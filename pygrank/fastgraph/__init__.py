@@ -1,2 +1,3 @@
 from pygrank.fastgraph.fastgraph import *
 from pygrank.fastgraph.wrapgraph import *
+from pygrank.fastgraph.mappedgraph import *
@@ -1,10 +1,12 @@
+import numpy as np
 from scipy.sparse import coo_matrix
 
 
 class Graph:
     def __init__(self, directed=False):
-        self.edge_row = list()
-        self.edge_col = list()
+        self._edge_row = np.zeros(16, dtype=np.int32)
+        self._edge_col = np.zeros(16, dtype=np.int32)
+        self._edge_num = 0
         self.node_map = dict()
         self.directed = directed
         self._adj = None
@@ -12,11 +14,67 @@ class Graph:
         self._masked_out = None
         self._non_masked_edge_num = None
 
+    @property
+    def edge_row(self):
+        return self._edge_row[: self._edge_num]
+
+    @property
+    def edge_col(self):
+        return self._edge_col[: self._edge_num]
+
+    def _reserve(self, additional_edges):
+        required = self._edge_num + additional_edges
+        dtype = (
+            np.int64
+            if len(self.node_map) > np.iinfo(np.int32).max
+            else self._edge_row.dtype
+        )
+        if required <= len(self._edge_row) and dtype == self._edge_row.dtype:
+            return
+        capacity = max(required, 2 * len(self._edge_row))
+        for name in ["_edge_row", "_edge_col"]:
+            buffer = np.zeros(capacity, dtype=dtype)
+            buffer[: self._edge_num] = getattr(self, name)[: self._edge_num]
+            setattr(self, name, buffer)
+
+    def _append_edges(self, rows, cols):
+        self._reserve(len(rows))
+        self._edge_row[self._edge_num : self._edge_num + len(rows)] = rows
+        self._edge_col[self._edge_num : self._edge_num + len(rows)] = cols
+        self._edge_num += len(rows)
+
+    def _masked_edges(self):
+        num_nodes = len(self.node_map)
+        masked = [
+            u * num_nodes + v
+            for u, targets in self._masked_out.items()
+            for v in targets
+        ]
+        return np.isin(
+            self.edge_row.astype(np.int64) * num_nodes + self.edge_col, masked
+        )
+
     def add_node(self, node):
         if node not in self.node_map:
             self.node_map[node] = len(self.node_map)
         return self.node_map[node]
 
+    def _add_nodes(self, nodes):
+        nodes = np.asarray(nodes)
+        if nodes.dtype == object:
+            return np.fromiter(
+                (self.add_node(node) for node in nodes),
+                dtype=np.int64,
+                count=len(nodes),
+            )
+        unique, first_appearance, inverse = np.unique(
+            nodes, return_index=True, return_inverse=True
+        )
+        order = np.argsort(first_appearance)
+        unique_ids = np.zeros(len(unique), dtype=np.int64)
+        unique_ids[order] = [self.add_node(node) for node in unique[order].tolist()]
+        return unique_ids[inverse.reshape(-1)]
+
     def remove_edge(self, u, v):
         self._non_masked_edge_num = None
         if self._adj is not None:
@@ -55,11 +113,61 @@ class Graph:
                 self._masked_out[u].remove(v)
             if not self.directed and v in self._masked_out and u in self._masked_out[v]:
                 self._masked_out[v].remove(u)
-        self.edge_row.append(u)
-        self.edge_col.append(v)
-        if not self.directed:
-            self.edge_row.append(v)
-            self.edge_col.append(u)
+        if self.directed:
+            self._append_edges([u], [v])
+        else:
+            self._append_edges([u, v], [v, u])
+
+    def add_edges_from(self, src, dst=None):
+        """
+        Adds many edges at once. Node identifiers are mapped to indexes in bulk and edges are stored in
+        growable numpy buffers, which is much faster than calling `add_edge` for each edge.
+
+        Args:
+            src: An array of edge source nodes. If *dst* is None, this is instead an iterable of (u, v)
+                edge pairs, similarly to networkx graphs. Lists are converted to numpy arrays, so they should
+                hold node identifiers of the same type.
+            dst: Optional. An array of respective edge destination nodes. Default is None.
+
+        Example:
+            >>> import pygrank as pg
+            >>> graph = pg.Graph()
+            >>> graph.add_edges_from(["A", "B", "C"], ["B", "C", "A"])
+        """
+        if dst is None:
+            pairs = list(src)
+            src = [u for u, _ in pairs]
+            dst = [v for _, v in pairs]
+        if len(src) != len(dst):
+            raise Exception("Edge sources and destinations should have the same length")
+        if len(src) == 0:
+            return
+        src, dst = np.asarray(src), np.asarray(dst)
+        if src.dtype.kind != dst.dtype.kind:
+            src, dst = src.astype(object), dst.astype(object)
+        nodes = np.stack((src, dst), axis=1).reshape(-1)
+        ids = self._add_nodes(nodes)
+        rows, cols = ids[0::2], ids[1::2]
+        if self._masked_out is not None:
+            for u, v in zip(rows.tolist(), cols.tolist()):
+                if u in self._masked_out and v in self._masked_out[u]:
+                    self._masked_out[u].remove(v)
+                if (
+                    not self.directed
+                    and v in self._masked_out
+                    and u in self._masked_out[v]
+                ):
+                    self._masked_out[v].remove(u)
+        self._non_masked_edge_num = None
+        self._adj = None
+        self._degrees = None
+        if self.directed:
+            self._append_edges(rows, cols)
+        else:
+            self._append_edges(
+                np.stack((rows, cols), axis=1).reshape(-1),
+                np.stack((cols, rows), axis=1).reshape(-1),
+            )
 
     def is_directed(self):
         return self.directed
@@ -74,17 +182,14 @@ class Graph:
         if self._masked_out:
             return coo_matrix(
                 (
-                    [
-                        0 if u in self._masked_out and v in self._masked_out[u] else 1
-                        for u, v in zip(self.edge_row, self.edge_col)
-                    ],
+                    (~self._masked_edges()).astype(float),
                     (self.edge_row, self.edge_col),
                 ),
                 shape=(len(self.node_map), len(self.node_map)),
                 dtype=float,
             )  # .asformat("csr")
         return coo_matrix(
-            ([1.0] * len(self.edge_row), (self.edge_row, self.edge_col)),
+            (np.ones(self._edge_num), (self.edge_row, self.edge_col)),
             shape=(len(self.node_map), len(self.node_map)),
             dtype=float,
         )  # .asformat("csr")
@@ -98,32 +203,34 @@ class Graph:
     def number_of_edges(self):
         if self._masked_out is not None:
             if self._non_masked_edge_num is None:
-                self._non_masked_edge_num = sum(
-                    0 if u in self._masked_out and v in self._masked_out[u] else 1
-                    for u, v in zip(self.edge_row, self.edge_col)
+                self._non_masked_edge_num = int(
+                    self._edge_num - np.sum(self._masked_edges())
                 )
             ret = self._non_masked_edge_num
         else:
-            ret = len(self.edge_row)
+            ret = self._edge_num
         return ret if self.directed else ret / 2
 
     def copy(self):
         graph = Graph(self.directed)
         graph.node_map = {u: v for u, v in self.node_map.items()}
-        graph.edge_row = [u for u in self.edge_row]
-        graph.edge_col = [u for u in self.edge_col]
+        graph._edge_row = np.copy(self.edge_row)
+        graph._edge_col = np.copy(self.edge_col)
+        graph._edge_num = self._edge_num
         return graph
 
     def subgraph(self, nodes):
         graph = Graph(True)
         for node in nodes:
             graph.add_node(node)
-        nodes = set(nodes)
-        inverse_map = {v: u for u, v in self.node_map.items()}
-        for u, v in zip(self.edge_row, self.edge_col):
-            u, v = inverse_map[u], inverse_map[v]
-            if u in nodes and v in nodes:
-                graph.add_edge(u, v)
+        new_ids = np.full(len(self.node_map), -1, dtype=np.int64)
+        for node, new_id in graph.node_map.items():
+            if node in self.node_map:
+                new_ids[self.node_map[node]] = new_id
+        rows = new_ids[self.edge_row]
+        cols = new_ids[self.edge_col]
+        kept = (rows != -1) & (cols != -1)
+        graph._append_edges(rows[kept], cols[kept])
         graph.directed = self.directed
         return graph
 
@@ -132,24 +239,18 @@ class Graph:
 
     def _create_adjacency(self):
         if self._adj is None:
-            inverse_map = {u: v for v, u in self.node_map.items()}
+            inverse_map = list(self.node_map.keys())
             self._adj = dict()
+            rows, cols = self.edge_row, self.edge_col
             if self._masked_out is not None:
-                for u, v in zip(self.edge_row, self.edge_col):
-                    if u in self._masked_out and v in self._masked_out[u]:
-                        continue
-                    u = inverse_map[u]
-                    v = inverse_map[v]
-                    if u not in self._adj:
-                        self._adj[u] = set()
-                    self._adj[u].add(v)
-            else:
-                for u, v in zip(self.edge_row, self.edge_col):
-                    u = inverse_map[u]
-                    v = inverse_map[v]
-                    if u not in self._adj:
-                        self._adj[u] = set()
-                    self._adj[u].add(v)
+                kept = ~self._masked_edges()
+                rows, cols = rows[kept], cols[kept]
+            for u, v in zip(rows.tolist(), cols.tolist()):
+                u = inverse_map[u]
+                v = inverse_map[v]
+                if u not in self._adj:
+                    self._adj[u] = set()
+                self._adj[u].add(v)
             self._degrees = {
                 u: len(self._adj[u]) if u in self._adj else 0 for u in self.node_map
             }
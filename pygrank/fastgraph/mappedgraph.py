@@ -0,0 +1,335 @@
+import json
+import os
+import uuid
+from collections.abc import Mapping
+from typing import Optional
+import numpy as np
+from scipy.sparse import csr_matrix
+from pygrank.fastgraph.fastgraph import Graph
+
+
+def _row_blocks(indptr, block_size=1 << 22):
+    """
+    Splits the rows of a CSR matrix into consecutive blocks that each hold approximately *block_size* entries.
+    """
+    num_rows = len(indptr) - 1
+    start = 0
+    while start < num_rows:
+        end = int(
+            np.searchsorted(indptr, int(indptr[start]) + block_size, side="right")
+        )
+        end = min(max(end - 1, start + 1), num_rows)
+        yield start, end
+        start = end
+
+
+def _replace(temp_path, path):
+    try:
+        os.replace(temp_path, path)
+    except OSError:  # another process has already created the same file
+        os.remove(temp_path)
+
+
+class _Degrees(Mapping):
+    """A read-only mapping from node names to the degrees held in a numpy array."""
+
+    def __init__(self, node_list, node_map, degrees):
+        self.node_list = node_list
+        self.node_map = node_map
+        self.degrees = degrees
+
+    def __getitem__(self, node):
+        return int(self.degrees[self.node_map[node]])
+
+    def __iter__(self):
+        return self.node_list.__iter__()
+
+    def __len__(self):
+        return len(self.node_list)
+
+
+class MappedGraph(Graph):
+    """
+    An immutable graph whose adjacency matrix is stored in compressed sparse row format as memory-mapped
+    numpy arrays on disk. Only node names are kept in memory, so that ranking reads edges from disk pages
+    instead of holding edge lists and their scipy copies. Instances can be used in place of networkx and fastgraph
+    graphs. Use `pygrank.snap_pairs_to_mapped` to create mapped graphs from files of edge pairs.
+    """
+
+    def __init__(self, path: str, cache_path: Optional[str] = None):
+        """
+        Opens a mapped graph.
+
+        Args:
+            path: The directory holding the graph's *indptr.npy*, *indices.npy*, *data.npy*, *nodes.txt* and
+                *graph.json* files.
+            cache_path: Optional. The directory in which to store normalized edge weights. It is created if it does
+                not exist and should not be shared between graphs. If None (default), the graph's directory is used.
+
+        Example:
+            >>> import pygrank as pg
+            >>> graph = pg.MappedGraph("data/citeseer_mapped")
+            >>> ranks = pg.PageRank().rank(graph, {"1": 1})
+        """
+        self.path = path
+        self.cache_path = path if cache_path is None else cache_path
+        self._normalized = dict()
+        self._degrees_view = None
+        with open(os.path.join(path, "graph.json"), "r") as file:
+            super().__init__(json.load(file)["directed"])
+        self.indptr = np.load(os.path.join(path, "indptr.npy"), mmap_mode="r")
+        self.indices = np.load(os.path.join(path, "indices.npy"), mmap_mode="r")
+        self.data = np.load(os.path.join(path, "data.npy"), mmap_mode="r")
+        with open(os.path.join(path, "nodes.txt"), "r", encoding="utf-8") as file:
+            self.node_list = [line[:-1] for line in file]
+        self.node_map = {node: i for i, node in enumerate(self.node_list)}
+
+    @property
+    def edge_row(self):
+        return np.repeat(
+            np.arange(len(self.node_list), dtype=self.indices.dtype),
+            np.diff(self.indptr),
+        )
+
+    @property
+    def edge_col(self):
+        return self.indices
+
+    def add_node(self, node):
+        raise Exception("Mapped graphs are immutable")
+
+    def add_edge(self, u, v):
+        raise Exception("Mapped graphs are immutable")
+
+    def add_edges_from(self, src, dst=None):
+        raise Exception("Mapped graphs are immutable")
+
+    def remove_edge(self, u, v):
+        raise Exception("Mapped graphs are immutable")
+
+    def nodes(self):
+        return self.node_list
+
+    def __iter__(self):
+        return self.node_list.__iter__()
+
+    def number_of_edges(self):
+        return len(self.indices) if self.directed else len(self.indices) / 2
+
+    def copy(self):
+        return MappedGraph(self.path, self.cache_path)
+
+    def subgraph(self, nodes):
+        graph = Graph(True)
+        for node in nodes:
+            graph.add_node(node)
+        ids = np.array([self.node_map[node] for node in graph.node_map], dtype=np.int64)
+        sub = self.to_scipy_sparse_array()[ids][:, ids].tocoo()
+        graph._append_edges(sub.row, sub.col)
+        graph.directed = self.directed
+        return graph
+
+    def to_scipy_sparse_array(self):
+        return self._csr(self.data)
+
+    def _csr(self, data):
+        return csr_matrix(
+            (data, self.indices, self.indptr),
+            shape=(len(self.node_list), len(self.node_list)),
+            copy=False,
+        )
+
+    def to_normalized_scipy_sparse_array(self, normalization: str = "auto"):
+        """
+        Normalizes the adjacency matrix out-of-core by streaming blocks of rows. Normalized edge weights are
+        stored in the cache directory as memory-mapped arrays and reused by subsequent calls. If that directory
+        is not writable, they are kept in memory instead.
+
+        Args:
+            normalization: Optional. Either "none", "col", "symmetric", "both" or "auto" (default), as in
+                `pygrank.to_sparse_matrix`.
+        Returns:
+            A scipy sparse matrix whose arrays are memory-mapped.
+        """
+        if normalization == "auto":
+            normalization = "col" if self.directed else "symmetric"
+        if normalization == "none":
+            return self.to_scipy_sparse_array()
+        if normalization not in ["col", "symmetric", "both"]:
+            raise Exception(
+                "Mapped graphs support only none, col, symmetric, both, and auto normalizations"
+            )
+        if normalization in self._normalized:
+            return self._csr(self._normalized[normalization])
+        data_path = os.path.join(self.cache_path, "data_" + normalization + ".npy")
+        if not os.path.exists(data_path):
+            num_nodes = len(self.node_list)
+            row_degrees = np.zeros(num_nodes)
+            col_degrees = np.zeros(num_nodes)
+            for start, end in _row_blocks(self.indptr):
+                first, last = self.indptr[start], self.indptr[end]
+                rows = np.repeat(
+                    np.arange(start, end), np.diff(self.indptr[start : end + 1])
+                )
+                row_degrees += np.bincount(
+                    rows, weights=self.data[first:last], minlength=num_nodes
+                )
+                col_degrees += np.bincount(
+                    self.indices[first:last],
+                    weights=self.data[first:last],
+                    minlength=num_nodes,
+                )
+            if normalization == "symmetric":
+                row_degrees = np.sqrt(row_degrees)
+                col_degrees = np.sqrt(col_degrees)
+            row_degrees[row_degrees != 0] = 1.0 / row_degrees[row_degrees != 0]
+            col_degrees[col_degrees != 0] = 1.0 / col_degrees[col_degrees != 0]
+            if normalization == "col":
+                col_degrees[:] = 1
+            temp_path = data_path + "." + str(uuid.uuid4()) + ".tmp.npy"
+            try:
+                os.makedirs(self.cache_path, exist_ok=True)
+                data = np.lib.format.open_memmap(
+                    temp_path, mode="w+", dtype=float, shape=(len(self.data),)
+                )
+            except OSError:  # the cache directory is not writable
+                temp_path = None
+                data = np.empty(len(self.data))
+            for start, end in _row_blocks(self.indptr):
+                first, last = self.indptr[start], self.indptr[end]
+                rows = np.repeat(
+                    np.arange(start, end), np.diff(self.indptr[start : end + 1])
+                )
+                data[first:last] = (
+                    self.data[first:last]
+                    * row_degrees[rows]
+                    * col_degrees[self.indices[first:last]]
+                )
+            if temp_path is None:
+                self._normalized[normalization] = data
+                return self._csr(data)
+            data.flush()
+            del data
+            _replace(temp_path, data_path)
+        return self._csr(np.load(data_path, mmap_mode="r"))
+
+    def has_edge(self, u, v):
+        u = self.node_map[u]
+        v = self.node_map[v]
+        return bool(np.any(self.indices[self.indptr[u] : self.indptr[u + 1]] == v))
+
+    @property
+    def degree(self):
+        if self._degrees_view is None:
+            self._degrees_view = _Degrees(
+                self.node_list, self.node_map, np.diff(self.indptr)
+            )
+        return self._degrees_view
+
+    def neighbors(self, u):
+        u = self.node_map[u]
+        return set(
+            self.node_list[v] for v in self.indices[self.indptr[u] : self.indptr[u + 1]]
+        )
+
+
+def snap_pairs_to_mapped(
+    pair_file: str,
+    path: str,
+    directed: bool = False,
+    block_size: int = 1 << 20,
+) -> MappedGraph:
+    """
+    Converts a file of SNAP-formatted edge pairs (e.g. the *pairs.txt* file of datasets) into a memory-mapped graph.
+    The file is read twice, once to index nodes and count their edges and once to scatter edges
+    into the mapped arrays, so that only node names and one block of edges are held in memory at any time.
+    Node order and duplicate edges follow `pygrank.Graph`, so signals are aligned with graphs
+    loaded by `pygrank.load_datasets_graph`.
+
+    Args:
+        pair_file: The file whose rows hold whitespace-separated pairs of node names. Lines starting with "#" are
+            ignored.
+        path: The directory in which to store the mapped graph. It is created if it does not exist.
+        directed: Optional. Whether the graph is directed. Default is False.
+        block_size: Optional. The number of edges to scatter at once. Default is 1048576.
+    Returns:
+        The created `pygrank.MappedGraph`.
+
+    Example:
+        >>> import pygrank as pg
+        >>> graph = pg.snap_pairs_to_mapped("data/citeseer/pairs.txt", "data/citeseer_mapped")
+        >>> ranks = pg.PageRank().rank(graph, {"1": 1})
+    """
+
+    def blocks():
+        src, dst = list(), list()
+        with open(pair_file, "r", encoding="utf-8") as file:
+            for line in file:
+                if len(line) != 0 and line[0] != "#":
+                    splt = line[:-1].split()
+                    if len(splt) > 1:
+                        src.append(splt[0])
+                        dst.append(splt[1])
+                        if len(src) >= block_size:
+                            yield src, dst
+                            src, dst = list(), list()
+        if src:
+            yield src, dst
+
+    node_map = dict()
+    counts = list()
+    for src, dst in blocks():
+        for u, v in zip(src, dst):
+            for node in (u, v):
+                if node not in node_map:
+                    node_map[node] = len(node_map)
+                    counts.append(0)
+            counts[node_map[u]] += 1
+            if not directed:
+                counts[node_map[v]] += 1
+    num_nodes = len(node_map)
+    num_entries = sum(counts)
+    # scipy keeps memory-mapped arrays without copies only if indices and indptr share a data type
+    index_type = (
+        np.int32 if max(num_nodes, num_entries) <= np.iinfo(np.int32).max else np.int64
+    )
+    indptr = np.zeros(num_nodes + 1, dtype=index_type)
+    np.cumsum(counts, out=indptr[1:])
+    del counts
+    os.makedirs(path, exist_ok=True)
+    indices = np.lib.format.open_memmap(
+        os.path.join(path, "indices.npy"),
+        mode="w+",
+        dtype=index_type,
+        shape=(int(indptr[-1]),),
+    )
+    cursor = indptr[:-1].astype(np.int64)
+    for src, dst in blocks():
+        rows = np.fromiter((node_map[u] for u in src), dtype=np.int64, count=len(src))
+        cols = np.fromiter((node_map[v] for v in dst), dtype=np.int64, count=len(dst))
+        if not directed:
+            rows, cols = np.concatenate((rows, cols)), np.concatenate((cols, rows))
+        order = np.argsort(rows, kind="stable")
+        rows, cols = rows[order], cols[order]
+        group_starts = np.searchsorted(rows, rows, side="left")
+        positions = cursor[rows] + np.arange(len(rows)) - group_starts
+        indices[positions] = cols
+        cursor += np.bincount(rows, minlength=num_nodes)
+    indices.flush()
+    del indices
+    np.save(os.path.join(path, "indptr.npy"), indptr)
+    data = np.lib.format.open_memmap(
+        os.path.join(path, "data.npy"), mode="w+", dtype=float, shape=(int(indptr[-1]),)
+    )
+    data[:] = 1
+    data.flush()
+    del data
+    with open(os.path.join(path, "nodes.txt"), "w", encoding="utf-8") as file:
+        for node in node_map:
+            file.write(node + "\n")
+    with open(os.path.join(path, "graph.json"), "w") as file:
+        json.dump({"directed": directed}, file)
+    for file in os.listdir(path):
+        if file.startswith("data_"):
+            os.remove(os.path.join(path, file))
+    return MappedGraph(path)
@@ -1,4 +1,5 @@
-from pygrank.core import GraphSignalData
+from pygrank.core import GraphSignalData, backend
+from typing import Iterable, List, Union
 
 
 class Measure(object):
@@ -10,6 +11,26 @@ class Measure(object):
             "Non-abstract subclasses of Measure should implement an evaluate method"
         )
 
+    def evaluate_many(self, scores: Union[Iterable[GraphSignalData], object]) -> List:
+        """
+        Evaluates many graph signals at once. Measures that support batching evaluate all signals with
+        operations on one backend matrix, whereas other measures fall back to calling `evaluate` for each signal.
+
+        Args:
+            scores: Either a backend matrix with one signal per column or an iterable of graph signal data.
+        Returns:
+            A list of respective evaluations.
+
+        Example:
+            >>> import pygrank as pg
+            >>> graph, seed_sets, algorithm = ...
+            >>> ranks = algorithm.rank_many(graph, [{v: 1 for v in seeds} for seeds in seed_sets])
+            >>> evaluations = pg.Modularity(graph).evaluate_many(ranks)
+        """
+        if hasattr(scores, "shape") and len(scores.shape) > 1:
+            scores = backend.separate_cols(scores)
+        return [self.evaluate(signal) for signal in scores]
+
     def best_direction(self) -> int:
         """
         Automatically determines if higher or lower values of the measure are better.
@@ -44,4 +65,3 @@ class Measure(object):
 
         dummy_constructor.__name__ = self.__class__.__name__
         return dummy_constructor
-
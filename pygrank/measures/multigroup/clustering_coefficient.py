@@ -1,6 +1,9 @@
 import numpy as np
 import warnings
+from typing import Optional
 from pygrank.core import backend
+from pygrank.core.signals import to_signal
+from pygrank.core.utils import to_sparse_matrix
 
 
 def _cos_similarity(v, u, scores):
@@ -12,7 +15,7 @@ def _cos_similarity(v, u, scores):
         vi = group_scores.get(v, 0)
         l2u += ui * ui
         l2v += vi * vi
-        dot = ui * vi
+        dot += ui * vi
     return backend.safe_div(dot, np.sqrt(l2u * l2v))
 
 
@@ -21,34 +24,144 @@ def _dot_similarity(v, u, scores):
     for group_scores in scores.values():
         ui = group_scores.get(u, 0)
         vi = group_scores.get(v, 0)
-        dot = ui * vi
+        dot += ui * vi
     return dot
 
 
+def _group_matrix(graph, scores, similarity):
+    """Stacks the scores of all groups into a numpy matrix with one row per graph node and one column per group.
+    Rows are normalized to unit L2 norms for the "cos" similarity, so that row products become similarities.
+    """
+    with backend.Backend("numpy"):
+        groups = np.column_stack(
+            [
+                np.asarray(to_signal(graph, group_scores).np, dtype=float)
+                for group_scores in scores.values()
+            ]
+        )
+    if similarity == "cos":
+        norms = np.sqrt((groups**2).sum(axis=1))
+        norms[norms == 0] = 1
+        groups = groups / norms[:, None]
+    return groups
+
+
+def _pair_similarities(groups, first, second, similarity, chunk_size=1 << 16):
+    """Computes the "cos" or "dot" similarities of many node pairs given by two arrays of node positions, where
+    groups is the unnormalized matrix of group scores. Products are accumulated group by group in the same order
+    as in _cos_similarity and _dot_similarity, so that similarities are the same as computing them pair by pair.
+    Pairs are processed in chunks, so that gathered rows of the group matrix do not occupy too much memory.
+    """
+    similarities = np.empty(len(first))
+    for start in range(0, len(first), chunk_size):
+        end = start + chunk_size
+        first_rows = groups[first[start:end]]
+        second_rows = groups[second[start:end]]
+        dot = np.zeros(len(first_rows))
+        l2first = np.zeros(len(first_rows))
+        l2second = np.zeros(len(first_rows))
+        for group in range(groups.shape[1]):
+            dot += second_rows[:, group] * first_rows[:, group]
+            if similarity == "cos":
+                l2second += second_rows[:, group] * second_rows[:, group]
+                l2first += first_rows[:, group] * first_rows[:, group]
+        if similarity == "cos":
+            norms = np.sqrt(l2second * l2first)
+            dot[norms == 0] = 0
+            dot[norms != 0] /= norms[norms != 0]
+        similarities[start:end] = dot
+    return similarities
+
+
 class ClusteringCoefficient:
     """https://www.albany.edu/~ravi/pdfs/opsahl_etal_2009.pdf"""
 
-    def __init__(self, G, similarity="cos", max_positive_samples=2000, seed=1):
+    def __init__(
+        self,
+        G,
+        similarity="cos",
+        max_positive_samples: Optional[int] = None,
+        seed=1,
+        chunk_size: Optional[int] = None,
+    ):
+        """
+        Args:
+            G: The graph on which to perform the evaluation.
+            similarity: "cos" (default) or "dot" or a callable of two nodes and the scores being evaluated.
+            max_positive_samples: Optional. If None (default) or greater than the number of graph nodes, all nodes
+                are considered. Otherwise, the number of nodes that are sampled to reduce running time.
+            seed: Optional. A randomization seed for sampling nodes. Default is 1.
+            chunk_size: Optional. The number of nodes whose neighborhoods are processed together with sparse matrix
+                products. Lower values reduce memory consumption for large graphs. If None (default), all
+                nodes are processed at once.
+        """
         self.G = G
         self.max_positive_samples = max_positive_samples
         self.seed = seed
+        self.chunk_size = chunk_size
         if self.G.is_directed():  # pragma: no cover
             warnings.warn(
                 "ClusteringCoefficient is designed for undirected graphs", stacklevel=2
             )
+        self.similarity = similarity
         if similarity == "cos":
             similarity = _cos_similarity
         elif similarity == "dot":
             similarity = _dot_similarity
         self._similarity = similarity
 
-    def evaluate(self, scores):
+    def _sample_positions(self):
         np.random.seed(self.seed)
-        positive_candidates = list(self.G)
-        if len(positive_candidates) > self.max_positive_samples:
-            positive_candidates = np.random.choice(
-                positive_candidates, self.max_positive_samples
+        if (
+            self.max_positive_samples is None
+            or len(self.G) <= self.max_positive_samples
+        ):
+            return None
+        return np.random.choice(len(self.G), self.max_positive_samples)
+
+    def evaluate(self, scores):
+        if self.similarity not in ["cos", "dot"]:
+            return self._evaluate_pairs(scores)
+        if len(scores) == 0 or len(self.G) == 0:
+            return 0
+        with backend.Backend("numpy"):
+            adjacency = to_sparse_matrix(
+                self.G, normalization="none", weight=None
+            ).array.tocsr()
+        groups = _group_matrix(self.G, scores, self.similarity)
+        positions = self._sample_positions()
+        if positions is None:
+            rows = np.arange(len(self.G))
+            weights = np.ones(len(rows))
+        else:  # repeatedly sampled nodes are weighted by their number of samples
+            weights = np.bincount(positions, minlength=len(self.G))
+            rows = np.nonzero(weights)[0]
+            weights = weights[rows]
+        chunk_size = len(rows) if self.chunk_size is None else self.chunk_size
+        existing_triplet_values = 0.0
+        total_triplet_values = 0.0
+        for start in range(0, len(rows), max(chunk_size, 1)):
+            neighbors = adjacency[rows[start : start + chunk_size]]
+            chunk_weights = weights[start : start + chunk_size]
+            # similarities of all neighbor pairs are the squared norms of summed neighbor group scores
+            aggregated = np.asarray(neighbors @ groups)
+            existing_triplet_values += float(
+                chunk_weights @ (aggregated**2).sum(axis=1)
             )
+            # neighbor pairs that are also adjacent close triangles
+            triangles = (neighbors @ adjacency).multiply(neighbors).sum(axis=1)
+            total_triplet_values += float(chunk_weights @ np.asarray(triangles).ravel())
+        return (
+            0
+            if total_triplet_values == 0
+            else existing_triplet_values / total_triplet_values
+        )
+
+    def _evaluate_pairs(self, scores):
+        positive_candidates = list(self.G)
+        positions = self._sample_positions()
+        if positions is not None:
+            positive_candidates = [positive_candidates[pos] for pos in positions]
         existing_triplet_values = 0.0
         total_triplet_values = 0
         for v in positive_candidates:
@@ -70,4 +183,4 @@ class ClusteringCoefficient:
         )
 
     def __call__(self, scores):
-        return self.evaluate(scores)
\ No newline at end of file
+        return self.evaluate(scores)
@@ -1,7 +1,16 @@
+import collections
 import numpy as np
+import scipy
 import warnings
 from pygrank.measures import AUC
-from pygrank.measures.multigroup.clustering_coefficient import _cos_similarity, _dot_similarity
+from pygrank.core import backend
+from pygrank.core.utils import to_sparse_matrix
+from pygrank.measures.multigroup.clustering_coefficient import (
+    _cos_similarity,
+    _dot_similarity,
+    _group_matrix,
+    _pair_similarities,
+)
 
 
 class LinkAssessment:
@@ -24,7 +33,8 @@ class LinkAssessment:
             graph: The graph on which to perform the evaluation.
             nodes: The list of nodes whose edges are used for evaluation. If None (default) all graph nodes are used.
             measure: The measure with which to assess prediction quality. Default is pygrank.AUC.
-            similarity: "cos" (default) or "dot"
+            similarity: "cos" (default) or "dot" or a callable of two nodes and the scores being evaluated.
+                The first two options score all node pairs at once with numpy operations on a matrix of group scores.
             hops: For the default measure, *hops=1* corresponds to LinkAUC and *hops=2* to HopAUC.
             max_positive_samples: A sampling strategy to reduce running time. Default is 2000.
             max_negative_samples: A sampling strategy to reduce running time. Default is 2000.
@@ -39,6 +49,7 @@ class LinkAssessment:
         self.hops = hops
         self.seed = seed
         self.measure = measure
+        self.similarity = similarity
         if self.G.is_directed():  # pragma: no cover
             warnings.warn(
                 "LinkAssessment is designed for undirected graphs", stacklevel=2
@@ -51,6 +62,62 @@ class LinkAssessment:
         self._progress = progress
 
     def evaluate(self, scores):
+        if self.similarity not in ["cos", "dot"]:
+            return self._evaluate_pairs(scores)
+        if self.seed is not None:
+            np.random.seed(self.seed)
+        num_nodes = len(self.G)
+        positive_candidates = np.arange(num_nodes)
+        if num_nodes > self.max_positive_samples:
+            positive_candidates = np.random.choice(num_nodes, self.max_positive_samples)
+        negative_candidates = np.random.choice(
+            num_nodes,
+            (
+                len(positive_candidates),
+                min(self.max_negative_samples, num_nodes),
+            ),
+        )
+        with backend.Backend("numpy"):
+            adjacency = to_sparse_matrix(
+                self.G, normalization="none", weight=None
+            ).array.tocsr()
+        groups = _group_matrix(self.G, scores, "dot")  # similarities are computed from unnormalized scores
+        # rows of sampled nodes gather all nodes reached within the given number of hops
+        reached = scipy.sparse.csr_matrix(
+            (
+                np.ones(len(positive_candidates)),
+                (np.arange(len(positive_candidates)), positive_candidates),
+            ),
+            shape=(len(positive_candidates), num_nodes),
+        )
+        for _ in range(self.hops):
+            reached = reached + reached @ adjacency
+        reached = reached.tocoo()
+        rows = reached.row.astype(np.int64)
+        cols = reached.col.astype(np.int64)
+        positive = cols != positive_candidates[rows]
+        positive_nodes = positive_candidates[rows[positive]]
+        positives = cols[positive]
+        negative_rows = np.repeat(
+            np.arange(len(positive_candidates), dtype=np.int64),
+            negative_candidates.shape[1],
+        )
+        negatives = negative_candidates.ravel()
+        negative = ~np.isin(
+            negative_rows * num_nodes + negatives, rows * num_nodes + cols
+        )
+        negative_nodes = positive_candidates[negative_rows[negative]]
+        negatives = negatives[negative]
+        real = np.concatenate([np.ones(len(positives)), np.zeros(len(negatives))])
+        predicted = _pair_similarities(
+            groups,
+            np.concatenate([positive_nodes, negative_nodes]),
+            np.concatenate([positives, negatives]),
+            self.similarity,
+        )
+        return self.measure(real)(predicted)
+
+    def _evaluate_pairs(self, scores):
         if self.seed is not None:
             np.random.seed(self.seed)
         positive_candidates = list(self.G)
@@ -64,9 +131,9 @@ class LinkAssessment:
         weights = list()
         for node in self._progress(positive_candidates):
             neighbors = {node: 0.0}
-            pending = [node]
+            pending = collections.deque([node])
             while len(pending) != 0:
-                next_node = pending.pop()
+                next_node = pending.popleft()
                 hops = neighbors[next_node]
                 Gneighbors = set(self.G.neighbors(next_node))
                 if hops < self.hops:
@@ -1,6 +1,5 @@
 from pygrank.measures.supervised.supervised import Supervised
 from pygrank.core import backend, GraphSignalData, BackendPrimitive
-import scipy.stats
 
 class MannWhitneyParity(Supervised):
     """
@@ -13,6 +12,8 @@ class MannWhitneyParity(Supervised):
     """
 
     def evaluate(self, scores: GraphSignalData) -> BackendPrimitive:
+        import scipy.stats
+
         sensitive, scores = self.to_numpy(scores)
         scores1 = scores[sensitive == 0]
         scores2 = scores[sensitive != 0]
@@ -1,17 +1,53 @@
 import numpy as np
-import sklearn.metrics
 from pygrank.measures.supervised.supervised import Supervised
 from pygrank.core import backend, GraphSignalData, BackendPrimitive
+from typing import Iterable, List, Union
+
+
+def _rank_sum_auc(known_scores, scores):
+    """Computes the AUC of each column of a numpy matrix of scores through the Mann-Whitney rank-sum statistic,
+    where tied scores obtain their average rank and positive known scores denote positive labels.
+    """
+    order = np.argsort(scores, axis=0)  # tied scores obtain the same ranks in any order
+    ordered = np.take_along_axis(scores, order, axis=0)
+    positions = np.arange(len(scores))[:, None]
+    changes = ordered[1:] != ordered[:-1]
+    bounds = np.ones((1, scores.shape[1]), dtype=bool)
+    first = np.maximum.accumulate(
+        np.where(np.concatenate((bounds, changes)), positions, 0), axis=0
+    )
+    last = np.minimum.accumulate(
+        np.where(np.concatenate((changes, bounds)), positions, len(scores))[::-1],
+        axis=0,
+    )[::-1]
+    positive = known_scores > 0
+    num_positive = np.count_nonzero(positive)
+    num_negative = len(positive) - num_positive
+    rank_sums = (((first + last) / 2 + 1) * positive[order]).sum(axis=0)
+    return (rank_sums - num_positive * (num_positive + 1) / 2) / (
+        num_positive * num_negative
+    )
 
 
 class AUC(Supervised):
-    """Wrapper for sklearn.metrics.auc evaluation."""
+    """Computes the area under the ROC curve of given scores with the Mann-Whitney rank-sum statistic, where
+    known scores are positive for positive examples."""
 
     def evaluate(self, scores: GraphSignalData) -> BackendPrimitive:
         known_scores, scores = self.to_numpy(scores)
         if backend.min(known_scores) == backend.max(known_scores):
             raise Exception("Cannot evaluate AUC when all labels are the same")
-        fpr, tpr, _ = sklearn.metrics.roc_curve(
-            np.array(known_scores, copy=False), np.array(scores, copy=False)
+        return float(
+            _rank_sum_auc(
+                np.asarray(known_scores, dtype=float),
+                np.asarray(scores, dtype=float).reshape(-1, 1),
+            )[0]
         )
-        return sklearn.metrics.auc(fpr, tpr)
\ No newline at end of file
+
+    def evaluate_many(self, scores: Union[Iterable[GraphSignalData], object]) -> List:
+        known_scores, scores = self.to_numpy_many(scores)
+        if backend.min(known_scores) == backend.max(known_scores):
+            raise Exception("Cannot evaluate AUC when all labels are the same")
+        return _rank_sum_auc(
+            np.asarray(known_scores, dtype=float), np.asarray(scores, dtype=float)
+        ).tolist()
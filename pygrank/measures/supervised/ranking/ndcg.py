@@ -1,6 +1,8 @@
 from pygrank.measures.supervised.supervised import Supervised
 import numpy as np
-from pygrank.core import backend, GraphSignalData, BackendPrimitive
+from pygrank.core import GraphSignalData, BackendPrimitive
+from pygrank.core.signals import _top_positions
+from typing import Iterable, List, Union
 
 
 class NDCG(Supervised):
@@ -24,28 +26,25 @@ class NDCG(Supervised):
             )
         self.k = len(known_scores) if k is None else k
 
+    def _ideal(self, known_scores, discounts):
+        return (known_scores[_top_positions(known_scores, self.k)] / discounts).sum()
+
     def evaluate(self, scores: GraphSignalData) -> BackendPrimitive:
         known_scores, scores = self.to_numpy(scores)
-        DCG = 0
-        IDCG = 0
-        for i, v in enumerate(
-            list(
-                sorted(
-                    list(range(backend.length(scores))),
-                    key=scores.__getitem__,
-                    reverse=True,
-                )
-            )[: self.k]
-        ):
-            DCG += known_scores[v] / np.log2(i + 2)
-        for i, v in enumerate(
-            list(
-                sorted(
-                    list(range(backend.length(known_scores))),
-                    key=known_scores.__getitem__,
-                    reverse=True,
-                )
-            )[: self.k]
-        ):
-            IDCG += known_scores[v] / np.log2(i + 2)
-        return DCG / IDCG
+        known_scores = np.asarray(known_scores, dtype=float)
+        scores = np.asarray(scores, dtype=float)
+        discounts = np.log2(np.arange(min(self.k, len(scores))) + 2)
+        DCG = (known_scores[_top_positions(scores, self.k)] / discounts).sum()
+        return DCG / self._ideal(known_scores, discounts)
+
+    def evaluate_many(self, scores: Union[Iterable[GraphSignalData], object]) -> List:
+        known_scores, scores = self.to_numpy_many(scores)
+        known_scores = np.asarray(known_scores, dtype=float)
+        scores = np.asarray(scores, dtype=float)
+        discounts = np.log2(np.arange(min(self.k, len(scores))) + 2)
+        # partial sorting of each column places tied scores in the same order as evaluate
+        top = np.empty((len(discounts), scores.shape[1]), dtype=np.int64)
+        for col in range(scores.shape[1]):
+            top[:, col] = _top_positions(scores[:, col], self.k)
+        DCG = (known_scores[top] / discounts[:, None]).sum(axis=0)
+        return (DCG / self._ideal(known_scores, discounts)).tolist()
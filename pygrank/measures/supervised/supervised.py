@@ -2,12 +2,14 @@ from pygrank.measures.measure import Measure
 from pygrank.core import (
     backend,
     GraphSignal,
+    SparseGraphSignal,
     to_signal,
     GraphSignalData,
     BackendPrimitive,
 )
 import numbers
-from typing import Tuple, Union
+import numpy as np
+from typing import Iterable, Tuple, Union
 
 
 class Supervised(Measure):
@@ -37,14 +39,18 @@ class Supervised(Measure):
             self.known_scores, numbers.Number
         ):
             return backend.to_array([self.known_scores]), backend.to_array([scores])
-        elif isinstance(scores, GraphSignal):
-            return to_signal(scores, self.known_scores).filter(
-                exclude=self.exclude
-            ), scores.normalized(normalization).filter(exclude=self.exclude)
-        elif isinstance(self.known_scores, GraphSignal):
-            return self.known_scores.filter(exclude=self.exclude), to_signal(
-                self.known_scores, scores
-            ).normalized(normalization).filter(exclude=self.exclude)
+        elif isinstance(scores, GraphSignal) or isinstance(
+            self.known_scores, GraphSignal
+        ):
+            if not isinstance(scores, GraphSignal):
+                scores = to_signal(self.known_scores, scores)
+            known_scores, kept = self._filtered_known_scores(scores)
+            scores = scores.np
+            if normalization:
+                scores = backend.self_normalize(backend.copy(scores))
+            if kept is not None:
+                scores = _gather(scores, kept)
+            return known_scores, scores
         else:
             if self.exclude is not None:
                 raise Exception(
@@ -57,6 +63,74 @@ class Supervised(Measure):
             )
             return backend.to_array(self.known_scores), scores
 
+    def _filtered_known_scores(self, signal: GraphSignal):
+        """Finds the known scores of non-excluded nodes and a pair of the numpy positions of non-excluded nodes and
+        a backend array that is non-zero for excluded nodes, or None if no nodes are excluded. These, as well as
+        conversions of the known_scores and exclude properties to graph signals, are computed once and reused for the
+        signals sharing the same node index, for as long as the backend, these properties and the arrays stored by
+        them remain the same objects and graph signals are not edited through item or `np` assignments. In-place
+        edits of other data types (e.g. dicts) or of arrays that are not assigned back are not taken into account.
+        """
+        cache = getattr(self, "_filter_cache", None)
+        known_arrays = _stored_arrays(self.known_scores)
+        exclude_arrays = _stored_arrays(self.exclude)
+        versions = (
+            getattr(self.known_scores, "_version", None),
+            getattr(self.exclude, "_version", None),
+        )
+        if (
+            cache is None
+            or cache[0] is not signal.node2id
+            or cache[1] != backend.backend_name()
+            or cache[2] is not self.known_scores
+            or cache[3] is not self.exclude
+            or not _same_objects(cache[4], known_arrays)
+            or not _same_objects(cache[5], exclude_arrays)
+            or cache[6] != versions
+        ):
+            known_scores = to_signal(signal, self.known_scores).np
+            if self.exclude is None:
+                kept = None
+            else:
+                exclude = to_signal(signal, self.exclude).np
+                kept = np.flatnonzero(np.asarray(exclude, dtype=float) == 0), exclude
+                known_scores = _gather(known_scores, kept)
+            cache = (
+                signal.node2id,
+                backend.backend_name(),
+                self.known_scores,
+                self.exclude,
+                known_arrays,
+                exclude_arrays,
+                versions,
+                known_scores,
+                kept,
+            )
+            self._filter_cache = cache
+        return cache[7], cache[8]
+
+    def to_numpy_many(
+        self, scores: Union[Iterable[GraphSignalData], BackendPrimitive]
+    ) -> Tuple[BackendPrimitive, BackendPrimitive]:
+        """
+        Converts many scores to a backend matrix with one column per scores, where the same nodes as in `to_numpy`
+        are kept.
+
+        Args:
+            scores: Either a backend matrix with one column of scores per graph node or an iterable of graph
+                signal data.
+        Returns:
+            The known scores and the matrix.
+        """
+        if hasattr(scores, "shape") and len(scores.shape) > 1:
+            scores = backend.separate_cols(scores)
+        known_scores = None
+        columns = list()
+        for signal in scores:
+            known_scores, signal = self.to_numpy(signal)
+            columns.append(signal.np if isinstance(signal, GraphSignal) else signal)
+        return known_scores, backend.combine_cols(columns)
+
     def best_direction(self) -> int:
         ret = getattr(self.__class__, "__best_direction", None)
         if ret is None:
@@ -67,3 +141,24 @@ class Supervised(Measure):
             )
             setattr(self.__class__, "__best_direction", ret)
         return ret
+
+
+def _gather(
+    x: BackendPrimitive, kept: Tuple[np.ndarray, BackendPrimitive]
+) -> BackendPrimitive:
+    if isinstance(x, np.ndarray):
+        return x[kept[0]]
+    # other backends keep their own (e.g. device-aware) implementation of filtering
+    return backend.filter_out(x, kept[1])
+
+
+def _stored_arrays(data) -> tuple:
+    if isinstance(data, SparseGraphSignal) and data.nonzero_ids is not None:
+        return data.nonzero_ids, data.nonzero_values
+    if isinstance(data, GraphSignal):
+        return (data.np,)
+    return ()
+
+
+def _same_objects(first: tuple, second: tuple) -> bool:
+    return len(first) == len(second) and all(a is b for a, b in zip(first, second))
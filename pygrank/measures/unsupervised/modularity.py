@@ -1,7 +1,8 @@
 from pygrank.measures.unsupervised.unsupervised import Unsupervised
 import numpy as np
 from pygrank.core.signals import to_signal
-from pygrank.core import GraphSignalGraph, GraphSignalData, BackendPrimitive
+from pygrank.core import backend, GraphSignalGraph, GraphSignalData, BackendPrimitive
+from typing import Iterable, List, Optional, Union
 
 
 class Modularity(Unsupervised):
@@ -13,38 +14,101 @@ class Modularity(Unsupervised):
         self,
         graph: GraphSignalGraph = None,
         max_rank: float = 1,
-        max_positive_samples: int = 2000,
+        max_positive_samples: Optional[int] = None,
         seed: int = 0,
         progress=lambda x: x,
+        **kwargs,
     ):
-        """Initializes the Modularity measure with a sampling strategy that speeds up normal computations.
+        """Initializes the Modularity measure.
 
         Args:
             graph: Optional. The graph on which to calculate the measure. If None (default) it is automatically
              extracted from graph signals passed for evaluation.
             max_rank: Optional. Default is 1.
-            max_positive_samples: Optional. The number of nodes with which to compute modularity. These are
-             sampled uniformly from all graph nodes. If this is greater than the number of graph nodes,
-             all nodes are used and the measure is deterministic. However,
-             calculation time is O(max_positive_samples<sup>2</sup>) and thus a trade-off needs to be determined of time
-             vs approximation quality. Effectively, the value should be high enough for max_positive_samples<sup>2</sup>
-             to be comparable to the number of graph edges. Default is 2000.
-            seed: Optional. Makes the evaluation seeded, for example to use in tuning. Default is 0.
+            max_positive_samples: Optional. If None (default) or greater than the number of graph nodes, modularity
+             is computed exactly with sparse matrix operations on the graph's adjacency matrix. Otherwise, this is
+             the number of nodes with which to approximate modularity. These are
+             sampled uniformly from all graph nodes and calculation time is O(max_positive_samples<sup>2</sup>),
+             so that a trade-off needs to be determined of time vs approximation quality.
+            seed: Optional. Makes sampled evaluations seeded, for example to use in tuning. Default is 0.
 
         Example:
             >>> import pygrank as pg
             >>> graph, seed_nodes, algorithm = ...
             >>> scores = algorithm.rank(graph, seed_nodes)
-            >>> modularity = pg.Modularity(max_positive_samples=int(graph.number_of_edges()**0.5)).evaluate(scores)
+            >>> modularity = pg.Modularity().evaluate(scores)
+
+        Example (reuse adjacency matrices across evaluations of the same graph):
+            >>> import pygrank as pg
+            >>> graph, seed_nodes, algorithm = ...
+            >>> measure = pg.Modularity(graph, assume_immutability=True)
+            >>> modularities = [measure(algorithm.rank(graph, seeds)) for seeds in seed_nodes]
         """
-        self.graph = graph
+        super().__init__(graph, **kwargs)
         self.max_positive_samples = max_positive_samples
         self.max_rank = max_rank
         self.seed = seed
         self.progress = progress
 
+    def _sampled(self, graph) -> bool:
+        return (
+            self.max_positive_samples is not None
+            and len(graph) > self.max_positive_samples
+        )
+
+    def _degrees(self, graph, adjacency):
+        degrees = backend.degrees(adjacency)
+        if graph.is_directed():  # in-degrees are added to out-degrees
+            degrees = degrees + backend.conv(
+                backend.repeat(1.0, backend.length(degrees)), adjacency
+            )
+        return degrees
+
     def evaluate(self, scores: GraphSignalData) -> BackendPrimitive:
         scores = to_signal(self.graph, scores)
+        graph = scores.graph
+        if self._sampled(graph):
+            return self._sampled_evaluate(scores)
+        if graph.number_of_edges() == 0:
+            return 0
+        adjacency = self.preprocessor(graph)
+        degrees = self._degrees(graph, adjacency)
+        scores = scores.np / self.max_rank
+        internal_edges = backend.dot(backend.conv(scores, adjacency), scores)
+        expected_edges = backend.dot(degrees, scores) ** 2 / backend.sum(degrees)
+        return (internal_edges - expected_edges) / backend.sum(degrees)
+
+    def evaluate_many(self, scores: Union[Iterable[GraphSignalData], object]) -> List:
+        if not hasattr(scores, "shape") or len(scores.shape) < 2:
+            scores = [to_signal(self.graph, signal) for signal in scores]
+            if not scores:
+                return list()
+            graph = scores[0].graph
+            scores = backend.combine_cols([signal.np for signal in scores])
+        else:
+            graph = to_signal(self.graph, None).graph
+        if (
+            self._sampled(graph)
+            or graph.number_of_edges() == 0
+            or backend.backend_name() in ["tensorflow", "matvec"]
+        ):
+            # columns are wrapped back into signals, because evaluating them needs their graph
+            return super().evaluate_many(
+                [to_signal(graph, col) for col in backend.separate_cols(scores)]
+            )
+        adjacency = self.preprocessor(graph)
+        degrees = self._degrees(graph, adjacency)
+        scores = scores / self.max_rank
+        internal_edges = backend.sum(scores * backend.conv(scores, adjacency), axis=0)
+        expected_edges = backend.sum(
+            scores * degrees[:, None], axis=0
+        ) ** 2 / backend.sum(degrees)
+        return [
+            float(value)
+            for value in (internal_edges - expected_edges) / backend.sum(degrees)
+        ]
+
+    def _sampled_evaluate(self, scores):
         graph = scores.graph
         positive_candidates = list(graph)
         if len(positive_candidates) > self.max_positive_samples:
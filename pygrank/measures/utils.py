@@ -1,13 +1,15 @@
 import random
+import numpy as np
 import collections.abc
-from pygrank.core import GraphSignal, to_signal, GraphSignalData
+from pygrank.core import backend, GraphSignal, to_signal, to_sparse_signal, GraphSignalData
 from typing import Mapping, Union
-import networkx as nx
+
 
 def split(
     groups: Union[GraphSignalData, Mapping[str, GraphSignalData]],
     training_samples: float = 0.8,
     seed: int = 0,
+    sparse: bool = False,
 ):
     """
     Splits a graph signal, iterable of map of graph signals and iterables into two same-type objects
@@ -22,6 +24,8 @@ def split(
             used for both training and testing. Default is 0.8 to use 80% data for training and the rest 20% for
             testing.
         seed: A sample to introu
+        sparse: Whether to split graph signals into `pygrank.SparseGraphSignal` objects. Default is False to
+            create dense graph signals.
 
     Returns:
         Data with the same organization as the *groups* argument.
@@ -33,7 +37,8 @@ def split(
     if training_samples == 1:
         return groups, groups
     if isinstance(groups, GraphSignal):
-        group = [v for v in groups if groups[v] != 0]
+        sparse_groups = to_sparse_signal(None, groups)
+        group = sparse_groups.node2id.nodes_of(sparse_groups.nonzero_ids).tolist()
         if seed is not None:
             group = sorted(group)
         random.Random(seed).shuffle(group)
@@ -46,8 +51,18 @@ def split(
                 else len(group) + int(training_samples)
             )
         )
-        return to_signal(groups, {v: groups[v] for v in group[:splt]}), to_signal(
-            groups, {v: groups[v] for v in group[splt:]}
+        positions = np.searchsorted(
+            sparse_groups.nonzero_ids, sparse_groups.node2id.ids_of(group)
+        )
+        values = sparse_groups.nonzero_values[positions]
+        training = to_sparse_signal(sparse_groups, (group[:splt], values[:splt]))
+        test = to_sparse_signal(sparse_groups, (group[splt:], values[splt:]))
+        if sparse:
+            return training, test
+        # dense copies of sparse signals are read-only, so copy them into writable arrays
+        return (
+            to_signal(groups, backend.to_array(training.np, copy_array=True)),
+            to_signal(groups, backend.to_array(test.np, copy_array=True)),
         )
     if not isinstance(groups, collections.abc.Mapping):
         group = list(groups)
@@ -67,12 +82,15 @@ def split(
     testing = {}
     training = {}
     for group_id, group in groups.items():
-        training[group_id], testing[group_id] = split(group, training_samples, seed)
+        training[group_id], testing[group_id] = split(
+            group, training_samples, seed, sparse
+        )
     return training, testing
 
 
 def remove_intra_edges(
-    graph: nx.Graph, group: Union[GraphSignalData, Mapping[str, GraphSignalData]]
+    graph: "networkx.Graph",
+    group: Union[GraphSignalData, Mapping[str, GraphSignalData]],
 ):
     if isinstance(group, collections.abc.Mapping):
         for actual_group in group.values():
@@ -316,6 +316,30 @@ def test_hoptuner_autoregression():
     # TODO: add a stricter test once a publication of HopTuner finds best method
 
 
+def test_hoptuner_offset_evaluation():
+    _, G, groups = next(pg.load_datasets_multiple_communities(["bigraph"]))
+    group = groups[0]
+    training, evaluation = pg.split(
+        pg.to_signal(G, {v: 1 for v in group}), training_samples=0.5
+    )
+    parameters = [0.9**i for i in range(10)]
+    offsets = [[offset] for offset in [0, 0.25, 0.5, 1]]
+    for kwargs in [{}, {"tol": 1.0e-3}]:
+        tuner = pg.HopTuner(measure=pg.AUC, tunable_offset=pg.L2, **kwargs)
+        measure = pg.L2(evaluation, training)
+        base = tuner._hop_basis(training, len(parameters))
+        losses = tuner._offset_loss_batch(measure, parameters, base)(offsets)
+        for offset, loss in zip(offsets, losses):
+            # the previous evaluation runs the tuned filter for each offset
+            ranks = tuner._run(training, [param + offset[0] for param in parameters])
+            assert abs(loss + measure.best_direction() * measure(ranks)) < 1.0e-9
+        tuned, _ = tuner._tune(training)
+        tuner._hop_basis = lambda *args: None
+        previous, _ = tuner._tune(training)
+        for weight, previous_weight in zip(tuned.weights, previous.weights):
+            assert abs(float(weight) - float(previous_weight)) < 1.0e-6
+
+
 def test_impulse_tuning():
     _, G, groups = next(pg.load_datasets_multiple_communities(["bigraph"]))
     group = groups[0]
@@ -392,3 +416,78 @@ def test_autotune_backends():
             abs(auc1 - auc2) < 0.005
         )  # different results due to different backend.epsilon()
         assert abs(auc1 - auc3) < 0.005
+
+
+def test_autotune_executor():
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    def booth(p):
+        return (p[0] + 2 * p[1] - 7) ** 2 + (2 * p[0] + p[1] - 5) ** 2
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        p = pg.optimize(
+            loss=booth,
+            max_vals=[10, 10],
+            min_vals=[-10, -10],
+            parameter_tol=1.0e-6,
+            verbose=False,
+            executor=executor,
+        )
+        assert abs(p[0] - 1) < 1.0e-6
+        assert abs(p[1] - 3) < 1.0e-6
+        _, graph, group = next(pg.load_datasets_one_community(["graph9"]))
+        sequential = pg.ParameterTuner(cross_validate=2, verbose=False)
+        sequential.rank(graph, group)
+        concurrent = pg.ParameterTuner(
+            cross_validate=2, verbose=False, executor=executor
+        )
+        concurrent.rank(graph, group)
+        assert sequential.last_params == concurrent.last_params
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(Exception):
+            pg.ParameterTuner(executor=executor)  # tuning losses cannot be pickled
+    optimization = pg.SelfClearDict(2)
+    for key in ["A", "B", "A", "C"]:
+        optimization[key] = key
+    assert list(optimization) == ["A", "C"]
+
+
+def test_optimizer_loss_batch():
+    def beale(p):
+        return (
+            (1.5 - p[0] + p[0] * p[1]) ** 2
+            + (2.25 - p[0] + p[0] * p[1] ** 2) ** 2
+            + (2.625 - p[0] + p[0] * p[1] ** 3) ** 2
+        )
+
+    def beale_batch(candidates):
+        return [beale(p) for p in candidates]
+
+    for optimizer in [pg.optimize, pg.nelder_mead, pg.lbfgsb]:
+        p = optimizer(
+            None,
+            max_vals=[4.5, 4.5],
+            min_vals=[-4.5, -4.5],
+            parameter_tol=1.0e-8,
+            verbose=False,
+            loss_batch=beale_batch,
+        )
+        assert abs(p[0] - 3) < 1.0e-5
+        assert abs(p[1] - 0.5) < 1.0e-5
+
+
+def test_algorithm_selection_halving():
+    _, graph, group = next(pg.load_datasets_one_community(["graph9"]))
+    algorithms = list(pg.create_demo_filters().values())
+    selected = pg.AlgorithmSelection(algorithms).tune(graph, group)
+    halved = pg.AlgorithmSelection(algorithms, halving_iters=1000).tune(graph, group)
+    assert selected is halved
+    cheap = pg.AlgorithmSelection(algorithms, halving_iters=1).tune(graph, group)
+    assert cheap in algorithms
+    assert all(
+        algorithm.convergence.iter_exception is Exception for algorithm in algorithms
+    )
+    with pytest.raises(Exception):
+        pg.AlgorithmSelection(algorithms, halving_iters=0)
+    with pytest.raises(Exception):
+        pg.AlgorithmSelection(algorithms, halving_iters=10, halving_fraction=1)
@@ -1,4 +1,5 @@
 import networkx as nx
+import numpy as np
 
 import pygrank as pg
 import pytest
@@ -11,6 +12,7 @@ def supported_backends():
         "tensorflow",
         "torch_sparse",
         "sparse_dot_mkl",
+        "threaded",
         "numpy",
     ]:
         pg.load_backend(backend)
@@ -79,6 +81,154 @@ def test_fastgraph():
         assert graph.has_edge("Y", "Z")
 
 
+def test_fastgraph_bulk_edges():
+    edges = [("A", "B"), ("B", "C"), ("C", "A"), ("D", "A"), ("A", "B")]
+    for directed in [True, False]:
+        graph = pg.Graph(directed)
+        for u, v in edges:
+            graph.add_edge(u, v)
+        bulk_graph = pg.Graph(directed)
+        bulk_graph.add_edges_from([u for u, _ in edges], [v for _, v in edges])
+        pair_graph = pg.Graph(directed)
+        pair_graph.add_edges_from(edges)
+        for other in [bulk_graph, pair_graph]:
+            assert list(other) == list(graph)
+            assert other.number_of_edges() == graph.number_of_edges()
+            assert (
+                pg.sum(
+                    pg.abs(
+                        other.to_scipy_sparse_array() - graph.to_scipy_sparse_array()
+                    )
+                )
+                == 0
+            )
+        assert bulk_graph.has_edge("D", "A")
+        assert bulk_graph.has_edge("A", "D") != directed
+    with pytest.raises(Exception):
+        pg.Graph().add_edges_from(["A", "B"], ["C"])
+
+
+def test_mapped_graph():
+    import os
+    import inspect
+    import subprocess
+    import sys
+    import tempfile
+    from pygrank.benchmarks.loader import _select_path
+
+    graph = next(pg.load_datasets_graph(["graph9"]))
+    paths = inspect.signature(pg.import_snap_format_dataset).parameters["path"].default
+    pairs = os.path.join(_select_path(paths, "graph9"), "graph9", "pairs.txt")
+    with tempfile.TemporaryDirectory() as path:
+        mapped = pg.snap_pairs_to_mapped(pairs, path, block_size=5)
+        assert list(mapped) == list(graph)
+        assert mapped.number_of_edges() == graph.number_of_edges()
+        assert mapped.neighbors("A") == graph.neighbors("A")
+        assert len(mapped.edge_row) == len(mapped.edge_col) == len(graph.edge_row)
+        assert not mapped.is_directed() and "A" in mapped
+        for normalization in ["col", "symmetric", "both", "laplacian"]:
+            ranker = pg.HeatKernel(normalization=normalization)
+            ranks = ranker.rank(graph, {"A": 1, "B": 1})
+            mapped_ranks = ranker.rank(mapped, {"A": 1, "B": 1})
+            assert pg.sum(pg.abs(ranks.np - mapped_ranks.np)) < pg.epsilon()
+        assert "data_symmetric.npy" in os.listdir(path)
+        assert dict(mapped.degree) == {v: len(graph.neighbors(v)) for v in graph}
+        expected = mapped.to_normalized_scipy_sparse_array("col").toarray()
+        with tempfile.TemporaryDirectory() as cache_path:
+            cached = pg.MappedGraph(path, cache_path)
+            cached.to_normalized_scipy_sparse_array("col")
+            assert "data_col.npy" in os.listdir(cache_path)
+        # a regular file cannot hold the cache, so normalized weights are kept in memory
+        unwritable = pg.MappedGraph(path, os.path.join(path, "nodes.txt", "cache"))
+        normalized = unwritable.to_normalized_scipy_sparse_array("col")
+        assert np.abs(normalized.toarray() - expected).sum() == 0
+        with pytest.raises(Exception):
+            mapped.add_edge("A", "B")
+        del mapped, cached, unwritable, normalized
+    # graphs are normalized out-of-core even when imports load another backend
+    with tempfile.TemporaryDirectory() as path:
+        code = (
+            "import os, sys; import pygrank as pg; "
+            "mapped = pg.snap_pairs_to_mapped(sys.argv[1], sys.argv[2]); "
+            "pg.PageRank().rank(mapped, {'A': 1}); "
+            "print('data_symmetric.npy' in os.listdir(sys.argv[2]))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code, pairs, path],
+            capture_output=True,
+            text=True,
+            env=dict(os.environ, pygrankBackend="threaded"),
+        )
+        assert output.stdout.splitlines()[-1] == "True"
+
+
+def test_dask_backend():
+    import os
+    import inspect
+    import tempfile
+    from pygrank.benchmarks.loader import _select_path
+
+    pytest.importorskip("dask")
+    graph = next(pg.load_datasets_graph(["graph9"]))
+    ranker = pg.PageRank(0.9, max_iters=1000)
+    ranks = ranker.rank(graph, {"A": 1, "B": 1})
+    with pg.Backend("dask"):
+        dask_ranks = ranker.rank(graph, {"A": 1, "B": 1})
+        assert pg.backend_name() == "dask"
+        assert float(pg.sum(pg.abs(ranks.np - dask_ranks.np))) < pg.epsilon() * 10
+        M = pg.preprocessor(normalization="col")(graph)
+        assert float(pg.sum(pg.degrees(M))) == pytest.approx(len(graph))
+        from pygrank.core.backend.dask import RowBlockedMatrix
+
+        matrix = graph.to_scipy_sparse_array()
+        matrix = matrix.multiply(np.arange(1, matrix.shape[0] + 1)[:, None]).tocsr()
+        blocked = RowBlockedMatrix(matrix, block_entries=5)
+        assert len(blocked.blocks) > 1
+        signal = np.arange(len(graph), dtype=float)
+        signals = np.column_stack([signal, signal[::-1]])
+        assert np.allclose(pg.conv(signal, blocked).compute(), signal @ matrix)
+        assert np.allclose(pg.conv(signals, blocked).compute(), matrix.T @ signals)
+        assert pg.conv(signal, blocked).chunks == (blocked.chunks,)  # stays chunked
+        assert np.allclose(
+            pg.degrees(blocked).compute(), np.asarray(matrix.sum(axis=1)).ravel()
+        )
+        # memory-mapped graphs are ranked one block of rows at a time
+        paths = inspect.signature(pg.import_snap_format_dataset).parameters["path"]
+        pairs = os.path.join(
+            _select_path(paths.default, "graph9"), "graph9", "pairs.txt"
+        )
+        with tempfile.TemporaryDirectory() as path:
+            mapped = pg.snap_pairs_to_mapped(pairs, path)
+            mapped_ranks = ranker.rank(mapped, {"A": 1, "B": 1})
+            error = float(pg.sum(pg.abs(ranks.np - mapped_ranks.np)))
+            assert error < pg.epsilon() * 10
+            del mapped
+    assert pg.backend_name() == "numpy"
+
+
+def test_threaded_backend_blocks(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    from pygrank.core.backend import threaded
+
+    graph = next(pg.load_datasets_graph(["graph9"]))
+    ranker = pg.PageRank(0.9, max_iters=1000)
+    ranks = ranker.rank(graph, {"A": 1, "B": 1})
+    monkeypatch.setattr(threaded, "_min_parallel_entries", 0)
+    monkeypatch.setattr(threaded, "_num_threads", 4)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        monkeypatch.setattr(threaded, "_pool", pool)
+        with pg.Backend("threaded"):
+            M = pg.preprocessor(normalization="col")(graph)
+            assert len(M.array.blocks) > 1
+            signal = np.arange(len(graph), dtype=float)
+            signals = np.column_stack([signal, signal[::-1]])
+            matrix = M.array.matrix
+            assert np.allclose(pg.conv(signal, M), signal @ matrix)
+            assert np.allclose(pg.conv(signals, M), matrix.T @ signals)
+            threaded_ranks = ranker.rank(graph, {"A": 1, "B": 1})
+            assert float(pg.sum(pg.abs(ranks.np - threaded_ranks.np))) < pg.epsilon()
+
+
 def test_wrapgraph():
     graph = next(pg.load_datasets_graph(["graph5"], graph_api=nx))
     adj = pg.preprocessor(normalization="none")(graph)
@@ -106,6 +256,130 @@ def test_signal_init():
         assert signal["B"] == 2
 
 
+def test_signal_bulk_init():
+    graph = next(pg.load_datasets_graph(["graph9"]))
+    for _ in supported_backends():
+        expected = pg.to_signal(graph, {"A": 1, "C": 3})
+        for obj in [(["A", "C"], [1, 3]), (np.array(["C", "A"]), np.array([3, 1]))]:
+            assert pg.sum(pg.abs(pg.to_signal(graph, obj) - expected)) == 0
+        assert pg.sum(pg.to_signal(graph, (["A", "C"], 2))) == 4
+        assert pg.sum(pg.to_signal(graph, {"A", "C"})) == 2
+        with pytest.raises(Exception):
+            pg.to_signal(graph, (["A", "C"], [1, 2, 3]))
+        with pytest.raises(KeyError):
+            pg.to_signal(graph, {"missing": 1})
+
+
+def test_sparse_signal():
+    graph = next(pg.load_datasets_graph(["graph9"]))
+    for _ in supported_backends():
+        dense = pg.to_signal(graph, {"A": 1, "C": 3})
+        sparse = pg.to_sparse_signal(graph, {"C": 3, "A": 1})
+        assert sparse.nonzero_ids.tolist() == [0, 2]
+        assert sparse == dense and dense == sparse
+        assert sparse == pg.to_sparse_signal(graph, dense)
+        assert pg.sum(pg.abs(sparse - dense)) == 0
+        assert pg.sum(pg.abs(pg.PageRank()(sparse) - pg.PageRank()(dense))) == 0
+        assert sparse.nonzero_ids.tolist() == [0, 2]  # using signals keeps them sparse
+        assert (sparse * 2)["C"] == 6 and (-sparse)["A"] == -1
+        assert sparse.normalized()["C"] == 0.75
+        sparse["B"] = 2
+        del sparse["A"]
+        assert sparse.nonzero_ids.tolist() == [1, 2] and sparse["A"] == 0
+        sparse.np = sparse.np * 2
+        assert sparse.nonzero_ids is None and sparse["C"] == 6
+        sparse = pg.to_sparse_signal(graph, {"A": 1, "C": 3})
+        if isinstance(sparse.np, np.ndarray):
+            with pytest.raises(ValueError):
+                sparse.np[0] = 5
+            assert sparse.nonzero_ids.tolist() == [0, 2] and sparse["A"] == 1
+        training, test = pg.split(dense, 0.5)
+        assert not isinstance(training, pg.SparseGraphSignal)
+        assert pg.sum(training) + pg.sum(test) == 4
+        if isinstance(training.np, np.ndarray):
+            training["B"] = 1
+            training.np += test.np
+            pg.Normalize("sum", inplace=True)(training)
+            assert abs(pg.sum(training) - 1) < 1.0e-12 and training["B"] == 0.2
+        training, test = pg.split(dense, 0.5, sparse=True)
+        assert isinstance(training, pg.SparseGraphSignal)
+        assert pg.sum(training) + pg.sum(test) == 4
+        values = {"A": 1, "B": 1, "C": 0, "D": 0, "E": 0, "F": 0}
+        sparse = pg.to_sparse_signal(graph, values)
+        assert sparse.nonzero_ids.tolist() == [0, 1]
+        sparse["B"] = 0
+        assert sparse.nonzero_ids.tolist() == [0] and sparse["B"] == 0
+        training, test = pg.split(pg.to_sparse_signal(graph, values), 0.5, sparse=True)
+        dense_training, dense_test = pg.split(pg.to_signal(graph, values), 0.5)
+        assert pg.sum(training) == 1 and pg.sum(test) == 1
+        assert training == dense_training and test == dense_test
+
+
+def test_sparse_signal_as_seeds_and_sensitive():
+    graph = next(pg.load_datasets_graph(["graph9"], graph_api=nx))
+    for _ in supported_backends():
+        dense = pg.to_signal(graph, {"A": 1, "C": 1})
+        sparse = pg.to_sparse_signal(graph, {"A": 1, "C": 1})
+        assert list(sparse.values()) == list(dense.values())
+        algorithm = pg.SeedOversampling(pg.PageRank())
+        assert pg.sum(pg.abs(algorithm(sparse) - algorithm(dense))) < 1.0e-12
+        algorithm = pg.FairWalk(pg.PageRank())
+        assert (
+            pg.sum(
+                pg.abs(
+                    algorithm(graph, {"B": 1}, sensitive=sparse)
+                    - algorithm(graph, {"B": 1}, sensitive=dense)
+                )
+            )
+            < 1.0e-12
+        )
+
+
+def test_signal_top():
+    graph = next(pg.load_datasets_graph(["graph9"]))
+    for _ in supported_backends():
+        signal = pg.to_signal(graph, [0.1, 0.3, 0.2, 0.3, 0, 0.2, 0.2, 0.1, 0])
+        expected = sorted(range(len(graph)), key=lambda i: -float(signal.np[i]))
+        for k in [0, 1, 2, 4, 5, 9, 20]:
+            positions, scores = signal.top(k)
+            assert positions.tolist() == expected[:k]
+            assert [float(score) for score in scores] == [
+                float(signal.np[i]) for i in expected[:k]
+            ]
+        sparse = pg.to_sparse_signal(signal, signal)
+        assert sparse.top(5)[0].tolist() == expected[:5]
+        assert sparse.top(9)[0].tolist() == expected
+        assert signal.node2id.nodes_of(signal.top(2)[0]).tolist() == ["B", "D"]
+
+
+def test_node_index():
+    for graph in [
+        next(pg.load_datasets_graph(["graph9"])),
+        nx.Graph([(5, 3), (3, 10)]),
+        nx.path_graph(4),
+        nx.Graph([("A", (1, 2))]),
+    ]:
+        index = pg.node_index(graph)
+        assert index is pg.to_signal(graph, None).node2id
+        assert index is pg.to_signal(pg.preprocessor()(graph), None).node2id
+        assert list(index) == list(graph)
+        assert len(index) == len(graph)
+        nodes = list(graph)[::-1]
+        ids = index.ids_of(nodes)
+        assert ids.tolist() == [index[node] for node in nodes]
+        assert index.nodes_of(ids).tolist() == nodes
+        with pytest.raises(KeyError):
+            index["missing"]
+        with pytest.raises(KeyError):
+            index.ids_of(["missing"])
+    graph = nx.Graph([(5, 3), (3, 10)])
+    index = pg.node_index(graph)
+    graph.remove_node(5)
+    graph.add_node(5)
+    assert pg.node_index(graph) is not index
+    assert pg.to_signal(graph, {5: 1}).np.tolist() == [0, 0, 1]
+
+
 def test_unimplemented_rank():
     with pytest.raises(Exception):
         pg.NodeRanking().rank(next(pg.load_datasets_graph(["graph9"])))
@@ -145,6 +419,81 @@ def test_signal_np_auto_conversion():
     assert isinstance(signal.np, np.ndarray)
 
 
+def test_backend_dispatch():
+    graph = next(pg.load_datasets_graph(["graph9"]))
+    for _ in supported_backends():
+        M = pg.preprocessor()(graph)  # matrices are converted to each backend
+        signal = pg.to_signal(graph, {"A": 1, "B": 2})
+        # plain primitives, graph signals and keyword arguments are all converted
+        assert float(pg.sum(signal.np)) == float(pg.sum(signal)) == 3
+        assert float(pg.sum(signal, axis=0)) == 3
+        propagated = pg.conv(signal, M)
+        assert isinstance(propagated, pg.GraphSignal)
+        assert propagated.node2id is signal.node2id
+        assert float(pg.sum(pg.abs(pg.conv(signal.np, M) - propagated.np))) == 0
+
+    class Wrapper:
+        pass
+
+    plain, wrapped = Wrapper(), Wrapper()
+    wrapped.array = np.array([1.0, 2.0])
+    assert pg.core.backend._is_plain(plain)
+    assert not pg.core.backend._is_plain(wrapped)  # not cached by type
+
+
+def test_lazy_imports():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; import pygrank as pg; pg.PageRank().rank(pg.Graph(), {}); pg.AUC({}); "
+        "print([mod for mod in ['networkx', 'sklearn', 'scipy.optimize'] if mod in sys.modules])"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+    assert output.stdout.splitlines()[-1] == "[]"
+    code = (
+        "import sys; import pygrank as pg; pg.to_signal; "
+        "print([mod for mod in ['pygrank.measures', 'pygrank.algorithms', 'pygrank.benchmarks'] "
+        "if mod in sys.modules])"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+    assert output.stdout.splitlines()[-1] == "[]"
+    assert pg.PageRank is pg.algorithms.PageRank
+    assert "PageRank" in dir(pg)
+    with pytest.raises(AttributeError):
+        pg.NotAnAlgorithm
+
+
+def test_lazy_import_resolution():
+    import subprocess
+    import sys
+
+    # a new process compares against the star-imports before load_backend rebinds backend operations
+    code = """
+import importlib
+import pygrank as pg
+subpackages = ["core", "measures", "algorithms", "benchmarks", "fastgraph"]
+eager = {name: importlib.import_module("pygrank." + name) for name in subpackages}
+exec("".join("from pygrank." + name + " import *\\n" for name in subpackages), eager)
+exported = [name for name in eager if not name.startswith("_")]
+assert set(exported) <= set(dir(pg))
+print([name for name in exported if getattr(pg, name) is not eager[name]])
+assert pg.supervised is importlib.import_module("pygrank.benchmarks.supervised")
+assert pg.fastgraph is importlib.import_module("pygrank.fastgraph.fastgraph")
+pg.load_backend("numpy")
+assert pg.dot is pg.core.backend.dot
+"""
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+    assert output.returncode == 0, output.stderr
+    assert output.stdout.splitlines()[-1] == "[]"
+
+
 def test_signal_direct_operations():
     for _ in supported_backends():
         graph = nx.DiGraph([(1, 2), (2, 3)])
@@ -50,6 +50,20 @@ def test_pagerank_vs_networkx():
     assert pg.Mabs(test_result)(test_result2) < 2.5 * pg.epsilon()
 
 
+def test_pagerank_without_sparse_kernels():
+    from pygrank.algorithms.filters.abstract import recursive
+
+    graph = next(pg.load_datasets_graph(["graph9"]))
+    assert recursive._sparsetools is not None
+    ranks = pg.PageRank(normalization="col")(graph, {"A": 1})
+    sparsetools, recursive._sparsetools = recursive._sparsetools, None
+    try:
+        fallback_ranks = pg.PageRank(normalization="col")(graph, {"A": 1})
+    finally:
+        recursive._sparsetools = sparsetools
+    assert pg.sum(pg.abs(ranks - fallback_ranks)) < pg.epsilon()
+
+
 def test_prevent_node_lists_as_graphs():
     graph = next(pg.load_datasets_graph(["graph5"]))
     with pytest.raises(Exception):
@@ -258,3 +272,123 @@ def test_optimization_dict():
     optimized = time() - tic
     assert len(optimization) == 20
     assert unoptimized > optimized * 1.5
+
+
+def test_rank_many_vs_rank():
+    graph = next(pg.load_datasets_graph(["graph9"]))
+    personalizations = [{"A": 1, "B": 1}, {"C": 1}, {}, {"I": 2, "E": 1}]
+    for _ in supported_backends():
+        for ranker in [
+            pg.PageRank(0.9, max_iters=1000),
+            pg.PageRank(0.9, use_quotient=False, max_iters=1000),
+            pg.HeatKernel(),
+            pg.GenericGraphFilter([0.5, 0.3, 0.1], coefficient_type="chebyshev"),
+            pg.AbsorbingWalks(0.85, max_iters=1000),
+        ]:
+            many_ranks = ranker.rank_many(graph, personalizations)
+            assert many_ranks.shape[1] == len(personalizations)
+            for col, personalization in enumerate(personalizations):
+                ranks = ranker.rank(graph, personalization)
+                column = pg.to_signal(ranks, many_ranks[:, col])
+                assert pg.Mabs(ranks)(column) < pg.epsilon()
+
+
+def test_pagerank_push_solver():
+    graph = next(pg.load_datasets_graph(["graph9"]))
+    personalization = {"A": 1, "B": 1}
+    for _ in supported_backends():
+        power = pg.PageRank(
+            0.9, normalization="col", use_quotient=False, tol=1.0e-12, max_iters=1000
+        )
+        push = pg.PageRank(
+            0.9, solver="push", normalization="col", use_quotient=False, tol=1.0e-9
+        )
+        power_result = power.rank(graph, personalization)
+        push_result = push.rank(graph, personalization)
+        tolerance = 1.0e-6 + 100 * pg.epsilon()  # float32 backends are less precise
+        assert push.push_error < tolerance
+        assert pg.sum(pg.abs(power_result.np - push_result.np)) < 2 * (
+            push.push_error + tolerance
+        )
+        assert "local push" in push.cite()
+        assert pg.sum(push.rank(graph, {}).np) == 0
+        assert isinstance(push_result, pg.SparseGraphSignal)
+        assert push.rank(graph, personalization) == push_result  # reuses workspaces
+        batch = push.rank_many(graph, [personalization, {"C": 1}])
+        assert pg.sum(pg.abs(batch[:, 0] - push_result.np)) == 0
+    with pytest.raises(Exception):
+        pg.PageRank(solver="unknown")
+    with pytest.warns(UserWarning):
+        pg.PageRank(solver="push").rank(graph, personalization)
+    positional = pg.PageRank(0.9, False)  # positional arguments still follow alpha
+    assert positional.use_quotient is False and positional.solver == "power"
+    with pytest.raises(Exception):
+        pg.PageRank(solver="push").rank(graph, personalization, graph_dropout=0.5)
+
+
+def test_recursive_acceleration():
+    graph = next(pg.load_datasets_graph(["graph9"]))
+    personalization = {"A": 1, "B": 1}
+    for _ in supported_backends():
+        tol = max(1.0e-9, pg.epsilon())  # float32 backends can not converge further
+        tolerance = 1.0e-6 + 100 * pg.epsilon()
+        plain = pg.PageRank(0.99, tol=tol, max_iters=10000)
+        plain_result = plain.rank(graph, personalization)
+        for acceleration in ["aitken", "anderson"]:
+            accelerated = pg.PageRank(
+                0.99, tol=tol, max_iters=10000, acceleration=acceleration
+            )
+            accelerated_result = accelerated.rank(graph, personalization)
+            assert pg.Mabs(plain_result)(accelerated_result) < tolerance
+            assert accelerated.convergence.iteration < plain.convergence.iteration
+            assert accelerated.convergence.accelerations > 0
+            assert "saved by acceleration" in str(accelerated.convergence)
+            # the quotient is preserved
+            assert abs(pg.sum(accelerated_result.np) - 2) < tolerance
+    with pytest.raises(Exception):
+        pg.PageRank(acceleration="unknown")
+    preprocessor = pg.preprocessor(normalization="col")
+    positional = pg.PageRank(0.85, True, False, preprocessor)
+    assert positional.acceleration is None and positional.preprocessor is preprocessor
+
+
+def test_fused_iterations():
+    graph = next(pg.load_datasets_graph(["graph9"]))
+    for _ in supported_backends():
+        for ranker_type in [pg.PageRank, pg.AbsorbingWalks, pg.DijkstraRank]:
+            # redefining _formula makes subclasses fall back to unfused iterations
+            unfused_type = type(
+                "Unfused", (ranker_type,), {"_formula": ranker_type._formula}
+            )
+            fused = ranker_type(preserve_norm=False)
+            unfused = unfused_type(preserve_norm=False)
+            ranks = fused.rank(graph, {"A": 1, "B": 1})
+            expected = pg.to_signal(ranks, pg.copy(ranks.np))
+            assert pg.Mabs(unfused.rank(graph, {"A": 1, "B": 1}))(ranks) < pg.epsilon()
+            assert fused.convergence.iteration == unfused.convergence.iteration
+            fused.rank(graph, {"C": 1})  # does not overwrite previous outcomes
+            assert pg.Mabs(expected)(ranks) == 0
+
+
+def test_hop_basis():
+    graph = next(pg.load_datasets_graph(["graph9"]))
+    personalization = {"A": 1, "B": 1}
+    candidates = [[0.5, 0.3, 0.1], [0.9**n for n in range(6)], [1, 0, 0, 0, 0, 0]]
+    for _ in supported_backends():
+        basis = pg.GenericGraphFilter().hop_basis(graph, personalization, hops=5)
+        many_ranks = basis.rank_many(candidates)
+        assert many_ranks.shape[1] == len(candidates)
+        for col, weights in enumerate(candidates):
+            ranks = pg.GenericGraphFilter(weights, tol=None).rank(
+                graph, personalization
+            )
+            assert pg.Mabs(ranks)(basis.rank(weights)) < pg.epsilon()
+            assert (
+                pg.Mabs(ranks)(pg.to_signal(ranks, many_ranks[:, col])) < pg.epsilon()
+            )
+        with pytest.raises(Exception):
+            basis.rank([0.9] * 7)
+        with pytest.raises(Exception):
+            pg.GenericGraphFilter(coefficient_type="chebyshev").hop_basis(
+                graph, personalization
+            )
@@ -1,3 +1,4 @@
+import numpy as np
 import pygrank as pg
 import pytest
 from .test_core import supported_backends
@@ -48,6 +49,67 @@ def test_auc_ndcg_compliance():
             pg.NDCG(test, exclude=training, k=len(graph) + 1)(scores2)
 
 
+def test_auc_ndcg_batches():
+    _, graph, group = next(pg.load_datasets_one_community(["bigraph"]))
+    training, test = pg.split(group, 0.5)
+    for _ in supported_backends():
+        assert pg.AUC([1, 0, 1, 0])([1, 1, 0, 0]) == 0.5
+        assert pg.AUC([1, 0, 1, 0])([1, 0.5, 0.5, 0]) == 0.875
+        candidates = [pg.PageRank(alpha)(graph, training) for alpha in [0.5, 0.9, 0.99]]
+        for measure in [
+            pg.AUC(test, exclude=training),
+            pg.NDCG(test, exclude=training),
+            pg.NDCG(test, exclude=training, k=5),
+        ]:
+            batched = measure.evaluate_many(candidates)
+            assert len(batched) == len(candidates)
+            for evaluation, scores in zip(batched, candidates):
+                assert abs(evaluation - float(measure(scores))) < 1.0e-6
+
+
+def test_supervised_exclude_cache():
+    _, graph, group = next(pg.load_datasets_one_community(["bigraph"]))
+    training, test = pg.split(group, 0.5)
+    for _ in supported_backends():
+        scores1 = pg.PageRank()(graph, training)
+        scores2 = pg.HeatKernel()(graph, training)
+        measure = pg.AUC(test, exclude=training)
+        assert measure(scores1) == pg.AUC(test, exclude=training)(scores1)
+        assert measure(scores2) == pg.AUC(test, exclude=training)(scores2)
+        measure.exclude = (
+            None  # reassigning exclusions is not affected by previous evaluations
+        )
+        assert measure(scores1) == pg.AUC(test)(scores1)
+        # edits of known scores and exclusions are not hidden by previous evaluations
+        known = pg.to_signal(graph, test)
+        measure = pg.AUC(known, exclude=training)
+        measure(scores1)
+        known.np = 1 - known.np
+        assert measure(scores1) == pg.AUC(known, exclude=training)(scores1)
+        unknown = [node for node in graph if node not in set(test) | set(training)]
+        sparse_known = pg.to_sparse_signal(graph, test)
+        sparse_exclude = pg.to_sparse_signal(graph, training)
+        measure = pg.AUC(sparse_known, exclude=sparse_exclude)
+        measure(scores1)
+        sparse_known[unknown[0]] = 1
+        sparse_exclude[unknown[1]] = 1
+        assert measure(scores1) == pg.AUC(sparse_known, exclude=sparse_exclude)(scores1)
+        known = pg.to_signal(graph, test)
+        measure = pg.AUC(known, exclude=sparse_exclude)
+        measure(scores1)
+        if isinstance(known.np, np.ndarray):
+            # assigning back in-place edited arrays and assigning items are also not hidden
+            known.np[0] = 1 - known.np[0]
+            known.np = known.np
+            assert measure(scores1) == pg.AUC(known, exclude=sparse_exclude)(scores1)
+            known[unknown[2]] = 1
+            assert measure(scores1) == pg.AUC(known, exclude=sparse_exclude)(scores1)
+        original = pg.sum(scores1)
+        # normalizing evaluated scores does not alter them
+        pg.KLDivergence(test, exclude=training)(scores1)
+        assert pg.sum(scores1) == original
+
+
 def test_edge_cases():
     assert pg.pRule([0])([0]) == 0
     assert pg.Cos([0])([0]) == 0
@@ -142,6 +204,115 @@ def test_computations():
         )
 
 
+def test_modularity():
+    graph = next(pg.load_datasets_graph(["graph9"]))
+    for _ in supported_backends():
+        ranks = pg.Normalize(pg.PageRank())(graph, {"A": 1})
+        other = pg.Normalize(pg.HeatKernel())(graph, {"A": 1})
+        exact = float(pg.Modularity()(ranks))
+        sampled = float(pg.Modularity(max_positive_samples=len(graph) - 1)(ranks))
+        assert exact > 0
+        assert exact != sampled
+        # sampling all nodes visits every node pair one by one
+        all_pairs = pg.Modularity(max_positive_samples=len(graph))._sampled_evaluate(
+            ranks
+        )
+        assert abs(exact - float(all_pairs)) < 1.0e-6
+        batched = pg.Modularity(graph).evaluate_many([ranks, other])
+        assert abs(batched[0] - exact) < 1.0e-6
+        assert abs(batched[1] - float(pg.Modularity()(other))) < 1.0e-6
+        sampled_many = pg.Modularity(
+            max_positive_samples=len(graph) - 1
+        ).evaluate_many([ranks, other])
+        assert abs(float(sampled_many[0]) - sampled) < 1.0e-6
+    import networkx as nx
+
+    directed = nx.DiGraph([("A", "B"), ("B", "C"), ("C", "A"), ("C", "D")])
+    ranks = pg.to_signal(directed, [1.0, 0.5, 0.2, 0.1])
+    exact = float(pg.Modularity()(ranks))
+    all_pairs = pg.Modularity(max_positive_samples=4)._sampled_evaluate(ranks)
+    assert abs(exact - float(all_pairs)) < 1.0e-6
+
+
+def test_clustering_coefficient():
+    from pygrank.measures.multigroup.clustering_coefficient import _cos_similarity
+
+    _, graph, groups = next(pg.load_datasets_multiple_communities(["graph9"]))
+    for _ in supported_backends():
+        scores = {
+            group: pg.PageRank()(graph, {v: 1 for v in list(members)[:2]})
+            for group, members in groups.items()
+        }
+        for samples in [None, 5]:
+            exact = pg.ClusteringCoefficient(graph, max_positive_samples=samples)(
+                scores
+            )
+            pairs = pg.ClusteringCoefficient(
+                graph, _cos_similarity, max_positive_samples=samples
+            )(scores)
+            chunked = pg.ClusteringCoefficient(
+                graph, max_positive_samples=samples, chunk_size=3
+            )(scores)
+            assert abs(exact - pairs) < 1.0e-6
+            assert abs(exact - chunked) < 1.0e-6
+
+
+def test_link_assessment():
+    from pygrank.measures.multigroup.clustering_coefficient import _dot_similarity
+
+    _, graph, groups = next(pg.load_datasets_multiple_communities(["graph9"]))
+    for _ in supported_backends():
+        scores = {
+            group: pg.PageRank()(graph, {v: 1 for v in list(members)[:2]})
+            for group, members in groups.items()
+        }
+        for hops in [1, 2]:
+            vectorized = pg.LinkAssessment(
+                graph, similarity="dot", hops=hops, max_positive_samples=5
+            )(scores)
+            pairs = pg.LinkAssessment(
+                graph, similarity=_dot_similarity, hops=hops, max_positive_samples=5
+            )(scores)
+            assert float(vectorized) == float(pairs)
+
+
+def test_link_assessment_ties():
+    import networkx as nx
+    import numpy as np
+    from pygrank.measures.multigroup.clustering_coefficient import (
+        _cos_similarity,
+        _dot_similarity,
+    )
+
+    graph = nx.barabasi_albert_graph(300, 3, seed=1)
+    # few distinct score values create many tied similarities
+    random = np.random.default_rng(0)
+    scores = {
+        group: {v: float(random.integers(0, 3)) / 3 for v in graph}
+        for group in range(3)
+    }
+    for similarity, pair_similarity, hops in [
+        ("cos", _cos_similarity, 1),
+        ("dot", _dot_similarity, 1),
+        ("cos", _cos_similarity, 3),
+    ]:
+        vectorized = pg.LinkAssessment(
+            graph,
+            similarity=similarity,
+            hops=hops,
+            max_positive_samples=50,
+            max_negative_samples=50,
+        )(scores)
+        pairs = pg.LinkAssessment(
+            graph,
+            similarity=pair_similarity,
+            hops=hops,
+            max_positive_samples=50,
+            max_negative_samples=50,
+        )(scores)
+        assert float(vectorized) == float(pairs)
+
+
 def test_aggregated():
     y1 = [1, 1, 0]
     y2 = [1, 0, 0]
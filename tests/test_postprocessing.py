@@ -163,9 +163,31 @@ def test_transform():
         r1 = pg.Normalize(pg.PageRank(), "sum").rank(graph)
         r2 = pg.Transformer(pg.PageRank(), lambda x: x / pg.sum(x)).rank(graph)
         assert pg.Mabs(r1)(r2) < pg.epsilon()
-        r1 = pg.Transformer(math.exp).transform(pg.PageRank()(graph))
+        r1 = pg.Transformer(pg.exp).transform(pg.PageRank()(graph))
         r2 = pg.Transformer(pg.PageRank(), pg.exp).rank(graph)
         assert pg.Mabs(r1)(r2) < pg.epsilon() * 2.5
+        with pytest.raises(Exception):
+            pg.Transformer(math.exp).transform(pg.PageRank()(graph))
+
+
+def test_inplace_postprocessing():
+    graph = next(pg.load_datasets_graph(["graph9"]))
+    for _ in supported_backends():
+        for postprocessor, inplace in [
+            (pg.Normalize("range"), pg.Normalize("range", inplace=True)),
+            (pg.Normalize("sum"), pg.Normalize("sum", inplace=True)),
+            (pg.Transformer(pg.log), pg.Transformer(pg.log, inplace=True)),
+            (pg.Threshold(0.1), pg.Threshold(0.1, inplace=True)),
+            (pg.Threshold("gap"), pg.Threshold("gap", inplace=True)),
+        ]:
+            ranks = pg.PageRank()(graph)
+            expected = postprocessor(ranks)
+            assert expected is not ranks
+            assert inplace(ranks) is ranks
+            assert pg.Mabs(expected)(ranks) < pg.epsilon()
+        seeds = pg.to_sparse_signal(graph, {"A": 2, "C": 4})
+        normalized = pg.Normalize("max", inplace=True).transform(seeds)
+        assert normalized["A"] == 0.5 and normalized["C"] == 1
 
 
 def test_ordinals():
@@ -1,3 +1,4 @@
+import networkx as nx
 import pytest
 import pygrank as pg
 from .test_core import supported_backends
@@ -53,3 +54,48 @@ def test_preprocessor():
         pre.clear_hashed()
         res2 = pre(graph)
         assert id(res1) != id(res2)
+
+
+def test_preprocessor_disk_cache():
+    import tempfile
+    import os
+
+    for _ in supported_backends():
+        graph = next(pg.load_datasets_graph(["graph9"]))
+        with tempfile.TemporaryDirectory() as cache_dir:
+            uncached = pg.PageRank(normalization="symmetric").rank(graph, {"A": 1})
+            ranks1 = pg.PageRank(normalization="symmetric", cache_dir=cache_dir).rank(
+                graph, {"A": 1}
+            )
+            assert len(os.listdir(cache_dir)) == 1
+            ranks2 = pg.PageRank(normalization="symmetric", cache_dir=cache_dir).rank(
+                graph, {"A": 1}
+            )
+            assert len(os.listdir(cache_dir)) == 1
+            pg.PageRank(normalization="col", cache_dir=cache_dir).rank(graph, {"A": 1})
+            assert len(os.listdir(cache_dir)) == 2
+            assert pg.Mabs(uncached)(ranks1) < pg.epsilon()
+            assert pg.Mabs(uncached)(ranks2) < pg.epsilon()
+            with pytest.raises(Exception):
+                pg.preprocessor(normalization=lambda M: M, cache_dir=cache_dir)(graph)
+            keyed = pg.preprocessor(
+                normalization="symmetric", cache_dir=cache_dir, cache_key="graph9"
+            )
+            ranks3 = pg.PageRank(preprocessor=keyed).rank(graph, {"A": 1})
+            assert len(os.listdir(cache_dir)) == 3
+            assert pg.Mabs(uncached)(ranks3) < pg.epsilon()
+            nx_graph = next(pg.load_datasets_graph(["graph9"], graph_api=nx))
+            for _ in range(2):
+                ranks4 = pg.PageRank(
+                    normalization="symmetric", cache_dir=cache_dir
+                ).rank(nx_graph, {"A": 1})
+                assert len(os.listdir(cache_dir)) == 4
+                assert pg.Mabs(uncached.np)(ranks4.np) < pg.epsilon()
+            with pg.Backend("numpy"):
+                for tested_graph in [graph, nx_graph]:
+                    uncached = pg.preprocessor(normalization="both")(tested_graph)
+                    for _ in range(2):  # cache miss and hit
+                        cached = pg.preprocessor(
+                            normalization="both", cache_dir=cache_dir
+                        )(tested_graph)
+                        assert type(cached.array) is type(uncached.array)